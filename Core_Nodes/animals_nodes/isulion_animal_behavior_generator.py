@@ -1,17 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_AnimalBehaviorGenerator:
-    behaviors = [
-        'Hunting', 'Sleeping', 'Playing', 'Flying', 'Swimming', 'Running',
-        'Walking', 'Eating', 'Drinking', 'Grooming', 'Nesting', 'Perching',
-        'Climbing', 'Jumping', 'Diving', 'Stalking', 'Resting', 'Foraging',
-        'Grazing', 'Prowling', 'Pouncing', 'Soaring', 'Gliding', 'Hovering',
-        'Fishing', 'Basking', 'Burrowing', 'Hibernating', 'Migrating',
-        'Mating', 'Nurturing', 'Teaching', 'Fighting', 'Defending',
-        'Exploring', 'Hiding', 'Camouflaging', 'Gathering', 'Building',
-        'Communicating'
-    ]
+    behaviors = get_vocabulary("node_animal_behaviors")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -19,7 +11,7 @@ class Isulion_AnimalBehaviorGenerator:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "behavior": (cls.behaviors,)
+                "behavior": (list(cls.behaviors),)
             }
         }
 
@@ -30,13 +22,10 @@ class Isulion_AnimalBehaviorGenerator:
 
     def generate_behavior(self, randomize, seed, behavior):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "behavior")
 
-            behavior = random.choice(self.behaviors)
+            behavior = rng.choice(self.behaviors, 0)
 
         return (f"{behavior}", seed)
 
@@ -1,10 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_AnimalRandom:
-    animals = [
-    'Dog','Cat','Horse','Cow','Chicken','Pig','Sheep','Goat','Lion','Tiger','Elephant','Bear','Wolf','Fox','Deer','Rabbit','Kangaroo','Giraffe','Zebra','Monkey','Chimpanzee','Gorilla','Orangutan','Panda','Koala','Hippopotamus','Rhinoceros','Crocodile','Alligator','Eagle','Hawk','Falcon','Owl','Penguin','Dolphin','Whale','Shark','Octopus','Squid','Jellyfish','Crab','Lobster','Clownfish','Sea Turtle','Frog','Toad','Snake','Lizard','Gecko','Tortoise','Camel','Donkey','Bat','Rat','Mouse','Squirrel','Chipmunk','Porcupine','Hedgehog','Skunk','Raccoon','Otter','Seal','Walrus','Polar Bear','Grizzly Bear','Cheetah','Leopard','Jaguar','Antelope','Buffalo','Bison','Moose','Reindeer','Mole','Platypus','Echidna','Parrot','Peacock','Swan','Duck','Goose','Turkey','Flamingo','Pelican','Seagull','Sparrow','Pigeon','Crow','Magpie','Woodpecker','Hummingbird','Butterfly','Bee','Ant','Spider','Scorpion','Worm','Snail','Slug'
-    ]
+    animals = get_vocabulary("node_animals")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -12,7 +11,7 @@ class Isulion_AnimalRandom:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "animal": (cls.animals,)
+                "animal": (list(cls.animals),)
             }
         }
 
@@ -23,15 +22,11 @@ class Isulion_AnimalRandom:
 
     def random_animal(self, randomize, seed, animal):
         if randomize == "enable":
-            # Set seed for reproducibility if provided
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "animal")
 
             # Randomly select from predefined lists
-            animal = random.choice(self.animals)
+            animal = rng.choice(self.animals, 0)
 
         return (f"{animal}", seed)  # Return both the animal name and the seed
 
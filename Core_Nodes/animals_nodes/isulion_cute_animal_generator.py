@@ -1,10 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionCuteAnimalRandom:
-    animals = [
-		'Red Panda','Koala','Fennec Fox','Pygmy Marmoset','Quokka','Sea Otter','Harp Seal Pup','Panda Cub','Penguin Chick','Hedgehog','Axolotl','Sloth','Rabbit','Kitten','Puppy','Meerkat','Sugar Glider','Chinchilla','Slow Loris','Hamster','Red Fox Kit','Lamb','Piglet','Duckling','Pygmy Hippo','Baby Giraffe','Baby Alpaca','Otter Pup','Corgi Puppy','Golden Retriever Puppy','Seal Pup','Snow Leopard Cub','Tiger Cub','Lion Cub','Baby Gorilla','Baby Orangutan','Pygmy Goat','Fawn (Baby Deer)','Ferret','Platypus','Kangaroo Joey','Wallaby','Dik-Dik','Serval Kitten','Caracal Kitten','Clouded Leopard Cub','Red Squirrel','Chipmunk','Prairie Dog','Arctic Fox','Polar Bear Cub','Bottlenose Dolphin Calf','Beluga Whale Calf','Manatee Calf','Baby Skunk','Raccoon Kit','Baby Opossum','Baby Echidna (Puggle)','Baby Tapir','GiantPanda Cub','Baby Hippo','Baby Rhino','Baby Zebra','Baby Elephant Seal','Baby Wombat','Baby Emu','Baby Kiwi Bird','Baby Flamingo','Cygnet (Baby Swan)','Baby Tortoise','Baby Alligator','Baby Crocodile','Baby Chameleon','Baby Iguana','Baby Frog','Baby Toad','Baby Gecko','Ring-tailed Lemur','Sifaka Lemur','Mouse Lemur','Bush Baby','PygmyPossum','Baby Mole','Baby Bat','Leveret (Baby Hare)','Baby Mole Rat','Baby Porcupine','Baby Badger','Pygmy Rabbit','Baby Seal','Baby Puffin','Owlet (Baby Owl)','Hoglet(Baby Hedgehog)','Baby Armadillo','Baby Pangolin','Baby Okapi','Baby Cheetah','Baby Ocelot','Baby Lynx','Baby Tasmanian Devil'
-    ]
+    animals = get_vocabulary("node_cute_animals")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -12,7 +11,7 @@ class IsulionCuteAnimalRandom:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "animal": (cls.animals,)
+                "animal": (list(cls.animals),)
             }
         }
 
@@ -23,14 +22,10 @@ class IsulionCuteAnimalRandom:
 
     def random_animal(self, randomize, seed, animal):
         if randomize == "enable":
-            # Set seed for reproducibility if provided
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "cute_animal")
 
             # Randomly select from predefined lists
-            animal = random.choice(self.animals)
+            animal = rng.choice(self.animals, 0)
 
         return (f"{animal}", seed)  # Return both the animal name and the seed
@@ -0,0 +1,66 @@
+import os
+from typing import Optional
+
+from .env_utils import env_float
+
+
+def get_cache_dir(name: str) -> str:
+    """Return (and create) the on-disk cache directory for a cache namespace.
+
+    The root defaults to ``~/.cache/isulion`` and can be moved with the
+    ``ISULION_CACHE_DIR`` environment variable.
+    """
+    root = os.getenv("ISULION_CACHE_DIR") or os.path.join(
+        os.path.expanduser("~"), ".cache", "isulion"
+    )
+    path = os.path.join(root, name)
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def get_cache_limit_bytes(env_var: str, default_mb: int) -> int:
+    """Read a cache size limit in megabytes from the environment."""
+    return int(env_float(env_var, default_mb) * 1024 * 1024)
+
+
+def touch(path: str):
+    """Mark a cache file as recently used."""
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+
+
+def prune_directory(directory: str, max_bytes: int, suffix: Optional[str] = None) -> int:
+    """Evict least recently used files until the directory fits in ``max_bytes``.
+
+    Recency is tracked through the file modification time, which cache readers
+    refresh with :func:`touch` on every hit. Returns the remaining size in bytes.
+    """
+    entries = []
+    total = 0
+    for root, _, files in os.walk(directory):
+        for filename in files:
+            if suffix and not filename.endswith(suffix):
+                continue
+            path = os.path.join(root, filename)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+
+    if total <= max_bytes:
+        return total
+
+    entries.sort()
+    for _, size, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+        total -= size
+        if total <= max_bytes:
+            break
+    return total
@@ -1,44 +1,36 @@
-import random
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import resolve_seed
+from ..sampling import MAX_COUNT, SAMPLING_MODES, sample_items
 
 class IsulionEpochGenerator:
-    epochs = [
-        "Ancient Egypt", "Ancient Greece", "Roman Empire", "Middle Ages", 
-        "Renaissance", "Industrial Revolution", "Victorian Era", "Roaring Twenties",
-        "Modern Era", "Digital Age", "Bronze Age", "Iron Age", "Stone Age",
-        "Byzantine Empire", "Ming Dynasty", "Edo Period", "Colonial Period",
-        "Belle Époque", "Art Deco Period", "Space Age", "Information Age",
-        "Medieval Japan", "Viking Age", "Golden Age of Piracy", "Wild West",
-        "Prehistoric Times", "Age of Enlightenment", "Age of Exploration",
-        "Classical Antiquity", "Dark Ages", "Age of Discovery",
-        "Baroque Period", "Gothic Era", "Romantic Period", "Jazz Age",
-        "Post-Modern Era", "Cyberpunk Future", "Steampunk Era"
-    ]
+    epochs = get_vocabulary("node_epochs")
 
     @classmethod
     def INPUT_TYPES(s):
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "epoch": (s.epochs,),
+                "epoch": (list(s.epochs),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
+                "count": ("INT", {"default": 1, "min": 1, "max": MAX_COUNT}),
+                "sampling": (SAMPLING_MODES, {"default": "with replacement"}),
             }
         }
     
     RETURN_TYPES = ("STRING", "INT",)
     RETURN_NAMES = ("epoch", "seed",)
+    OUTPUT_IS_LIST = (True, False,)
     FUNCTION = "generate"
     CATEGORY = "Isulion/Character"
 
-    def generate(self, randomize, epoch, seed=0):
+    def generate(self, randomize, epoch, seed=0, count=1, sampling="with replacement"):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
             
-            epoch = random.choice(self.epochs)
+            values = sample_items(self.epochs, count, seed, sampling, "epoch")
+        else:
+            values = [epoch] * count
         
-        return (epoch, seed)
+        return (values, seed)
@@ -1,25 +1,15 @@
-import random
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionFantasyRaceGenerator:
-    races = [
-        "elf", "dwarf", "orc", "halfling", "gnome", "fairy",
-        "dragon-born", "tiefling", "angel", "demon", "merfolk",
-        "centaur", "satyr", "nymph", "giant", "goblin",
-        "vampire", "werewolf", "phoenix", "unicorn", "griffin",
-        "minotaur", "harpy", "mermaid", "siren", "dryad",
-        "elemental", "golem", "chimera", "sphinx", "pegasus",
-        "troll", "ogre", "pixie", "sprite", "banshee",
-        "wraith", "ghost", "lich", "djinn", "ifrit",
-        "sylph", "undine", "kitsune", "tanuki", "yokai",
-        "wendigo", "skinwalker", "changeling", "doppelganger", "shapeshifter"
-    ]
+    races = get_vocabulary("node_races")
 
     @classmethod
     def INPUT_TYPES(s):
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "race": (s.races,),
+                "race": (list(s.races),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
@@ -33,12 +23,9 @@ class IsulionFantasyRaceGenerator:
 
     def generate(self, randomize, race, seed=0):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "race")
             
-            race = random.choice(self.races)
+            race = rng.choice(self.races, 0)
         
         return (race, seed) 
\ No newline at end of file
@@ -1,42 +1,36 @@
-import random
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import resolve_seed
+from ..sampling import MAX_COUNT, SAMPLING_MODES, sample_items
 
 class IsulionProfessionGenerator:
-    professions = [
-        "chef", "wizard", "warrior", "merchant", "scholar", "artist",
-        "blacksmith", "alchemist", "hunter", "healer", "guard", "noble",
-        "farmer", "sailor", "explorer", "musician", "dancer", "priest",
-        "actor", "tour guide", "florist", "cake decorator", "zookeeper",
-        "ski instructor", "software developer", "nurse practitioner", "doctor",
-        "physician", "information security analyst", "truck driver", "teacher",
-        "firefighter", "police officer", "lawyer", "engineer", "pilot",
-        "astronaut", "archaeologist", "detective", "librarian", "architect"
-    ]
+    professions = get_vocabulary("node_professions")
 
     @classmethod
     def INPUT_TYPES(s):
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "profession": (s.professions,),
+                "profession": (list(s.professions),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
+                "count": ("INT", {"default": 1, "min": 1, "max": MAX_COUNT}),
+                "sampling": (SAMPLING_MODES, {"default": "with replacement"}),
             }
         }
     
     RETURN_TYPES = ("STRING", "INT",)
     RETURN_NAMES = ("profession", "seed",)
+    OUTPUT_IS_LIST = (True, False,)
     FUNCTION = "generate"
     CATEGORY = "Isulion/Character"
 
-    def generate(self, randomize, profession, seed=0):
+    def generate(self, randomize, profession, seed=0, count=1, sampling="with replacement"):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
             
-            profession = random.choice(self.professions)
+            values = sample_items(self.professions, count, seed, sampling, "profession")
+        else:
+            values = [profession] * count
         
-        return (profession, seed) 
\ No newline at end of file
+        return (values, seed)
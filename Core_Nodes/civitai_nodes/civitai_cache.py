@@ -0,0 +1,357 @@
+"""
+Persistent response cache for the Civitai API.
+
+Responses are stored in a SQLite database under the Isulion cache directory
+(``<cache root>/civitai/responses.sqlite3``) and shared by every node and
+ComfyUI execution. Entries are keyed on the endpoint, the normalized query
+parameters and a hash of the API token, and expire after a per-endpoint TTL.
+
+Expired entries are revalidated with ``If-None-Match`` / ``If-Modified-Since``
+so an unchanged result only costs a 304. Within the stale window an expired
+entry is served immediately and refreshed in the background
+(stale-while-revalidate). The database is capped by
+``ISULION_CIVITAI_CACHE_MB`` (default 64) with least recently used eviction.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Dict, NamedTuple, Optional
+
+import requests
+
+from .. import http_client
+from ..cache_utils import get_cache_dir, get_cache_limit_bytes
+from ..isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_API_BASE = "https://civitai.com/api/v1"
+
+# Seconds a response is considered fresh, per API endpoint
+DEFAULT_TTLS = {
+    "models": 3600,
+    "images": 300,
+}
+FALLBACK_TTL = 600
+# Seconds past expiry during which a stale entry is served while it is refreshed
+STALE_WINDOW = 24 * 3600
+
+# Background refreshes and prefetches share a small pool so a busy graph cannot
+# flood the API; requests beyond MAX_PENDING are dropped rather than queued
+BACKGROUND_WORKERS = 2
+MAX_PENDING = 16
+
+
+def get_api_base() -> str:
+    """Return the Civitai API base URL.
+
+    Set ``CIVITAI_API_BASE`` to point the nodes at another server, e.g. the
+    local stub in ``civitai_nodes/stub`` for offline benchmarks.
+    """
+    return (os.getenv("CIVITAI_API_BASE") or DEFAULT_API_BASE).rstrip("/")
+
+
+class CachedResponse(NamedTuple):
+    """A cached API response and the validators needed to revalidate it."""
+    data: Any
+    etag: Optional[str]
+    last_modified: Optional[str]
+    fetched_at: float
+
+
+def _normalize_value(value) -> str:
+    if isinstance(value, (list, tuple)):
+        return ",".join(str(v) for v in value)
+    if isinstance(value, bool):
+        return "true" if value else "false"
+    return str(value)
+
+
+def normalize_params(params: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Drop empty parameters and stringify the rest so equal queries share a key."""
+    if not params:
+        return {}
+    return {
+        key: _normalize_value(value)
+        for key, value in sorted(params.items())
+        if value is not None
+    }
+
+
+def make_key(url: str, params: Optional[Dict[str, Any]] = None, api_key: Optional[str] = None) -> str:
+    """Build the cache key of a request.
+
+    The token is hashed into the key because results depend on the account
+    (NSFW settings, private models), but it is never stored in clear.
+    """
+    token_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] if api_key else ""
+    raw = json.dumps([url, normalize_params(params), token_hash], separators=(",", ":"))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def endpoint_of(url: str) -> str:
+    """Return the API endpoint name of a URL, e.g. ``models`` or ``images``."""
+    return url.rstrip("/").rsplit("/", 1)[-1]
+
+
+class CivitaiResponseCache:
+    """SQLite-backed store of Civitai API responses with LRU eviction."""
+
+    def __init__(self, path: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.path = path or os.path.join(get_cache_dir("civitai"), "responses.sqlite3")
+        self.max_bytes = max_bytes or get_cache_limit_bytes("ISULION_CIVITAI_CACHE_MB", 64)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS responses (
+                key TEXT PRIMARY KEY,
+                endpoint TEXT NOT NULL,
+                body TEXT NOT NULL,
+                etag TEXT,
+                last_modified TEXT,
+                fetched_at REAL NOT NULL,
+                accessed_at REAL NOT NULL,
+                size INTEGER NOT NULL
+            )
+            """
+        )
+        self._conn.execute("CREATE INDEX IF NOT EXISTS responses_accessed ON responses (accessed_at)")
+
+    def get(self, key: str) -> Optional[CachedResponse]:
+        """Return the cached response for a key and mark it as recently used."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body, etag, last_modified, fetched_at FROM responses WHERE key = ?",
+                (key,),
+            ).fetchone()
+            if row is None:
+                return None
+            self._conn.execute(
+                "UPDATE responses SET accessed_at = ? WHERE key = ?", (time.time(), key)
+            )
+        body, etag, last_modified, fetched_at = row
+        try:
+            data = json.loads(body)
+        except ValueError:
+            return None
+        return CachedResponse(data, etag, last_modified, fetched_at)
+
+    def put(self, key: str, endpoint: str, data: Any,
+            etag: Optional[str] = None, last_modified: Optional[str] = None):
+        """Store a response body and evict old entries if over budget."""
+        body = json.dumps(data, separators=(",", ":"))
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses "
+                "(key, endpoint, body, etag, last_modified, fetched_at, accessed_at, size) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                (key, endpoint, body, etag, last_modified, now, now, len(body)),
+            )
+            self._evict()
+
+    def mark_fresh(self, key: str):
+        """Reset the age of an entry after a 304 Not Modified."""
+        now = time.time()
+        with self._lock:
+            self._conn.execute(
+                "UPDATE responses SET fetched_at = ?, accessed_at = ? WHERE key = ?",
+                (now, now, key),
+            )
+
+    def clear(self):
+        with self._lock:
+            self._conn.execute("DELETE FROM responses")
+
+    def _evict(self):
+        # Caller holds the lock
+        total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM responses").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        # Evict below the limit so eviction is not triggered on every put
+        target = int(self.max_bytes * 0.9)
+        rows = self._conn.execute("SELECT key, size FROM responses ORDER BY accessed_at").fetchall()
+        evicted = []
+        for key, size in rows:
+            if total <= target:
+                break
+            evicted.append((key,))
+            total -= size
+        self._conn.executemany("DELETE FROM responses WHERE key = ?", evicted)
+
+
+_default_cache = None
+_default_cache_lock = threading.Lock()
+_executor = None
+_in_flight: Dict[str, Future] = {}
+_in_flight_lock = threading.Lock()
+
+
+def get_response_cache() -> CivitaiResponseCache:
+    """Return the process-wide response cache."""
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                _default_cache = CivitaiResponseCache()
+    return _default_cache
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _default_cache_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(
+                    max_workers=BACKGROUND_WORKERS, thread_name_prefix="civitai-cache"
+                )
+    return _executor
+
+
+def submit_background(key: str, fn, *args, **kwargs) -> Optional[Future]:
+    """Run ``fn`` in the background, sharing the task already running for ``key``.
+
+    Returns the task's future, or None if too many tasks are pending.
+    """
+    with _in_flight_lock:
+        future = _in_flight.get(key)
+        if future is not None:
+            return future
+        if len(_in_flight) >= MAX_PENDING:
+            logger.debug("Background Civitai queue full, skipping %s", key)
+            return None
+        future = _get_executor().submit(fn, *args, **kwargs)
+        _in_flight[key] = future
+
+    def done(finished: Future):
+        with _in_flight_lock:
+            if _in_flight.get(key) is finished:
+                del _in_flight[key]
+        if not finished.cancelled() and finished.exception() is not None:
+            logger.debug("Background Civitai request failed: %s", finished.exception())
+
+    future.add_done_callback(done)
+    return future
+
+
+def _pending(key: str) -> Optional[Future]:
+    with _in_flight_lock:
+        return _in_flight.get(key)
+
+
+def _fetch(url: str, params, headers, api_key: Optional[str], key: str,
+           cached: Optional[CachedResponse]):
+    """Fetch from the API, revalidating ``cached`` if given, and update the cache."""
+    cache = get_response_cache()
+    request_headers = dict(headers or {})
+    if cached is not None:
+        if cached.etag:
+            request_headers["If-None-Match"] = cached.etag
+        if cached.last_modified:
+            request_headers["If-Modified-Since"] = cached.last_modified
+
+    response = http_client.get(
+        url, params=params, headers=request_headers, rate_limited=True, api_key=api_key
+    )
+    if response.status_code == 304 and cached is not None:
+        cache.mark_fresh(key)
+        return cached.data
+
+    response.raise_for_status()
+    data = response.json()
+    cache.put(
+        key,
+        endpoint_of(url),
+        data,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+    )
+    return data
+
+
+def _can_serve_stale(error: requests.RequestException) -> bool:
+    """Serve stale data on outages and throttling, but not on auth or request errors."""
+    response = getattr(error, "response", None)
+    if response is None:
+        return True
+    return response.status_code == 429 or response.status_code >= 500
+
+
+def fetch_json(url: str, params: Optional[Dict[str, Any]] = None,
+               headers: Optional[Dict[str, str]] = None, api_key: Optional[str] = None,
+               ttl: Optional[float] = None, stale_while_revalidate: bool = True) -> Any:
+    """
+    GET a Civitai API URL and return the decoded JSON, going through the cache.
+
+    Args:
+        url: Full API URL, e.g. ``https://civitai.com/api/v1/models``
+        params: Query parameters
+        headers: Request headers (including the Authorization header)
+        api_key: Token used for the request, only hashed into the cache key
+        ttl: Freshness lifetime in seconds, defaults to the endpoint's TTL
+        stale_while_revalidate: Serve expired entries within the stale window
+            immediately and refresh them in the background
+
+    Raises:
+        requests.RequestException: When the API cannot be reached and no
+            usable cached response exists
+    """
+    params = normalize_params(params)
+    if ttl is None:
+        ttl = DEFAULT_TTLS.get(endpoint_of(url), FALLBACK_TTL)
+    key = make_key(url, params, api_key)
+    cached = get_response_cache().get(key)
+
+    if cached is not None:
+        age = time.time() - cached.fetched_at
+        if age < ttl:
+            logger.debug("Civitai cache hit for %s (age %.0fs)", url, age)
+            return cached.data
+        if stale_while_revalidate and age < ttl + STALE_WINDOW:
+            logger.debug("Serving stale Civitai response for %s, revalidating", url)
+            submit_background(key, _fetch, url, params, headers, api_key, key, cached)
+            return cached.data
+
+    # Join a prefetch or revalidation of the same request instead of duplicating it
+    pending = _pending(key)
+    if pending is not None:
+        try:
+            return pending.result()
+        except Exception:
+            pass
+
+    try:
+        return _fetch(url, params, headers, api_key, key, cached)
+    except requests.RequestException as e:
+        if cached is None or not _can_serve_stale(e):
+            raise
+        logger.warning("Civitai request failed (%s), serving cached response", e)
+        return cached.data
+
+
+def prefetch(url: str, params: Optional[Dict[str, Any]] = None,
+             headers: Optional[Dict[str, str]] = None, api_key: Optional[str] = None,
+             ttl: Optional[float] = None) -> Optional[Future]:
+    """
+    Warm the cache for a request in the background.
+
+    A later :func:`fetch_json` with the same arguments is served from the cache,
+    or joins the prefetch if it is still running. Nothing is scheduled when a
+    fresh response is already cached.
+    """
+    params = normalize_params(params)
+    if ttl is None:
+        ttl = DEFAULT_TTLS.get(endpoint_of(url), FALLBACK_TTL)
+    key = make_key(url, params, api_key)
+    cached = get_response_cache().get(key)
+    if cached is not None and time.time() - cached.fetched_at < ttl:
+        return None
+    return submit_background(key, _fetch, url, params, headers, api_key, key, cached)
@@ -1,19 +1,40 @@
-import json
-import os
 from typing import Dict, List, Tuple, Optional
-import requests
-import traceback
+from concurrent.futures import ThreadPoolExecutor, wait
 from PIL import Image
 from io import BytesIO
 import numpy as np
 import torch
-import comfy.utils as comfy_utils
-import logging
-from PIL import ImageOps
-import PIL
 
-#Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+from ..env_utils import env_float
+from ..isulion_logging import get_logger
+from .civitai_records import CIVITAI_IMAGES, ENTRY_SEPARATOR, CivitaiImageRecord
+from ..http_client import is_image_type
+from ..url_image_cache import CACHE_MODES, get_url_image_cache, load_url_bytes
+
+logger = get_logger(__name__)
+
+
+# Concurrent downloads in "All" mode and the overall time budget in seconds
+DOWNLOAD_WORKERS = max(1, int(env_float("ISULION_DOWNLOAD_WORKERS", 8)))
+DOWNLOAD_DEADLINE = env_float("ISULION_DOWNLOAD_DEADLINE", 60.0)
+
+
+def parse_image_entry(entry: str) -> Dict[str, str]:
+    """Parse a "Key: value" image info block into a dict."""
+    image_data = {}
+    for line in entry.split('\n'):
+        if ': ' in line:
+            key, value = line.split(': ', 1)
+            image_data[key] = value
+    return image_data
+
+
+def entry_fields(entry) -> Dict[str, str]:
+    """Return the display fields of a structured record or a text block."""
+    if isinstance(entry, CivitaiImageRecord):
+        return entry.display_fields()
+    return parse_image_entry(entry)
+
 
 class IsulionCivitaiImageDisplay:
     """Node that displays Civitai images directly from URLs."""
@@ -42,6 +63,12 @@ class IsulionCivitaiImageDisplay:
                     "step": 64
                 }),
             },
+            "optional": {
+                "cache_mode": (CACHE_MODES, {
+                    "default": "enable"
+                }),
+                "civitai_images": (CIVITAI_IMAGES,),
+            },
         }
 
     RETURN_TYPES = ("IMAGE", "STRING", "STRING", "STRING", "STRING")
@@ -64,7 +91,8 @@ class IsulionCivitaiImageDisplay:
             new_width = int(target_size * aspect_ratio)
             
         # Resize the original image
-        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS)
+        # reducing_gap shrinks large sources in a cheap first pass before LANCZOS
+        resized = image.resize((new_width, new_height), Image.Resampling.LANCZOS, reducing_gap=3.0)
         
         # Calculate position to paste (center)
         paste_x = (target_size - new_width) // 2
@@ -83,13 +111,79 @@ class IsulionCivitaiImageDisplay:
         image_tensor = image_tensor.unsqueeze(0)
         return image_tensor
 
-    def display_image(self, image_info: str, mode: str, image_index: int, target_size: int):
+    def fetch_image(self, image_url: str, target_size: int,
+                    cache_mode: str = "enable") -> Optional[torch.Tensor]:
+        """Download, decode and resize one image, returning None if it is unusable."""
+        try:
+            cache = get_url_image_cache() if cache_mode != "disable" else None
+            if cache is not None:
+                cached_variant = cache.get_variant(image_url, target_size)
+                if cached_variant is not None:
+                    return torch.from_numpy(cached_variant).float().div_(255.0).unsqueeze(0)
+
+            content, content_type = load_url_bytes(image_url, cache_mode)
+
+            # Silently skip non-image content; untyped bodies are left to the decoder
+            if not is_image_type(content_type) or not content:
+                return None
+
+            image = Image.open(BytesIO(content))
+            # Let JPEGs decode at a reduced scale that still covers target_size
+            image.draft('RGB', (target_size, target_size))
+            if image.mode != 'RGB':
+                image = image.convert('RGB')
+
+            image = self.resize_image(image, target_size)
+            image_array = np.array(image)
+            if cache is not None:
+                cache.put_variant(image_url, target_size, image_array)
+
+            image_tensor = torch.from_numpy(image_array).float() / 255.0
+            return image_tensor.unsqueeze(0)
+        except Exception as e:
+            logger.debug("Skipping image %s: %s", image_url, e)
+            return None
+
+    def fetch_images(self, image_urls: List[str], target_size: int,
+                     cache_mode: str = "enable") -> List[Optional[torch.Tensor]]:
+        """
+        Fetch several images concurrently, keeping the input order.
+
+        Each worker downloads, decodes and resizes its image, so decoding
+        overlaps with the other downloads. Images that are not done when the
+        overall deadline passes are returned as None.
+        """
+        if not image_urls:
+            return []
+
+        executor = ThreadPoolExecutor(
+            max_workers=min(DOWNLOAD_WORKERS, len(image_urls)),
+            thread_name_prefix="civitai-image"
+        )
+        try:
+            futures = [
+                executor.submit(self.fetch_image, url, target_size, cache_mode)
+                for url in image_urls
+            ]
+            _, not_done = wait(futures, timeout=DOWNLOAD_DEADLINE)
+            if not_done:
+                logger.warning("%d of %d images missed the %.0fs download deadline",
+                               len(not_done), len(futures), DOWNLOAD_DEADLINE)
+            return [future.result() if future not in not_done else None for future in futures]
+        finally:
+            # Do not block on stragglers, their requests end with the read timeout
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def display_image(self, image_info: str, mode: str, image_index: int, target_size: int,
+                      cache_mode: str = "enable", civitai_images: Optional[List[CivitaiImageRecord]] = None):
         try:
-            # Parse image info to get URL
-            if isinstance(image_info, list):
+            # Structured records take precedence and need no parsing
+            if civitai_images:
+                entries = list(civitai_images)
+            elif isinstance(image_info, list):
                 entries = image_info
             else:
-                entries = image_info.split("-------------------")
+                entries = image_info.split(ENTRY_SEPARATOR)
                 entries = [entry.strip() for entry in entries if entry.strip()]
 
             if not entries:
@@ -101,55 +195,27 @@ class IsulionCivitaiImageDisplay:
 
             # Handle "All" mode
             if mode == "All":
+                parsed_entries = [entry_fields(entry) for entry in entries]
+                parsed_entries = [data for data in parsed_entries if data.get('URL')]
+                image_tensors = self.fetch_images(
+                    [data['URL'] for data in parsed_entries], target_size, cache_mode
+                )
+
                 all_tensors = []
                 all_titles = []
                 all_prompts = []
                 all_urls = []
                 all_models = []
 
-                for entry in entries:
-                    image_data = {}
-                    for line in entry.split('\n'):
-                        if ': ' in line:
-                            key, value = line.split(': ', 1)
-                            image_data[key] = value
-
-                    image_url = image_data.get('URL', '')
-                    model = image_data.get('Model', 'Unknown')
-                    if not image_url:
-                        continue
-
-                    try:
-                        response = requests.get(image_url, timeout=10)
-                        response.raise_for_status()
-                        
-                        # Silently skip non-image content
-                        content_type = response.headers.get('content-type', '').lower()
-                        if not content_type.startswith('image/') or 'video' in content_type:
-                            continue
-
-                        image_data = response.content
-                        if not image_data:
-                            continue
-
-                        image = Image.open(BytesIO(image_data))
-                        if image.mode != 'RGB':
-                            image = image.convert('RGB')
-                        
-                        image = self.resize_image(image, target_size)
-                        
-                        image_tensor = torch.from_numpy(np.array(image)).float() / 255.0
-                        image_tensor = image_tensor.unsqueeze(0)
-                        
-                        all_tensors.append(image_tensor)
-                        all_titles.append(image_data.get('Image', 'Untitled'))
-                        all_prompts.append(image_data.get('Prompt', 'No prompt available'))
-                        all_urls.append(image_url)
-                        all_models.append(model)
-
-                    except:
-                        # Silently skip any errors
+                # Results come back in input order, failed downloads are None
+                for image_data, image_tensor in zip(parsed_entries, image_tensors):
+                    if image_tensor is None:
                         continue
+                    all_tensors.append(image_tensor)
+                    all_titles.append(image_data.get('Image', 'Untitled'))
+                    all_prompts.append(image_data.get('Prompt', 'No prompt available'))
+                    all_urls.append(image_data['URL'])
+                    all_models.append(image_data.get('Model', 'Unknown'))
 
                 if not all_tensors:
                     return (self.create_error_image(target_size), 
@@ -176,12 +242,7 @@ class IsulionCivitaiImageDisplay:
 
                 # Try each entry starting from image_index until we find a valid image
                 for current_index in range(image_index, len(entries)):
-                    entry = entries[current_index]
-                    image_data = {}
-                    for line in entry.split('\n'):
-                        if ': ' in line:
-                            key, value = line.split(': ', 1)
-                            image_data[key] = value
+                    image_data = entry_fields(entries[current_index])
 
                     image_url = image_data.get('URL', '')
                     title = image_data.get('Image', 'Untitled')
@@ -191,33 +252,9 @@ class IsulionCivitaiImageDisplay:
                     if not image_url:
                         continue
 
-                    try:
-                        response = requests.get(image_url, timeout=10)
-                        response.raise_for_status()
-                        
-                        # Check if content is an image
-                        content_type = response.headers.get('content-type', '').lower()
-                        if not content_type.startswith('image/') or 'video' in content_type:
-                            continue
-
-                        image_data = response.content
-                        if not image_data:
-                            continue
-
-                        image = Image.open(BytesIO(image_data))
-                        if image.mode != 'RGB':
-                            image = image.convert('RGB')
-                        
-                        image = self.resize_image(image, target_size)
-                        
-                        image_tensor = torch.from_numpy(np.array(image)).float() / 255.0
-                        image_tensor = image_tensor.unsqueeze(0)
-                        
+                    image_tensor = self.fetch_image(image_url, target_size, cache_mode)
+                    if image_tensor is not None:
                         return (image_tensor, title, prompt, image_url, model)
-                        
-                    except:
-                        # Silently skip any errors and continue to next entry
-                        continue
 
                 # If we get here, no valid images were found
                 return (self.create_error_image(target_size),
@@ -227,7 +264,7 @@ class IsulionCivitaiImageDisplay:
                        "No model available")
             
         except Exception as e:
-            print(f"Error loading image from URL: {str(e)}")
+            logger.error("Error loading image from URL: %s", e)
             return (self.create_error_image(target_size),
                    f"Error: {str(e)}",
                    "No prompt available",
@@ -2,22 +2,25 @@ import json
 import os
 from typing import Dict, List, Tuple, Optional
 import requests
-import traceback
 import logging
 
-#Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
+from . import civitai_cache
+from ..isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+# Highest page selectable on the node
+MAX_PAGE = 100
 
 class IsulionCivitaiModelExplorer:
     """Node that searches and displays model information and previews from Civitai."""
 
     def __init__(self):
-        self.api_base = "https://civitai.com/api/v1"
-        self.results_cache = {}
+        self.api_base = civitai_cache.get_api_base()
         self.current_page = 1
         self.items_per_page = 10
         self.api_key = os.getenv('CIVITAI_API_TOKEN')
-        print(f"Debug - Init: API base URL: {self.api_base}")
+        logger.debug("API base URL: %s", self.api_base)
 
     @classmethod
     def INPUT_TYPES(cls):
@@ -40,7 +43,7 @@ class IsulionCivitaiModelExplorer:
                 "page": ("INT", {
                     "default": 1,
                     "min": 1,
-                    "max": 100
+                    "max": MAX_PAGE
                 }),
                 "api_key": ("STRING", {
                     "default": "",
@@ -48,6 +51,11 @@ class IsulionCivitaiModelExplorer:
                     "placeholder": "Enter your Civitai API token..."
                 })
             },
+            "optional": {
+                "prefetch": (["next", "next and previous", "disable"], {
+                    "default": "next"
+                }),
+            },
         }
 
     RETURN_TYPES = ("STRING",)
@@ -55,35 +63,9 @@ class IsulionCivitaiModelExplorer:
     FUNCTION = "search_prompts"
     CATEGORY = "Isulion/Prompt Tools"
 
-    def search_prompts(self,
-                      search_query: str,
-                      sort_by: str,
-                      nsfw_filter: str,
-                      model_type: str,
-                      page: int = 1,
-                      api_key: str = "") -> Tuple[List[str]]:
-        """Search for models and return associated information."""
-
-        logging.info("\n=== Starting Civitai API Search ===")
-        logging.debug(f"Debug - Search params:")
-        logging.debug(f"  Query: {search_query}")
-        logging.debug(f"  Sort: {sort_by}")
-        logging.debug(f"  NSFW Filter: {nsfw_filter}")
-        logging.debug(f"  Model Type: {model_type}")
-        logging.debug(f"  Page: {page}")
-        logging.debug(f"  API Key provided: {'Yes' if api_key else 'No'}")
-
-        api_key = api_key.strip() or self.api_key
-        logging.debug(f"Debug - Final API key present: {'Yes' if api_key else 'No'}")
-
-        if not api_key:
-            logging.error("Debug - Error: No API key available")
-            return (
-                ["Error: No API key provided. Please provide a Civitai API token."],
-            )
-
-        logging.debug(f"Debug - Final page number: {page}")
-
+    def _build_params(self, search_query: str, sort_by: str, nsfw_filter: str,
+                      model_type: str, page: int) -> Dict[str, object]:
+        """Build the /models query parameters for one page of a search."""
         sort_map = {
             "Highest Rated": "Highest Rated",
             "Most Downloaded": "Most Downloaded",
@@ -105,47 +87,77 @@ class IsulionCivitaiModelExplorer:
             "type": model_type.upper() if model_type != "All" else None
         }
 
-        params = {k: v for k, v in params.items() if v is not None}
-        logging.debug(f"Debug - Final API parameters: {json.dumps(params, indent=2)}")
+        return {k: v for k, v in params.items() if v is not None}
+
+    def search_prompts(self,
+                      search_query: str,
+                      sort_by: str,
+                      nsfw_filter: str,
+                      model_type: str,
+                      page: int = 1,
+                      api_key: str = "",
+                      prefetch: str = "next") -> Tuple[List[str]]:
+        """Search for models and return associated information."""
+
+        logger.info("Starting Civitai model search")
+        logger.debug("Search params: query=%r sort=%s nsfw_filter=%s model_type=%s page=%d "
+                     "api_key_input=%s", search_query, sort_by, nsfw_filter, model_type, page,
+                     "yes" if api_key else "no")
+
+        api_key = api_key.strip() or self.api_key
+
+        if not api_key:
+            logger.error("No Civitai API key available")
+            return (
+                ["Error: No API key provided. Please provide a Civitai API token."],
+            )
+
+        params = self._build_params(search_query, sort_by, nsfw_filter, model_type, page)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("API parameters: %s", json.dumps(params))
 
         headers = {
             "Authorization": f"Bearer {api_key}",
             "Accept": "application/json"
         }
-        logging.debug("Debug - Headers set (excluding auth token)")
 
         try:
-            cache_key = f"{search_query}_{sort_by}_{nsfw_filter}_{model_type}_{page}"
-            logging.debug(f"Debug - Cache key: {cache_key}")
-
-            if cache_key in self.results_cache:
-                logging.debug("Debug - Returning cached results")
-                return self.results_cache[cache_key]
-
-            logging.debug(f"Debug - Making API request to: {self.api_base}/models")
-            response = requests.get(
+            logger.debug("Requesting %s/models", self.api_base)
+            data = civitai_cache.fetch_json(
                 f"{self.api_base}/models",
                 params=params,
                 headers=headers,
-                timeout=10
+                api_key=api_key
             )
-
-            logging.debug(f"Debug - API Response Status: {response.status_code}")
-            logging.debug(f"Debug - API Response Headers: {dict(response.headers)}")
-            logging.debug(f"Debug - API Response Content: {response.text[:500]}...")
-
-            response.raise_for_status()
-            data = response.json()
-            logging.debug(f"Debug - Successfully parsed JSON response")
-            logging.debug(f"API Response Body: {data}")
-
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("API response body: %.2000s", json.dumps(data))
+
+            if prefetch != "disable":
+                total_pages = (data.get("metadata") or {}).get("totalPages")
+                adjacent_pages = [page + 1]
+                if prefetch == "next and previous":
+                    adjacent_pages.append(page - 1)
+                for adjacent_page in adjacent_pages:
+                    if adjacent_page < 1 or adjacent_page > MAX_PAGE:
+                        continue
+                    if total_pages is not None and adjacent_page > total_pages:
+                        continue
+                    # Warm the cache so stepping the page input is served locally
+                    civitai_cache.prefetch(
+                        f"{self.api_base}/models",
+                        params=self._build_params(
+                            search_query, sort_by, nsfw_filter, model_type, adjacent_page
+                        ),
+                        headers=headers,
+                        api_key=api_key
+                    )
 
             model_infos = []
 
             items = data.get("items", [])
 
             if not items:
-                logging.warning("Debug - API returned empty items list.")
+                logger.warning("Civitai API returned no models for the query")
                 return ["Warning: No results found for the given query."]
 
             for item in items:
@@ -161,24 +173,18 @@ class IsulionCivitaiModelExplorer:
 
                 model_infos.append(model_info)
             result = (model_infos,)
-            self.results_cache[cache_key] = result
             return result
 
         except requests.RequestException as e:
-            logging.error(f"Debug - Request Exception Details:")
-            logging.error(f"  Error Type: {type(e).__name__}")
-            logging.error(f"  Error Message: {str(e)}")
-            if hasattr(e, 'response') and e.response is not None:
-                logging.error(f"  Response Status: {e.response.status_code}")
-                logging.error(f"  Response Headers: {dict(e.response.headers)}")
-                logging.error(f"  Response Content: {e.response.text[:500]}...")
-            logging.error("Debug - Full traceback:")
-            traceback.print_exc()
+            logger.error("Civitai request failed: %s: %s", type(e).__name__, e)
+            response = getattr(e, 'response', None)
+            if response is not None:
+                logger.error("Response status: %s", response.status_code)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response headers: %s", dict(response.headers))
+                    logger.debug("Response content: %.500s", response.text)
+            logger.debug("Request traceback", exc_info=True)
             return ["Error: Failed to connect to Civitai API"]
-        except Exception as e:
-            logging.error(f"Debug - Unexpected Error Details:")
-            logging.error(f"  Error Type: {type(e).__name__}")
-            logging.error(f"  Error Message: {str(e)}")
-            logging.error("Debug - Full traceback:")
-            traceback.print_exc()
+        except Exception:
+            logger.exception("Unexpected error during Civitai model search")
             return ["Error: Unexpected error occurred"]
@@ -0,0 +1,95 @@
+from typing import Any, Dict, List, NamedTuple, Optional
+
+# Socket type carrying a list of CivitaiImageRecord between nodes
+CIVITAI_IMAGES = "CIVITAI_IMAGES"
+
+# Separator between entries of the text format
+ENTRY_SEPARATOR = "-------------------"
+
+
+class CivitaiImageRecord(NamedTuple):
+    """Compact, structured view of one image item returned by the Civitai API."""
+    url: str
+    name: str
+    username: str
+    width: Optional[int]
+    height: Optional[int]
+    created_at: str
+    nsfw_level: str
+    type: str
+    stats: Dict[str, Any]
+    meta: Dict[str, Any]
+
+    @classmethod
+    def from_api_item(cls, item: Dict[str, Any]) -> "CivitaiImageRecord":
+        return cls(
+            url=item.get('url') or '',
+            name=item.get('name') or 'Untitled',
+            username=item.get('username') or 'Unknown',
+            width=item.get('width'),
+            height=item.get('height'),
+            created_at=item.get('createdAt') or 'Unknown',
+            nsfw_level=str(item.get('nsfwLevel', 'None')),
+            type=(item.get('type') or 'image').lower(),
+            stats=item.get('stats') or {},
+            meta=item.get('meta') or {},
+        )
+
+    @property
+    def is_video(self) -> bool:
+        return self.type == 'video'
+
+    @property
+    def prompt(self) -> str:
+        return (self.meta.get('prompt') or '').strip()
+
+    @property
+    def negative_prompt(self) -> str:
+        return (self.meta.get('negativePrompt') or '').strip()
+
+    @property
+    def model(self) -> str:
+        return self.meta.get('Model') or ''
+
+    def to_text(self) -> str:
+        """Format the record as the human readable image info block."""
+        stats = self.stats
+        image_info = (
+            f"Image: {self.name}\n"
+            f"URL: {self.url or 'No URL available'}\n"
+            f"Author: {self.username}\n"
+            f"Stats: ❤️ {stats.get('heartCount', 0)} 👍 {stats.get('likeCount', 0)} 💬 {stats.get('commentCount', 0)}\n"
+            f"Size: {self.width or 'Unknown'}x{self.height or 'Unknown'}\n"
+            f"Created: {self.created_at}\n"
+            f"NSFW Level: {self.nsfw_level}\n"
+        )
+        meta = self.meta
+        if meta:
+            if self.prompt:
+                image_info += f"\nPrompt: {self.prompt}\n"
+            if self.negative_prompt:
+                image_info += f"Negative Prompt: {self.negative_prompt}\n"
+            if meta.get("Model"):
+                image_info += f"Model: {meta.get('Model')}\n"
+            if meta.get("sampler"):
+                image_info += f"Sampler: {meta.get('sampler')}\n"
+            if meta.get("steps"):
+                image_info += f"Steps: {meta.get('steps')}\n"
+            if meta.get("cfg"):
+                image_info += f"CFG: {meta.get('cfg')}\n"
+        image_info += f"{ENTRY_SEPARATOR}\n"
+        return image_info
+
+    def display_fields(self) -> Dict[str, str]:
+        """Return the fields the image display node reads, keyed like the text format."""
+        fields = {'Image': self.name, 'URL': self.url}
+        if self.prompt:
+            fields['Prompt'] = self.prompt
+        if self.model:
+            fields['Model'] = self.model
+        return fields
+
+
+def records_to_text(records: List[CivitaiImageRecord]) -> List[str]:
+    """Format records as the text blocks of the legacy image_info output."""
+    return [record.to_text() for record in records]
@@ -1,19 +1,40 @@
-import json
 import os
 from typing import Dict, List, Tuple, Optional
 import requests
-import traceback
 import logging
+from urllib.parse import parse_qs, urlparse
+
+from . import civitai_cache
+from ..isulion_logging import get_logger
+from .civitai_records import CIVITAI_IMAGES, CivitaiImageRecord, records_to_text
+
+logger = get_logger(__name__)
+
+
+# Largest page the images endpoint accepts
+MAX_PAGE_SIZE = 200
+
+
+def next_page_params(metadata: Optional[Dict]) -> Optional[Dict[str, str]]:
+    """Return the query parameters of the next page from the response metadata."""
+    if not metadata:
+        return None
+    if metadata.get("nextCursor") is not None:
+        return {"cursor": str(metadata["nextCursor"])}
+    next_page = metadata.get("nextPage")
+    if next_page:
+        query = parse_qs(urlparse(next_page).query)
+        for key in ("cursor", "page"):
+            if query.get(key):
+                return {key: query[key][0]}
+    return None
 
-#Configure logging
-logging.basicConfig(level=logging.DEBUG, format='%(asctime)s - %(levelname)s - %(message)s')
 
 class IsulionCivitaiTrending:
     """Node that retrieves trending images from Civitai."""
 
     def __init__(self):
-        self.api_base = "https://civitai.com/api/v1"
-        self.results_cache = {}
+        self.api_base = civitai_cache.get_api_base()
         self.api_key = os.getenv('CIVITAI_API_TOKEN')
 
     @classmethod
@@ -44,10 +65,21 @@ class IsulionCivitaiTrending:
                     "default": "FLUX"
                 })
             },
+            "optional": {
+                "max_pages": ("INT", {
+                    "default": 10,
+                    "min": 1,
+                    "max": 100,
+                    "step": 1
+                }),
+                "prefetch": (["disable", "enable"], {
+                    "default": "disable"
+                }),
+            },
         }
 
-    RETURN_TYPES = ("STRING",)
-    RETURN_NAMES = ("image_info",)
+    RETURN_TYPES = ("STRING", CIVITAI_IMAGES)
+    RETURN_NAMES = ("image_info", "civitai_images")
     FUNCTION = "get_trending"
     CATEGORY = "Isulion/Prompt Tools"
 
@@ -57,17 +89,23 @@ class IsulionCivitaiTrending:
                      period: str,
                      number_of_images: int,
                      api_key: str = "",
-                     model: str = "") -> Tuple[List[str]]:
-        """Retrieve trending images for the specified period."""
+                     model: str = "",
+                     max_pages: int = 10,
+                     prefetch: str = "disable") -> Tuple[List[str], List[CivitaiImageRecord]]:
+        """Retrieve trending images for the specified period.
 
-        logging.info("\n=== Starting Civitai Trending Images Search ===")
-        logging.debug(f"Debug - Search params:")
-        logging.debug(f"  NSFW Filter: {nsfw_filter}")
+        Returns the images both as text blocks and as structured records for
+        nodes that accept the CIVITAI_IMAGES type.
+        """
+
+        logger.info("Starting Civitai trending images search")
+        logger.debug("Search params: nsfw_filter=%s sort=%s period=%s number_of_images=%d model=%s",
+                     nsfw_filter, sort_by, period, number_of_images, model)
 
         api_key = api_key.strip() or self.api_key
 
         if not api_key:
-            return (["Error: No API key provided. Please provide a Civitai API token."],)
+            return (["Error: No API key provided. Please provide a Civitai API token."], [])
 
         nsfw_params = {
             "Hide NSFW": {"nsfw": "false", "nsfwLevel": ["None", "Soft"]},
@@ -79,14 +117,15 @@ class IsulionCivitaiTrending:
         }
 
         model_map = {
-            "All": None, "SDXL": 1, "FLUXX": 2, "Other": 3  # Replace with actual IDs if needed
+            "All": None, "SDXL": 1, "FLUX": 2, "Other": 3  # Replace with actual IDs if needed
         }
 
         params = {
-            "limit": 50,  # Fetch more results per page for more retries. Adjust as needed.
+            # The first page is sized to the request, later pages to the images still missing
+            "limit": min(max(number_of_images, 1), MAX_PAGE_SIZE),
             "period": period_map[period],
             "sort": sort_by,
-            "modelId": model_map[model]
+            "modelId": model_map.get(model)
         }
 
         current_nsfw_params = nsfw_params[nsfw_filter]
@@ -100,62 +139,45 @@ class IsulionCivitaiTrending:
         }
 
         try:
-            image_infos = []
-            page = 1
-            while len(image_infos) < number_of_images:
-                params["page"] = page
-                response = requests.get(f"{self.api_base}/images", params=params, headers=headers, timeout=10)
-                response.raise_for_status()
-                data = response.json()
+            records = []
+            url = f"{self.api_base}/images"
+            pages_fetched = 0
+            while len(records) < number_of_images and pages_fetched < max_pages:
+                data = civitai_cache.fetch_json(url, params=params, headers=headers, api_key=api_key)
+                pages_fetched += 1
                 items = data.get("items", [])
 
                 for item in items:
-                    if item.get('type', '').lower() == 'video':
+                    record = CivitaiImageRecord.from_api_item(item)
+                    if record.is_video:
                         continue
-                    stats = item.get("stats", {})
-                    meta = item.get("meta", {})
-                    image_info = (
-                        f"Image: {item.get('name', 'Untitled')}\n"
-                        f"URL: {item.get('url', 'No URL available')}\n"
-                        f"Author: {item.get('username', 'Unknown')}\n"
-                        f"Stats: ❤️ {stats.get('heartCount', 0)} 👍 {stats.get('likeCount', 0)} 💬 {stats.get('commentCount', 0)}\n"
-                        f"Size: {item.get('width', 'Unknown')}x{item.get('height', 'Unknown')}\n"
-                        f"Created: {item.get('createdAt', 'Unknown')}\n"
-                        f"NSFW Level: {item.get('nsfwLevel', 'None')}\n"
-                    )
-                    if meta:
-                        prompt = meta.get("prompt", "").strip()
-                        negative_prompt = meta.get("negativePrompt", "").strip()
-                        if prompt:
-                            image_info += f"\nPrompt: {prompt}\n"
-                        if negative_prompt:
-                            image_info += f"Negative Prompt: {negative_prompt}\n"
-                        if meta.get("Model"):
-                            image_info += f"Model: {meta.get('Model')}\n"
-                        if meta.get("sampler"):
-                            image_info += f"Sampler: {meta.get('sampler')}\n"
-                        if meta.get("steps"):
-                            image_info += f"Steps: {meta.get('steps')}\n"
-                        if meta.get("cfg"):
-                            image_info += f"CFG: {meta.get('cfg')}\n"
-                    image_info += "-------------------\n"
-                    image_infos.append(image_info)
-                    if len(image_infos) >= number_of_images:
+                    records.append(record)
+                    if len(records) >= number_of_images:
                         break
-                page += 1
 
-            if not image_infos:
-                return (["No images found in the current selection."],)
-            result = (image_infos,)
-            return result
+                next_page = next_page_params(data.get("metadata"))
+                if not items or next_page is None or len(records) >= number_of_images:
+                    break
+
+                # Only ask for the images skipped videos left missing
+                params.update(next_page)
+                params["limit"] = min(number_of_images - len(records), MAX_PAGE_SIZE)
+                if prefetch == "enable" and pages_fetched < max_pages:
+                    # Same params as the fetch below, which joins the prefetch if still running
+                    civitai_cache.prefetch(url, params=params, headers=headers, api_key=api_key)
+
+            if not records:
+                return (["No images found in the current selection."], [])
+            return (records_to_text(records), records)
 
         except requests.RequestException as e:
-            logging.error(f"Debug - Request Exception: {str(e)}")
-            if hasattr(e, 'response'):
-                logging.error(f"Response Status: {e.response.status_code}")
-                logging.error(f"Response Text: {e.response.text}")
-            return (["Error: Failed to connect to Civitai API"],)
-        except Exception as e:
-            logging.error(f"Debug - Unexpected Error: {str(e)}")
-            traceback.print_exc()
-            return (["Error: Unexpected error occurred"],)
+            logger.error("Civitai request failed: %s", e)
+            response = getattr(e, 'response', None)
+            if response is not None:
+                logger.error("Response status: %s", response.status_code)
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("Response text: %.500s", response.text)
+            return (["Error: Failed to connect to Civitai API"], [])
+        except Exception:
+            logger.exception("Unexpected error during Civitai trending search")
+            return (["Error: Unexpected error occurred"], [])
@@ -0,0 +1,100 @@
+"""
+Offline benchmark of the Civitai nodes against the local stub server.
+
+Starts the stub in the background, points ``CIVITAI_API_BASE`` at it and
+times the Model Explorer, Trending and Image Display nodes, cold and warm,
+reporting the wall time and the number of requests that reached the server.
+The caches live in a temporary directory unless ``--cache-dir`` is given.
+
+The nodes import torch and ComfyUI modules, so run it with ComfyUI's Python::
+
+    python Core_Nodes/civitai_nodes/stub/benchmark.py --latency 0.2 --image-latency 0.1
+
+When the repository is not installed under ``ComfyUI/custom_nodes``, pass the
+ComfyUI directory with ``--comfyui``.
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+STUB_DIR = os.path.dirname(os.path.abspath(__file__))
+REPO_ROOT = os.path.abspath(os.path.join(STUB_DIR, "..", "..", ".."))
+
+sys.path.insert(0, STUB_DIR)
+from server import StubServer, add_config_arguments, config_from_args  # noqa: E402
+
+
+def _default_comfyui_dir():
+    parent = os.path.dirname(REPO_ROOT)
+    if os.path.basename(parent) == "custom_nodes":
+        return os.path.dirname(parent)
+    return os.getenv("COMFYUI_PATH")
+
+
+def _import_nodes(comfyui_dir):
+    if comfyui_dir:
+        sys.path.insert(0, comfyui_dir)
+    sys.path.insert(0, REPO_ROOT)
+    from Core_Nodes.civitai_nodes.civitai_model_explorer import IsulionCivitaiModelExplorer
+    from Core_Nodes.civitai_nodes.civitai_trending import IsulionCivitaiTrending
+    from Core_Nodes.civitai_nodes.civitai_image_display import IsulionCivitaiImageDisplay
+    return IsulionCivitaiModelExplorer, IsulionCivitaiTrending, IsulionCivitaiImageDisplay
+
+
+def _measure(server, label, fn, repeat):
+    for run in range(repeat):
+        server.reset_stats()
+        start = time.perf_counter()
+        fn()
+        elapsed = time.perf_counter() - start
+        stats = server.stats()
+        requests = ", ".join(f"{key}={value}" for key, value in sorted(stats.items())) or "none"
+        print(f"{label:<34} run {run + 1}: {elapsed * 1000:9.1f} ms   requests: {requests}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the Civitai nodes against the local stub")
+    add_config_arguments(parser)
+    parser.add_argument("--comfyui", default=_default_comfyui_dir(), help="ComfyUI directory")
+    parser.add_argument("--cache-dir", default=None, help="Cache directory (default: temporary)")
+    parser.add_argument("--repeat", type=int, default=2, help="Runs per scenario, later runs are warm")
+    parser.add_argument("--pages", type=int, default=3, help="Model Explorer pages to step through")
+    parser.add_argument("--images", type=int, default=24, help="Trending images to fetch and display")
+    parser.add_argument("--target-size", type=int, default=512)
+    args = parser.parse_args()
+
+    cache_dir = args.cache_dir or tempfile.mkdtemp(prefix="isulion-bench-")
+    with StubServer(**config_from_args(args)) as server:
+        os.environ["CIVITAI_API_BASE"] = server.api_base
+        os.environ["ISULION_CACHE_DIR"] = cache_dir
+        os.environ.setdefault("CIVITAI_API_TOKEN", "stub-token")
+        print(f"Stub server: {server.base_url}   cache: {cache_dir}")
+
+        explorer_cls, trending_cls, display_cls = _import_nodes(args.comfyui)
+        explorer, trending, display = explorer_cls(), trending_cls(), display_cls()
+
+        def explore():
+            for page in range(1, args.pages + 1):
+                explorer.search_prompts("", "Highest Rated", "Hide NSFW", "All", page)
+
+        _measure(server, f"Model Explorer ({args.pages} pages)", explore, args.repeat)
+
+        def trend():
+            return trending.get_trending("Hide NSFW", "Newest", "Week", args.images, model="All")
+
+        _measure(server, f"Trending ({args.images} images)", trend, args.repeat)
+
+        _, records = trend()
+        for cache_mode in ("disable", "enable"):
+            def show():
+                display.display_image("", "All", 0, args.target_size,
+                                      cache_mode=cache_mode, civitai_images=records)
+
+            _measure(server, f"Image Display All (cache {cache_mode})", show, args.repeat)
+
+
+if __name__ == "__main__":
+    main()
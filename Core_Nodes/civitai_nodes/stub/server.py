@@ -0,0 +1,377 @@
+"""
+Local stand-in for the Civitai API, for offline load tests and benchmarks.
+
+Replays the recorded ``/models`` and ``/images`` responses in ``fixtures/``
+and serves generated PNG images (and dummy videos) for the image URLs they
+contain. Latency and errors can be injected to exercise the caching, retry
+and rate limiting paths of the nodes.
+
+Run it standalone and point the nodes at it::
+
+    python Core_Nodes/civitai_nodes/stub/server.py --port 8765 --latency 0.2
+    export CIVITAI_API_BASE=http://127.0.0.1:8765/api/v1
+
+``GET /stats`` returns request counters, ``GET /stats/reset`` clears them.
+In-process, :meth:`StubServer.api_calls` also lists the query of every API call.
+Only the standard library is used, so the server runs without ComfyUI.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import random
+import struct
+import threading
+import time
+import zlib
+from functools import lru_cache
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qs, urlencode, urlparse
+
+FIXTURES_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+
+# Size of the dummy body served for video URLs
+VIDEO_BYTES = 2 * 1024 * 1024
+
+IMAGE_SORTS = {
+    "Most Reactions": lambda item: -(item["stats"]["heartCount"] + item["stats"]["likeCount"]),
+    "Most Comments": lambda item: -item["stats"]["commentCount"],
+    "Newest": lambda item: item["createdAt"],
+}
+MODEL_SORTS = {
+    "Highest Rated": lambda item: -item["stats"]["rating"],
+    "Most Downloaded": lambda item: -item["stats"]["downloadCount"],
+    "Newest": lambda item: item["modelVersions"][0]["createdAt"],
+}
+
+
+def load_fixture(name: str) -> List[Dict]:
+    with open(os.path.join(FIXTURES_DIR, name), "r", encoding="utf-8") as f:
+        return json.load(f)["items"]
+
+
+def _png_chunk(kind: bytes, data: bytes) -> bytes:
+    return (struct.pack(">I", len(data)) + kind + data
+            + struct.pack(">I", zlib.crc32(kind + data) & 0xffffffff))
+
+
+@lru_cache(maxsize=256)
+def make_png(width: int, height: int, seed: str) -> bytes:
+    """Render a vertical gradient PNG whose colours are derived from ``seed``."""
+    digest = hashlib.sha1(seed.encode("utf-8")).digest()
+    top, bottom = digest[:3], digest[3:6]
+    rows = []
+    for y in range(height):
+        t = y / max(height - 1, 1)
+        pixel = bytes(int(a + (b - a) * t) for a, b in zip(top, bottom))
+        rows.append(b"\x00" + pixel * width)
+    header = struct.pack(">IIBBBBB", width, height, 8, 2, 0, 0, 0)
+    return (b"\x89PNG\r\n\x1a\n"
+            + _png_chunk(b"IHDR", header)
+            + _png_chunk(b"IDAT", zlib.compress(b"".join(rows), 6))
+            + _png_chunk(b"IEND", b""))
+
+
+class StubConfig:
+    """Behaviour of the stub server, shared by all request handlers."""
+
+    def __init__(self, latency: float = 0.0, jitter: float = 0.0, image_latency: float = 0.0,
+                 error_rate: float = 0.0, throttle_rate: float = 0.0, retry_after: float = 1.0,
+                 image_scale: float = 0.5, seed: Optional[int] = None):
+        self.latency = latency
+        self.jitter = jitter
+        self.image_latency = image_latency
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.image_scale = image_scale
+        self.random = random.Random(seed)
+        self.models = load_fixture("models.json")
+        self.images = load_fixture("images.json")
+        self.images_by_id = {str(item["id"]): item for item in self.images}
+        self.stats: Dict[str, int] = {}
+        self.api_calls: List[Tuple[str, Dict[str, str]]] = []
+        self.lock = threading.Lock()
+
+    def count(self, name: str):
+        with self.lock:
+            self.stats[name] = self.stats.get(name, 0) + 1
+
+    def record(self, path: str, query: Dict[str, str]):
+        with self.lock:
+            self.api_calls.append((path, query))
+
+    def roll(self) -> float:
+        with self.lock:
+            return self.random.random()
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    server_version = "CivitaiStub/1.0"
+    protocol_version = "HTTP/1.1"
+
+    @property
+    def config(self) -> StubConfig:
+        return self.server.config
+
+    def log_message(self, format, *args):
+        # Keep benchmark output readable
+        pass
+
+    def _base_url(self) -> str:
+        return f"http://{self.headers.get('Host') or '%s:%d' % self.server.server_address}"
+
+    def _send(self, status: int, body: bytes = b"", content_type: str = "application/json",
+              headers: Optional[Dict[str, str]] = None):
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        if self.command != "HEAD":
+            self.wfile.write(body)
+
+    def _send_json(self, payload: Dict):
+        body = json.dumps(payload).encode("utf-8")
+        etag = '"%s"' % hashlib.sha1(body).hexdigest()
+        if self.headers.get("If-None-Match") == etag:
+            self.config.count("not_modified")
+            self._send(304, headers={"ETag": etag})
+            return
+        self._send(200, body, headers={"ETag": etag, "Cache-Control": "max-age=60"})
+
+    def _delay(self, base: float):
+        config = self.config
+        delay = base + (config.roll() * config.jitter if config.jitter else 0.0)
+        if delay > 0:
+            time.sleep(delay)
+
+    def _inject_failure(self) -> bool:
+        config = self.config
+        roll = config.roll()
+        if roll < config.throttle_rate:
+            config.count("throttled")
+            self._send(429, b'{"error":"Too Many Requests"}',
+                       headers={"Retry-After": f"{config.retry_after:g}"})
+            return True
+        if roll < config.throttle_rate + config.error_rate:
+            config.count("errors")
+            self._send(503, b'{"error":"Service Unavailable"}')
+            return True
+        return False
+
+    def do_HEAD(self):
+        self.do_GET()
+
+    def do_GET(self):
+        parsed = urlparse(self.path)
+        query = {key: values[-1] for key, values in parse_qs(parsed.query).items()}
+        path = parsed.path.rstrip("/")
+
+        if path == "/stats":
+            with self.config.lock:
+                self._send(200, json.dumps(self.config.stats).encode("utf-8"))
+            return
+        if path == "/stats/reset":
+            with self.config.lock:
+                self.config.stats.clear()
+                self.config.api_calls.clear()
+            self._send(200, b"{}")
+            return
+
+        if path.startswith("/api/v1/"):
+            self.config.count("api")
+            self.config.record(path, query)
+            self._delay(self.config.latency)
+            if self._inject_failure():
+                return
+            if path == "/api/v1/models":
+                self.config.count("models")
+                self._send_json(self._models_page(query))
+                return
+            if path == "/api/v1/images":
+                self.config.count("images")
+                self._send_json(self._images_page(query))
+                return
+        elif path.startswith("/images/"):
+            self.config.count("image_files")
+            self._delay(self.config.image_latency)
+            self._serve_image(os.path.splitext(os.path.basename(path))[0])
+            return
+        elif path.startswith("/videos/"):
+            self.config.count("video_files")
+            self._delay(self.config.image_latency)
+            self._send(200, b"\x00" * VIDEO_BYTES, content_type="video/mp4")
+            return
+
+        self._send(404, b'{"error":"Not Found"}')
+
+    def _limit(self, query: Dict[str, str], default: int) -> int:
+        try:
+            return max(1, min(200, int(query.get("limit", default))))
+        except ValueError:
+            return default
+
+    def _models_page(self, query: Dict[str, str]) -> Dict:
+        items = self.config.models
+        search = query.get("query", "").strip().lower()
+        if search:
+            items = [item for item in items if search in item["name"].lower()]
+        model_type = (query.get("types") or query.get("type") or "").lower()
+        if model_type:
+            items = [item for item in items if item["type"].lower() == model_type]
+        sort = MODEL_SORTS.get(query.get("sort", ""))
+        if sort is not None:
+            items = sorted(items, key=sort, reverse=query.get("sort") == "Newest")
+
+        limit = self._limit(query, 100)
+        try:
+            page = max(1, int(query.get("page", 1)))
+        except ValueError:
+            page = 1
+        total_pages = max(1, -(-len(items) // limit))
+        metadata = {
+            "totalItems": len(items),
+            "currentPage": page,
+            "pageSize": limit,
+            "totalPages": total_pages,
+        }
+        if page < total_pages:
+            next_query = dict(query, page=str(page + 1))
+            metadata["nextPage"] = f"{self._base_url()}/api/v1/models?{urlencode(next_query)}"
+        return {"items": items[(page - 1) * limit:page * limit], "metadata": metadata}
+
+    def _images_page(self, query: Dict[str, str]) -> Dict:
+        items = self.config.images
+        sort = IMAGE_SORTS.get(query.get("sort", ""))
+        if sort is not None:
+            items = sorted(items, key=sort, reverse=query.get("sort") == "Newest")
+
+        limit = self._limit(query, 100)
+        try:
+            offset = max(0, int(query.get("cursor", 0)))
+        except ValueError:
+            offset = 0
+        page = items[offset:offset + limit]
+        base_url = self._base_url()
+        page = [dict(item, url=item["url"].replace("{base}", base_url)) for item in page]
+
+        metadata = {}
+        if offset + limit < len(items):
+            metadata["nextCursor"] = str(offset + limit)
+            next_query = dict(query, cursor=str(offset + limit))
+            metadata["nextPage"] = f"{base_url}/api/v1/images?{urlencode(next_query)}"
+        return {"items": page, "metadata": metadata}
+
+    def _serve_image(self, image_id: str):
+        item = self.config.images_by_id.get(image_id)
+        if item is None:
+            self._send(404, b'{"error":"Not Found"}')
+            return
+        scale = self.config.image_scale
+        width = max(1, int(item["width"] * scale))
+        height = max(1, int(item["height"] * scale))
+        self._send(200, make_png(width, height, image_id), content_type="image/png",
+                   headers={"Cache-Control": "public, max-age=31536000, immutable"})
+
+
+class StubServer:
+    """Threaded stub server that can run in the background of a benchmark."""
+
+    def __init__(self, host: str = "127.0.0.1", port: int = 0, **config):
+        self.httpd = ThreadingHTTPServer((host, port), StubHandler)
+        self.httpd.daemon_threads = True
+        self.httpd.config = StubConfig(**config)
+        self._thread = None
+
+    @property
+    def config(self) -> StubConfig:
+        return self.httpd.config
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def api_base(self) -> str:
+        return f"{self.base_url}/api/v1"
+
+    def stats(self) -> Dict[str, int]:
+        with self.config.lock:
+            return dict(self.config.stats)
+
+    def api_calls(self, path: Optional[str] = None) -> List[Tuple[str, Dict[str, str]]]:
+        """Return the path and query of every API call, optionally for one path."""
+        with self.config.lock:
+            return [call for call in self.config.api_calls if path is None or call[0] == path]
+
+    def reset_stats(self):
+        with self.config.lock:
+            self.config.stats.clear()
+            self.config.api_calls.clear()
+
+    def start(self) -> "StubServer":
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True,
+                                        name="civitai-stub")
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def add_config_arguments(parser: argparse.ArgumentParser):
+    parser.add_argument("--latency", type=float, default=0.0, help="API response delay in seconds")
+    parser.add_argument("--jitter", type=float, default=0.0, help="Random extra delay in seconds")
+    parser.add_argument("--image-latency", type=float, default=0.0, help="Image/video response delay")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fraction of API calls failing with 503")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fraction of API calls answered with 429")
+    parser.add_argument("--retry-after", type=float, default=1.0, help="Retry-After sent with 429s")
+    parser.add_argument("--image-scale", type=float, default=0.5, help="Served image size relative to the fixture")
+    parser.add_argument("--seed", type=int, default=None, help="Seed for latency and error injection")
+
+
+def config_from_args(args) -> Dict:
+    return {
+        "latency": args.latency,
+        "jitter": args.jitter,
+        "image_latency": args.image_latency,
+        "error_rate": args.error_rate,
+        "throttle_rate": args.throttle_rate,
+        "retry_after": args.retry_after,
+        "image_scale": args.image_scale,
+        "seed": args.seed,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Local stand-in for the Civitai API")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    add_config_arguments(parser)
+    args = parser.parse_args()
+
+    server = StubServer(args.host, args.port, **config_from_args(args))
+    print(f"Civitai stub serving on {server.base_url}")
+    print(f"export CIVITAI_API_BASE={server.api_base}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
-import os
 import random
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Mapping, Optional
+
+from ..isulion_logging import get_logger
+from .vocabulary import VocabularyError, load_vocabulary
+
+logger = get_logger(__name__)
 
 class ConfigManager:
     """Manages configuration loading and access for theme handlers."""
@@ -16,40 +20,11 @@ class ConfigManager:
         self._load_configs()
     
     def _load_configs(self):
-        for filename in self.config_files:
-            try:
-                with open(filename, 'r', encoding='utf-8') as f:
-                    logger.debug(f"Loading config file: {filename}")
-                    contents = f.read().strip() # Read the entire file content and remove leading/trailing whitespace
-                    if not contents:
-                        logger.warning(f"Config file '{filename}' is empty!")
-                        continue # Skip if the file is empty
-                    configs = json.loads(contents) # Use json.loads for debugging purposes to see the string
-                    logger.debug(f"Loaded config: {configs}")
-                    self.configs.update(configs)
-            except json.JSONDecodeError as e:
-                logger.exception(f"JSON decoding error in {filename}: {e}")
-                # Consider more robust error handling (e.g., using a default config)
-            except FileNotFoundError:
-                logger.warning(f"Configuration file not found: {filename}")
-            except Exception as e:
-                logger.exception(f"Unexpected error loading {filename}: {e}")
-        
-        # Load text-based config files
-        config_files = {
-            'mega': 'config_mega.txt',
-            'enhancements': 'enhancements.txt',
-            'lightings': 'lightings.txt',
-            'styles': 'styles.txt',
-            'subjects': 'subjects.txt',
-            'color_palettes': 'color_palettes.txt'
-        }
-        
-        for config_key, filename in config_files.items():
-            file_path = os.path.join(current_dir, filename)
-            if os.path.exists(file_path):
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    self.configs[config_key] = [line.strip() for line in f if line.strip()]
+        """Load the compiled vocabulary tables (config_mega.txt and the .txt lists)."""
+        try:
+            self.configs.update(load_vocabulary())
+        except VocabularyError as e:
+            logger.error("Could not load vocabulary: %s", e)
     
     def get_config(self, key: str) -> Any:
         """Get configuration value by key.
@@ -84,7 +59,7 @@ class ConfigManager:
                     return common_defaults[keys[1]]
             
             for k in keys:
-                if isinstance(value, dict) and k in value:
+                if isinstance(value, Mapping) and k in value:
                     value = value[k]
                 else:
                     raise KeyError(f"Configuration key not found: {key}")
@@ -0,0 +1,167 @@
+"""
+Shared, read-only vocabulary store for the generator nodes.
+
+The literal files (``config_mega.txt``, ``config_nodes.txt``) hold Python-style
+assignments of lists and dicts of strings; they are parsed with ``ast`` and
+only literal values are accepted, so nothing in them is ever executed. The
+one-item-per-line ``.txt`` lists are loaded under their file name.
+
+Everything is compiled once per process into interned strings, tuples and
+read-only mappings, so every node shares a single copy of each table. Edit the
+files and restart ComfyUI (or call ``reload_vocabulary``) to change content.
+"""
+
+import ast
+import os
+import sys
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, Mapping, Tuple
+
+from ..isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+CONFIG_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Files of ``name = [...]`` / ``name = {...}`` assignments, later files win
+LITERAL_FILES = ("config_mega.txt", "config_nodes.txt")
+
+# One item per line, loaded under the given key
+LIST_FILES = {
+    "enhancements": "enhancements.txt",
+    "lightings": "lightings.txt",
+    "styles": "styles.txt",
+    "subjects": "subjects.txt",
+    "color_palettes": "color_palettes.txt",
+}
+
+
+class VocabularyError(ValueError):
+    """Raised when a vocabulary file contains something other than literals."""
+
+
+def freeze(value: Any) -> Any:
+    """Convert parsed data to interned strings, tuples and read-only mappings.
+
+    Args:
+        value (Any): Parsed literal (str, list, tuple, dict or scalar)
+
+    Returns:
+        Any: Immutable equivalent of the value
+    """
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(freeze(item) for item in value)
+    if isinstance(value, dict):
+        return MappingProxyType({freeze(key): freeze(item) for key, item in value.items()})
+    return value
+
+
+def parse_literal_source(source: str, filename: str = "<vocabulary>") -> Dict[str, Any]:
+    """Parse ``name = literal`` assignments without executing anything.
+
+    Args:
+        source (str): File contents
+        filename (str): Name used in error messages
+
+    Returns:
+        Dict[str, Any]: Assigned names and their values; a repeated name keeps
+        its last value
+
+    Raises:
+        VocabularyError: If the source is not made only of literal assignments
+    """
+    try:
+        tree = ast.parse(source, filename=filename)
+    except SyntaxError as e:
+        raise VocabularyError(f"{filename}:{e.lineno}: {e.msg}") from e
+
+    values = {}
+    for node in tree.body:
+        if (not isinstance(node, ast.Assign) or len(node.targets) != 1
+                or not isinstance(node.targets[0], ast.Name)):
+            raise VocabularyError(f"{filename}:{node.lineno}: expected 'name = literal'")
+        try:
+            values[node.targets[0].id] = ast.literal_eval(node.value)
+        except ValueError as e:
+            raise VocabularyError(f"{filename}:{node.lineno}: {e}") from e
+    return values
+
+
+def parse_list_source(lines: Iterable[str]) -> Tuple[str, ...]:
+    """Parse a one-item-per-line list, skipping blank lines and ``#`` comments."""
+    items = (line.strip() for line in lines)
+    return tuple(item for item in items if item and not item.startswith("#"))
+
+
+@lru_cache(maxsize=None)
+def load_vocabulary(config_dir: str = CONFIG_DIR) -> Mapping[str, Any]:
+    """Compile every vocabulary file of a directory into one read-only mapping.
+
+    Missing files are skipped with a warning; malformed files raise.
+
+    Args:
+        config_dir (str): Directory holding the vocabulary files
+
+    Returns:
+        Mapping[str, Any]: Names mapped to tuples of strings or nested mappings
+    """
+    values: Dict[str, Any] = {}
+
+    for filename in LITERAL_FILES:
+        path = os.path.join(config_dir, filename)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                source = f.read()
+        except FileNotFoundError:
+            logger.warning("Vocabulary file not found: %s", path)
+            continue
+        values.update(parse_literal_source(source, filename))
+
+    for key, filename in LIST_FILES.items():
+        path = os.path.join(config_dir, filename)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                values[key] = parse_list_source(f)
+        except FileNotFoundError:
+            logger.warning("Vocabulary file not found: %s", path)
+
+    logger.debug("Loaded %d vocabulary tables from %s", len(values), config_dir)
+    return freeze(values)
+
+
+def reload_vocabulary():
+    """Drop the compiled store so the next lookup reads the files again."""
+    load_vocabulary.cache_clear()
+    get_flat_vocabulary.cache_clear()
+
+
+def get_vocabulary(key: str) -> Any:
+    """Look up a vocabulary table by name.
+
+    Args:
+        key (str): Table name, with dots for nested tables (e.g. 'clothing.fantasy')
+
+    Returns:
+        Any: Tuple of strings or read-only mapping of tables
+
+    Raises:
+        KeyError: If the table does not exist
+    """
+    value = load_vocabulary()
+    for part in key.split("."):
+        if not isinstance(value, Mapping) or part not in value:
+            raise KeyError(f"Vocabulary not found: {key}")
+        value = value[part]
+    return value
+
+
+@lru_cache(maxsize=None)
+def get_flat_vocabulary(key: str) -> Tuple[str, ...]:
+    """Return all items of a grouped table (a mapping of tuples) as one tuple."""
+    groups = get_vocabulary(key)
+    if not isinstance(groups, Mapping):
+        return groups
+    return tuple(item for group in groups.values() for item in group)
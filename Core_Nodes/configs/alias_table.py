@@ -0,0 +1,151 @@
+import random
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class AliasTable:
+    """Weighted sampling table built with Vose's alias method.
+
+    Building the table is O(n); every draw afterwards is O(1) and needs a
+    single uniform number, whatever the weights are.
+    """
+
+    __slots__ = ("values", "probabilities", "aliases")
+
+    def __init__(self, values: Sequence[Any], weights: Sequence[float]):
+        """Build the table.
+
+        Args:
+            values (Sequence[Any]): Entries to draw from
+            weights (Sequence[float]): Relative weight of each entry
+
+        Raises:
+            ValueError: If the lengths differ, a weight is negative or all
+                weights are zero
+        """
+        if len(values) != len(weights):
+            raise ValueError("values and weights must have the same length")
+        if not values:
+            raise ValueError("cannot build an alias table without values")
+        if any(weight < 0 for weight in weights):
+            raise ValueError("weights must not be negative")
+        total = float(sum(weights))
+        if total <= 0:
+            raise ValueError("at least one weight must be positive")
+
+        size = len(values)
+        scaled = [weight * size / total for weight in weights]
+        probabilities = [1.0] * size
+        aliases = list(range(size))
+        small = [i for i, p in enumerate(scaled) if p < 1.0]
+        large = [i for i, p in enumerate(scaled) if p >= 1.0]
+
+        while small and large:
+            less = small.pop()
+            more = large.pop()
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] = (scaled[more] + scaled[less]) - 1.0
+            (small if scaled[more] < 1.0 else large).append(more)
+        # Whatever is left is 1.0 up to rounding and keeps its own column
+
+        self.values = tuple(values)
+        self.probabilities = tuple(probabilities)
+        self.aliases = tuple(aliases)
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def index(self, u: float) -> int:
+        """Map a uniform number in [0, 1) to an entry index."""
+        scaled = u * len(self.values)
+        column = int(scaled)
+        if scaled - column < self.probabilities[column]:
+            return column
+        return self.aliases[column]
+
+    def sample(self, rng: Optional[random.Random] = None) -> Any:
+        """Draw one entry.
+
+        Args:
+            rng (Optional[random.Random]): Random source, the random module if None
+
+        Returns:
+            Any: The drawn entry
+        """
+        return self.values[self.index((rng or random).random())]
+
+    def sample_batch(self, count: int, seed: Optional[int] = None) -> List[Any]:
+        """Draw several entries at once, vectorized with NumPy when available.
+
+        Args:
+            count (int): Number of entries to draw
+            seed (Optional[int]): Seed of the batch, random if None
+
+        Returns:
+            List[Any]: The drawn entries
+        """
+        try:
+            import numpy as np
+        except ImportError:
+            rng = random.Random(seed)
+            return [self.sample(rng) for _ in range(count)]
+
+        generator = np.random.default_rng(seed)
+        size = len(self.values)
+        columns = generator.integers(0, size, count)
+        keep = generator.random(count) < np.asarray(self.probabilities)[columns]
+        indices = np.where(keep, columns, np.asarray(self.aliases)[columns])
+        return [self.values[i] for i in indices.tolist()]
+
+
+def is_weighted_list(value: Any) -> bool:
+    """Whether a config list uses weighted entries ({"value": ..., "weight": ...})."""
+    return isinstance(value, list) and any(isinstance(item, dict) and "value" in item for item in value)
+
+
+def split_weighted_list(entries: List[Any]) -> Tuple[List[Any], List[float]]:
+    """Split a weighted config list into plain values and weights.
+
+    Plain entries in a weighted list get weight 1.
+
+    Args:
+        entries (List[Any]): Config list mixing plain and weighted entries
+
+    Returns:
+        Tuple[List[Any], List[float]]: Values and their weights
+    """
+    values = []
+    weights = []
+    for entry in entries:
+        if isinstance(entry, dict) and "value" in entry:
+            values.append(entry["value"])
+            weights.append(float(entry.get("weight", 1.0)))
+        else:
+            values.append(entry)
+            weights.append(1.0)
+    return values, weights
+
+
+def compile_weighted_lists(config: Dict[str, Any], prefix: str = "") -> Dict[str, AliasTable]:
+    """Replace weighted lists in a config tree by their values and build their tables.
+
+    The config is modified in place, so ``get_config`` keeps returning plain
+    lists of values.
+
+    Args:
+        config (Dict[str, Any]): Loaded config tree
+        prefix (str): Dotted key of ``config``
+
+    Returns:
+        Dict[str, AliasTable]: Alias tables by dotted config key
+    """
+    tables = {}
+    for key, value in config.items():
+        path = f"{prefix}.{key}" if prefix else key
+        if isinstance(value, dict):
+            tables.update(compile_weighted_lists(value, path))
+        elif is_weighted_list(value):
+            values, weights = split_weighted_list(value)
+            config[key] = values
+            tables[path] = AliasTable(values, weights)
+    return tables
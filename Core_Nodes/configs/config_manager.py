@@ -3,6 +3,8 @@ import random
 import json
 from typing import Any, Dict, List, Optional
 
+from .alias_table import AliasTable, compile_weighted_lists
+
 class ConfigManager:
     """Manages configuration loading and access for theme handlers."""
     
@@ -13,6 +15,7 @@ class ConfigManager:
             seed (Optional[int]): Random seed for consistent generation
         """
         self.configs: Dict[str, Any] = {}
+        self.alias_tables: Dict[str, AliasTable] = {}
         self.random = random.Random(seed) if seed is not None else random.Random()
         self._load_configs()
     
@@ -34,6 +37,9 @@ class ConfigManager:
                 "default_color": "azure",
                 "available_colors": ["azure", "violet", "emerald", "ruby", "gold", "sapphire", "amber", "jade"]
             }
+        
+        # Compile weighted lists ({"value": ..., "weight": ...} entries) into alias tables
+        self.alias_tables = compile_weighted_lists(self.configs)
     
     def get_config(self, key: str) -> Any:
         """Get configuration value by key.
@@ -77,6 +83,36 @@ class ConfigManager:
             print(f"Error accessing configuration {key}: {str(e)}")
             raise  # Re-raise the exception to be handled by the caller
     
+    def get_alias_table(self, key: str) -> Optional[AliasTable]:
+        """Get the alias table of a weighted configuration list.
+        
+        Args:
+            key (str): Configuration key (e.g., 'logo.style_approaches')
+            
+        Returns:
+            Optional[AliasTable]: The table, or None if the list is not weighted
+        """
+        return self.alias_tables.get(key)
+    
+    def get_weighted_choice(self, key: str, rng: Optional[random.Random] = None) -> Any:
+        """Draw one entry of a configuration list, honoring its weights if any.
+        
+        Args:
+            key (str): Configuration key
+            rng (Optional[random.Random]): Random source, this manager's if None
+            
+        Returns:
+            Any: The drawn entry
+            
+        Raises:
+            KeyError: If the configuration key is not found
+        """
+        rng = rng or self.random
+        table = self.alias_tables.get(key)
+        if table is not None:
+            return table.sample(rng)
+        return rng.choice(self.get_config(key))
+    
     def set_seed(self, seed: int):
         """Set random seed for consistent generation.
         
@@ -0,0 +1,183 @@
+import random
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple
+
+from ..isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class ConstraintError(ValueError):
+    """Raised when a constraint rule refers to an unknown slot or value."""
+
+
+def compatible_pairs(table: Mapping[str, Sequence[str]]) -> List[Tuple[str, str]]:
+    """Turn a ``{value: [compatible values]}`` table into a list of pairs.
+
+    Args:
+        table (Mapping[str, Sequence[str]]): Compatible values of each value
+
+    Returns:
+        List[Tuple[str, str]]: (value, compatible value) pairs
+    """
+    return [(key, value) for key, values in table.items() for value in values]
+
+
+class ConstraintSet:
+    """Compatibility constraints between prompt slots, compiled into bitsets.
+
+    Each slot has a domain of values. For every constrained pair of slots,
+    each value of one slot maps to an integer bitmask of the values allowed
+    in the other. Sampling a slot ANDs the masks of the values already
+    drawn and picks among the remaining candidates, so there are no retry
+    loops and no lists to filter per call.
+
+    Rules use the config format:
+        {"slots": [a, b], "compatible": [[x, y], ...]}: values of a listed
+            here only go with their listed values of b (and vice versa);
+            values that are not listed are unrestricted
+        {"slots": [a, b], "incompatible": [[x, y], ...]}: x never goes with y
+        {"slots": [a, b], "distinct": true}: a and b never take the same value
+    """
+
+    def __init__(self, slots: Mapping[str, Sequence[str]], rules: Iterable[Mapping[str, Any]] = ()):
+        """Compile the constraints.
+
+        Args:
+            slots (Mapping[str, Sequence[str]]): Domain of each slot
+            rules (Iterable[Mapping[str, Any]]): Constraint rules
+
+        Raises:
+            ConstraintError: If a rule refers to an unknown slot or value
+        """
+        self.domains = {name: tuple(dict.fromkeys(values)) for name, values in slots.items()}
+        self.indices = {name: {value: i for i, value in enumerate(values)}
+                        for name, values in self.domains.items()}
+        self.full_masks = {name: (1 << len(values)) - 1 for name, values in self.domains.items()}
+        self.masks: Dict[Tuple[str, str], List[int]] = {}
+        self._candidates: Dict[Tuple[str, int], Tuple[str, ...]] = {}
+        for rule in rules:
+            self.add_rule(rule)
+
+    def _check_slot(self, slot: str):
+        if slot not in self.domains:
+            raise ConstraintError(f"Unknown constraint slot: {slot}")
+
+    def _index(self, slot: str, value: str) -> int:
+        try:
+            return self.indices[slot][value]
+        except KeyError:
+            raise ConstraintError(f"Unknown value for slot {slot}: {value}") from None
+
+    def _table(self, source: str, target: str) -> List[int]:
+        """Masks of ``target`` values allowed by each ``source`` value."""
+        table = self.masks.get((source, target))
+        if table is None:
+            table = [self.full_masks[target]] * len(self.domains[source])
+            self.masks[(source, target)] = table
+        return table
+
+    def _restrict(self, source: str, target: str, pairs: Sequence[Tuple[int, int]]):
+        allowed: Dict[int, int] = {}
+        for i, j in pairs:
+            allowed[i] = allowed.get(i, 0) | (1 << j)
+        table = self._table(source, target)
+        for i, mask in allowed.items():
+            table[i] &= mask
+
+    def add_rule(self, rule: Mapping[str, Any]):
+        """Compile one rule into the bitset tables.
+
+        Args:
+            rule (Mapping[str, Any]): Rule in the config format
+
+        Raises:
+            ConstraintError: If the rule is malformed or refers to unknown slots or values
+        """
+        slots = rule.get("slots", ())
+        if len(slots) != 2:
+            raise ConstraintError(f"Constraint rule needs exactly two slots: {rule}")
+        a, b = slots
+        self._check_slot(a)
+        self._check_slot(b)
+
+        if rule.get("distinct"):
+            for value, i in self.indices[a].items():
+                j = self.indices[b].get(value)
+                if j is not None:
+                    self._table(a, b)[i] &= ~(1 << j)
+                    self._table(b, a)[j] &= ~(1 << i)
+
+        pairs = [(self._index(a, x), self._index(b, y)) for x, y in rule.get("compatible", ())]
+        if pairs:
+            self._restrict(a, b, pairs)
+            self._restrict(b, a, [(j, i) for i, j in pairs])
+
+        for x, y in rule.get("incompatible", ()):
+            i, j = self._index(a, x), self._index(b, y)
+            self._table(a, b)[i] &= ~(1 << j)
+            self._table(b, a)[j] &= ~(1 << i)
+
+        self._candidates.clear()
+
+    def mask(self, slot: str, assigned: Mapping[str, str]) -> int:
+        """Bitmask of the values of ``slot`` compatible with the assigned slots.
+
+        Assigned values outside a slot's domain (e.g. custom text) add no constraint.
+        """
+        mask = self.full_masks[slot]
+        for other, value in assigned.items():
+            table = self.masks.get((other, slot))
+            if table is not None:
+                i = self.indices[other].get(value)
+                if i is not None:
+                    mask &= table[i]
+        return mask
+
+    def candidates(self, slot: str, assigned: Mapping[str, str]) -> Tuple[str, ...]:
+        """Values of ``slot`` compatible with the assigned slots, in domain order.
+
+        If the constraints leave nothing, the whole domain is returned.
+        """
+        mask = self.mask(slot, assigned)
+        key = (slot, mask)
+        values = self._candidates.get(key)
+        if values is None:
+            domain = self.domains[slot]
+            values = tuple(value for i, value in enumerate(domain) if mask >> i & 1)
+            if not values:
+                logger.warning("No value of %s satisfies the constraints for %s", slot, dict(assigned))
+                values = domain
+            self._candidates[key] = values
+        return values
+
+    def draw(self, slot: str, assigned: Dict[str, str], rng: Optional[random.Random] = None) -> str:
+        """Draw a value for ``slot`` and record it in ``assigned``.
+
+        Args:
+            slot (str): Slot to draw
+            assigned (Dict[str, str]): Values drawn so far, updated in place
+            rng (Optional[random.Random]): Random source, the random module if None
+
+        Returns:
+            str: The drawn value
+        """
+        value = (rng or random).choice(self.candidates(slot, assigned))
+        assigned[slot] = value
+        return value
+
+    def sample(self, slots: Sequence[str], assigned: Optional[Dict[str, str]] = None,
+               rng: Optional[random.Random] = None) -> Dict[str, str]:
+        """Draw several slots in order, each constrained by the previous ones.
+
+        Args:
+            slots (Sequence[str]): Slots to draw, in order
+            assigned (Optional[Dict[str, str]]): Values already fixed
+            rng (Optional[random.Random]): Random source, the random module if None
+
+        Returns:
+            Dict[str, str]: All assigned values
+        """
+        assigned = dict(assigned or {})
+        for slot in slots:
+            self.draw(slot, assigned, rng)
+        return assigned
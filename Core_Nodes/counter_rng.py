@@ -0,0 +1,100 @@
+"""
+Counter-based random numbers for the generator nodes.
+
+A draw is a pure function of ``(seed, family, index)``: the family name and
+seed are hashed into a SplitMix64 key and the ``index``-th output of that
+generator is computed directly. There is no shared mutable state, so nodes
+never reseed (or depend on) the global ``random`` module, can run
+concurrently, and any element of a batch can be drawn on its own.
+"""
+
+import hashlib
+import random
+from functools import lru_cache
+from typing import List, Sequence, TypeVar
+
+T = TypeVar("T")
+
+MASK64 = (1 << 64) - 1
+GOLDEN_GAMMA = 0x9E3779B97F4A7C15
+# Fresh seeds stay within the seed widget of every generator node
+RANDOM_SEED_MAX = 999999999
+
+
+def splitmix64(x: int) -> int:
+    """Return the SplitMix64 output for state ``x`` (advanced by one step)."""
+    z = (x + GOLDEN_GAMMA) & MASK64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASK64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASK64
+    return z ^ (z >> 31)
+
+
+@lru_cache(maxsize=1024)
+def family_key(family: str) -> int:
+    """Stable 64-bit key of a family name (``hash()`` is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(family.encode("utf-8"), digest_size=8).digest(), "little")
+
+
+def resolve_seed(seed) -> int:
+    """Return ``seed``, or a fresh random seed in ``[1, RANDOM_SEED_MAX]`` when it is unset or 0."""
+    if seed is None or seed <= 0:
+        return random.randint(1, RANDOM_SEED_MAX)
+    return seed
+
+
+class CounterRNG:
+    """
+    Stateless random stream of one ``(seed, family)`` pair.
+
+    Every method takes the draw ``index`` explicitly; the same index always
+    yields the same value.
+    """
+
+    __slots__ = ("seed", "family", "_key")
+
+    def __init__(self, seed: int, family: str = ""):
+        self.seed = seed
+        self.family = family
+        self._key = splitmix64((seed & MASK64) ^ family_key(family))
+
+    def bits(self, index: int) -> int:
+        """Return the 64 random bits of draw ``index``."""
+        return splitmix64((self._key + index * GOLDEN_GAMMA) & MASK64)
+
+    def random(self, index: int) -> float:
+        """Return a uniform float in [0, 1)."""
+        return (self.bits(index) >> 11) * (1.0 / (1 << 53))
+
+    def randbelow(self, n: int, index: int) -> int:
+        """Return an integer in [0, n) (multiply-shift, bias below n / 2**64)."""
+        return (self.bits(index) * n) >> 64
+
+    def randint(self, a: int, b: int, index: int) -> int:
+        """Return an integer in [a, b], both included."""
+        return a + self.randbelow(b - a + 1, index)
+
+    def choice(self, items: Sequence[T], index: int) -> T:
+        """Return one element of a non-empty sequence."""
+        return items[self.randbelow(len(items), index)]
+
+    def sample(self, items: Sequence[T], k: int, index: int = 0) -> List[T]:
+        """
+        Return ``k`` distinct positions of ``items`` (partial Fisher-Yates).
+
+        :param items: Population to draw from
+        :param k: Number of elements, at most ``len(items)``
+        :param index: First draw index used; the sample consumes ``k`` draws
+        :return: List of ``k`` elements
+        """
+        size = len(items)
+        if not 0 <= k <= size:
+            raise ValueError("Sample larger than population")
+        pool = list(items)
+        for i in range(k):
+            swap = i + self.randbelow(size - i, index + i)
+            pool[i], pool[swap] = pool[swap], pool[i]
+        return pool[:k]
+
+    def shuffled(self, items: Sequence[T], index: int = 0) -> List[T]:
+        """Return a shuffled copy of ``items``."""
+        return self.sample(items, len(items), index)
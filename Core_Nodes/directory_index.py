@@ -0,0 +1,87 @@
+import fnmatch
+import hashlib
+import os
+from typing import Iterator, NamedTuple, Optional, Sequence
+
+# Supported image extensions
+IMAGE_EXTENSIONS = ('.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp')
+
+
+class ImageEntry(NamedTuple):
+    """A single image file as recorded by the directory index."""
+    path: str
+    name: str
+    size: int
+    mtime_ns: int
+
+
+def _scan_level(directory: str, extensions: Sequence[str]):
+    """Return the sorted image entries and sub-directories of one directory level."""
+    files = []
+    subdirs = []
+    with os.scandir(directory) as it:
+        for entry in it:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                elif entry.is_file() and os.path.splitext(entry.name)[1].lower() in extensions:
+                    stat = entry.stat()
+                    files.append(ImageEntry(entry.path, entry.name, stat.st_size, stat.st_mtime_ns))
+            except OSError:
+                # File vanished or is unreadable between listing and stat
+                continue
+    files.sort(key=lambda e: e.name)
+    subdirs.sort()
+    return files, subdirs
+
+
+def _matches(entry: ImageEntry, directory: str, pattern: str) -> bool:
+    """Match a glob pattern against the file name or its path relative to the root."""
+    if fnmatch.fnmatch(entry.name, pattern):
+        return True
+    return fnmatch.fnmatch(os.path.relpath(entry.path, directory), pattern)
+
+
+def iter_image_entries(directory: str, recursive: bool = False,
+                       extensions: Sequence[str] = IMAGE_EXTENSIONS,
+                       pattern: Optional[str] = None) -> Iterator[ImageEntry]:
+    """
+    Yield image files under a directory in a stable, sorted order.
+
+    Uses ``os.scandir`` so the file type comes from the directory listing and
+    only image files are stat'ed. Sub-directories are visited after the files
+    of their parent when ``recursive`` is enabled. ``pattern`` is an optional
+    glob (e.g. ``"*.png"`` or ``"portraits/*"``) applied to each image.
+    """
+    if pattern in (None, "", "*"):
+        pattern = None
+    pending = [directory]
+    while pending:
+        current = pending.pop()
+        files, subdirs = _scan_level(current, extensions)
+        if pattern is None:
+            yield from files
+        else:
+            yield from (entry for entry in files if _matches(entry, directory, pattern))
+        if recursive:
+            # Reverse so the stack pops sub-directories in sorted order
+            pending.extend(reversed(subdirs))
+
+
+def directory_fingerprint(directory: str, recursive: bool = False,
+                          extensions: Sequence[str] = IMAGE_EXTENSIONS,
+                          pattern: Optional[str] = None) -> str:
+    """
+    Fingerprint the image contents of a directory.
+
+    Every image contributes its relative path, size and nanosecond mtime, so
+    adding, removing, renaming or editing a file changes the result. The hash
+    is fed entry by entry while scanning instead of building the full listing.
+    """
+    digest = hashlib.sha1()
+    digest.update(b"recursive" if recursive else b"flat")
+    digest.update((pattern or "*").encode("utf-8"))
+    for entry in iter_image_entries(directory, recursive, extensions, pattern):
+        rel_path = os.path.relpath(entry.path, directory)
+        digest.update(f"{rel_path}\0{entry.size}\0{entry.mtime_ns}\n".encode("utf-8", "surrogateescape"))
+    return digest.hexdigest()
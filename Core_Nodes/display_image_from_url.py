@@ -1,9 +1,10 @@
 import torch
-import requests
 from PIL import Image
 from io import BytesIO
 import numpy as np
 
+from .url_image_cache import CACHE_MODES, load_url_bytes
+
 class DisplayImageFromURL:
     def __init__(self):
         pass
@@ -17,20 +18,24 @@ class DisplayImageFromURL:
                     "default": ""
                 }),
             },
+            "optional": {
+                "cache_mode": (CACHE_MODES, {
+                    "default": "enable"
+                }),
+            },
         }
 
     RETURN_TYPES = ("IMAGE",)
     FUNCTION = "display_image"
     CATEGORY = "image"
 
-    def display_image(self, image_url):
+    def display_image(self, image_url, cache_mode="enable"):
         try:
-            # Download the image from URL
-            response = requests.get(image_url)
-            response.raise_for_status()  # Raise an exception for bad status codes
+            # Load the image bytes from the local cache or download them
+            content, _ = load_url_bytes(image_url, cache_mode)
             
             # Open the image using PIL
-            image = Image.open(BytesIO(response.content))
+            image = Image.open(BytesIO(content))
             
             # Convert to RGB if necessary
             if image.mode != 'RGB':
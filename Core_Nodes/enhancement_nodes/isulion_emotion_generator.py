@@ -1,5 +1,5 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_EmotionGenerator:
     emotions = [
@@ -29,15 +29,11 @@ class Isulion_EmotionGenerator:
 
     def generate_emotion(self, randomize, seed, emotion):
         if randomize == "enable":
-            # Set seed for reproducibility if provided
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "emotion")
 
             # Randomly select emotion
-            emotion = random.choice(self.emotions)
+            emotion = rng.choice(self.emotions, 0)
 
         # Create prompt with the emotion
         prompt = f"feeling {emotion.lower()}, emotional"
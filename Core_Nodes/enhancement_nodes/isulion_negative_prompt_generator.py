@@ -1,4 +1,4 @@
-import random
+from ..counter_rng import CounterRNG
 
 class IsulionNegativePromptGenerator:
     @classmethod
@@ -15,7 +15,7 @@ class IsulionNegativePromptGenerator:
     CATEGORY = "Isulion/Enhancement"
 
     def generate(self, seed=0, strictness="standard"):
-        random.seed(seed)
+        rng = CounterRNG(seed, "negative_prompt")
         
         # Common negative elements by category
         negative_elements = {
@@ -67,11 +67,12 @@ class IsulionNegativePromptGenerator:
         selected_negatives = negative_elements[strictness]
         # Randomly select a subset of negative elements
         num_elements = {
-            "basic": random.randint(3, 5),
-            "standard": random.randint(8, 12),
-            "strict": random.randint(15, 20)
+            "basic": (3, 5),
+            "standard": (8, 12),
+            "strict": (15, 20)
         }
+        low, high = num_elements[strictness]
         
-        negative_prompt = ", ".join(random.sample(selected_negatives, num_elements[strictness]))
+        negative_prompt = ", ".join(rng.sample(selected_negatives, rng.randint(low, high, 0), 1))
         
         return (negative_prompt,) 
\ No newline at end of file
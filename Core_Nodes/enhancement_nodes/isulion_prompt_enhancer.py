@@ -1,4 +1,4 @@
-import random
+from ..counter_rng import CounterRNG
 
 class IsulionPromptEnhancer:
     @classmethod
@@ -19,8 +19,6 @@ class IsulionPromptEnhancer:
     CATEGORY = "Isulion/Enhancement"
 
     def enhance(self, base_prompt, seed=0, enhancement_level="moderate", focus="detail"):
-        random.seed(seed)
-        
         enhancements = {
             "detail": {
                 "subtle": ["detailed", "fine", "precise", "clean", "polished", "neat", "crisp", "clear", "defined", "sharp"],
@@ -49,7 +47,7 @@ class IsulionPromptEnhancer:
             }
         }
         
-        enhancement = random.choice(enhancements[focus][enhancement_level])
+        enhancement = CounterRNG(seed, "enhancement").choice(enhancements[focus][enhancement_level], 0)
         enhanced_prompt = f"{base_prompt}, {enhancement}"
         
         return (enhanced_prompt,) 
\ No newline at end of file
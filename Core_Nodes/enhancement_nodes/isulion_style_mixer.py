@@ -1,4 +1,4 @@
-import random
+from ..counter_rng import CounterRNG
 
 class IsulionStyleMixer:
     @classmethod
@@ -17,8 +17,6 @@ class IsulionStyleMixer:
     CATEGORY = "Isulion/Enhancement"
 
     def mix(self, style1, style2, seed=0, blend_mode="balanced"):
-        random.seed(seed)
-        
         # Common connecting words for style mixing
         connectors = {
             "balanced": ["mixed with", "combined with", "blended with", "fused with"],
@@ -26,7 +24,7 @@ class IsulionStyleMixer:
             "style2_dominant": ["incorporating", "heavily influenced by", "dominated by elements of"]
         }
         
-        connector = random.choice(connectors[blend_mode])
+        connector = CounterRNG(seed, "style_mix").choice(connectors[blend_mode], 0)
         mixed_style = f"{style1} {connector} {style2}"
         
         return (mixed_style,) 
\ No newline at end of file
@@ -0,0 +1,9 @@
+import os
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a number from the environment, falling back to ``default`` if unset or malformed."""
+    try:
+        return float(os.getenv(name, default))
+    except ValueError:
+        return default
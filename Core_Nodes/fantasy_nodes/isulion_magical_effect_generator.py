@@ -1,21 +1,15 @@
-import random
+from ..config.vocabulary import get_flat_vocabulary, get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionMagicalEffectGenerator:
-    effects = {
-        "fire": ["blazing aura", "flame burst", "phoenix wings", "inferno vortex"],
-        "ice": ["frost crystals", "blizzard swirl", "arctic mist", "frozen aura"],
-        "lightning": ["crackling energy", "thunder bolts", "static field", "plasma arc"],
-        "nature": ["vine growth", "flower bloom", "leaf storm", "forest spirits"],
-        "arcane": ["magical runes", "mystic circles", "astral projection", "ethereal wisps"]
-    }
+    effects = get_vocabulary("node_magical_effects")
 
     @classmethod
     def INPUT_TYPES(s):
-        all_effects = [effect for sublist in s.effects.values() for effect in sublist]
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "effect": (all_effects,),
+                "effect": (list(get_flat_vocabulary("node_magical_effects")),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
@@ -30,16 +24,12 @@ class IsulionMagicalEffectGenerator:
 
     def generate(self, randomize, effect, seed=0, element="any"):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "magical_effect")
             
             if element != "any" and element in self.effects:
-                effect = random.choice(self.effects[element])
+                effect = rng.choice(self.effects[element], 0)
             else:
-                all_effects = [e for sublist in self.effects.values() for e in sublist]
-                effect = random.choice(all_effects)
+                effect = rng.choice(get_flat_vocabulary("node_magical_effects"), 0)
         
         return (effect, seed) 
\ No newline at end of file
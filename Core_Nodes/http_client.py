@@ -0,0 +1,212 @@
+"""
+Shared HTTP client for the Civitai and URL image nodes.
+
+All nodes go through one pooled ``requests.Session`` so connections (and their
+TLS handshakes) are reused across requests and node executions. Timeouts,
+retries and pool sizes can be tuned through environment variables:
+
+- ``ISULION_HTTP_CONNECT_TIMEOUT`` / ``ISULION_HTTP_READ_TIMEOUT`` (seconds)
+- ``ISULION_HTTP_RETRIES`` (retries after the first attempt)
+- ``ISULION_HTTP_POOL_HOSTS`` (hosts with a cached connection pool)
+- ``ISULION_HTTP_POOL_SIZE`` (keep-alive connections per host)
+- ``ISULION_HTTP_MAX_IMAGE_MB`` (largest image download accepted)
+- ``ISULION_HTTP_MAX_RETRY_AFTER`` (longest ``Retry-After`` waited out, in seconds)
+"""
+
+import email.utils
+import random
+import threading
+import time
+from typing import Optional, Tuple
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .env_utils import env_float
+from .rate_limiter import get_rate_limiter
+from .isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+CONNECT_TIMEOUT = env_float("ISULION_HTTP_CONNECT_TIMEOUT", 5.0)
+READ_TIMEOUT = env_float("ISULION_HTTP_READ_TIMEOUT", 10.0)
+MAX_RETRIES = int(env_float("ISULION_HTTP_RETRIES", 3))
+POOL_HOSTS = int(env_float("ISULION_HTTP_POOL_HOSTS", 8))
+POOL_SIZE = int(env_float("ISULION_HTTP_POOL_SIZE", 16))
+
+# Exponential backoff: base * 2 ** attempt, capped, with full jitter
+BACKOFF_BASE = 0.5
+BACKOFF_CAP = 8.0
+# Longer server-requested waits are not slept through, the response is returned
+MAX_RETRY_AFTER = env_float("ISULION_HTTP_MAX_RETRY_AFTER", 30.0)
+
+RETRY_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+MAX_IMAGE_BYTES = int(env_float("ISULION_HTTP_MAX_IMAGE_MB", 50) * 1024 * 1024)
+DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+
+class ContentRejected(requests.RequestException):
+    """Raised when a download is rejected from its headers or size."""
+
+
+_session = None
+_session_lock = threading.Lock()
+
+
+def get_session() -> requests.Session:
+    """Return the process-wide pooled session, creating it on first use."""
+    global _session
+    if _session is None:
+        with _session_lock:
+            if _session is None:
+                session = requests.Session()
+                # Retries are handled in request() so backoff and jitter stay under our control
+                adapter = HTTPAdapter(
+                    pool_connections=POOL_HOSTS,
+                    pool_maxsize=POOL_SIZE,
+                    max_retries=0,
+                )
+                session.mount("https://", adapter)
+                session.mount("http://", adapter)
+                session.headers["User-Agent"] = "ComfyUI-Isulion"
+                _session = session
+    return _session
+
+
+def backoff_delay(attempt: int) -> float:
+    """Return a jittered exponential backoff delay for a zero-based attempt."""
+    return random.uniform(0, min(BACKOFF_CAP, BACKOFF_BASE * (2 ** attempt)))
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header given in seconds or as an HTTP date."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at is None:
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def request(method: str, url: str, timeout=None, retries: Optional[int] = None,
+            rate_limited: bool = False, api_key: Optional[str] = None,
+            **kwargs) -> requests.Response:
+    """
+    Send a request through the shared session with retries.
+
+    Connection errors, timeouts and retryable status codes (429 and 5xx) are
+    retried with exponential backoff and jitter; a ``Retry-After`` header takes
+    precedence over the computed delay. The last response is returned as-is
+    once retries are exhausted, so callers keep using ``raise_for_status``.
+
+    With ``rate_limited`` every attempt first waits for the shared token bucket
+    of the host and ``api_key``, and a 429 pauses that bucket for all callers.
+    """
+    session = get_session()
+    if timeout is None:
+        timeout = (CONNECT_TIMEOUT, READ_TIMEOUT)
+    if retries is None:
+        retries = MAX_RETRIES
+    limiter = get_rate_limiter() if rate_limited else None
+
+    attempt = 0
+    while True:
+        if limiter is not None:
+            limiter.acquire(url, api_key)
+        try:
+            response = session.request(method, url, timeout=timeout, **kwargs)
+        except (requests.ConnectionError, requests.Timeout) as e:
+            if attempt >= retries:
+                raise
+            delay = backoff_delay(attempt)
+            logger.debug("%s %s failed (%s), retrying in %.2fs", method, url, e, delay)
+        else:
+            if response.status_code not in RETRY_STATUS_CODES or attempt >= retries:
+                return response
+            delay = parse_retry_after(response.headers.get("Retry-After"))
+            if delay is None:
+                delay = backoff_delay(attempt)
+            elif delay > MAX_RETRY_AFTER:
+                return response
+            logger.debug("%s %s returned %s, retrying in %.2fs",
+                          method, url, response.status_code, delay)
+            response.close()
+            if limiter is not None and response.status_code == 429:
+                # Queue behind the bucket instead of sleeping alone, so every
+                # caller sharing the token backs off together
+                limiter.pause(url, api_key, delay)
+                attempt += 1
+                continue
+
+        time.sleep(delay)
+        attempt += 1
+
+
+def get(url: str, **kwargs) -> requests.Response:
+    """GET through the shared session, see :func:`request`."""
+    return request("GET", url, **kwargs)
+
+
+def is_image_type(content_type: str) -> bool:
+    """
+    Whether a download with this content type may be an image.
+
+    Some hosts serve images untyped or as octet-stream; those are accepted and
+    left to the image decoder. Every image download path uses this check.
+    """
+    return (not content_type
+            or content_type.startswith("image/")
+            or content_type.startswith("application/octet-stream"))
+
+
+def download_image_bytes(url: str, max_bytes: Optional[int] = None,
+                         **kwargs) -> Tuple[bytes, str]:
+    """
+    Stream an image download, rejecting unsuitable content before the body.
+
+    The content type and length are checked from the response headers, so a
+    video or oversized file is dropped without downloading it, and the body is
+    read in chunks up to ``max_bytes`` (``ISULION_HTTP_MAX_IMAGE_MB``, default
+    50) in case the server does not announce its length.
+
+    Returns:
+        Tuple of (content bytes, lower-cased content type)
+
+    Raises:
+        ContentRejected: For non-image content or downloads over the size limit
+        requests.RequestException: When the request itself fails
+    """
+    if max_bytes is None:
+        max_bytes = MAX_IMAGE_BYTES
+
+    response = request("GET", url, stream=True, **kwargs)
+    with response:
+        response.raise_for_status()
+
+        content_type = response.headers.get("content-type", "").lower()
+        if not is_image_type(content_type):
+            raise ContentRejected(f"Not an image ({content_type}): {url}", response=response)
+
+        content_length = response.headers.get("content-length", "")
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            raise ContentRejected(
+                f"Image too large ({content_length} bytes): {url}", response=response
+            )
+
+        buffer = bytearray()
+        for chunk in response.iter_content(DOWNLOAD_CHUNK_SIZE):
+            buffer += chunk
+            if len(buffer) > max_bytes:
+                raise ContentRejected(
+                    f"Image exceeds {max_bytes} bytes: {url}", response=response
+                )
+    return bytes(buffer), content_type
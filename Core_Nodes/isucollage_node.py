@@ -1,7 +1,7 @@
 import torch
 import math
-import random
-import numpy
+
+from .counter_rng import CounterRNG
 
 class IsuCollageNode:
     """
@@ -13,8 +13,14 @@ class IsuCollageNode:
     def INPUT_TYPES(cls):
         return {
             "required": {
-                "images": ("IMAGE",),
                 "seed": ("INT", {"optional": True})
+            },
+            "optional": {
+                "images": ("IMAGE",),
+                "image_stream": ("ISULION_IMAGE_STREAM", {
+                    "tooltip": "Image stream from Isulion Load Images. When connected, the collage is "
+                               "built from every streamed image, one chunk at a time, instead of images."
+                }),
             }
         }
 
@@ -23,51 +29,48 @@ class IsuCollageNode:
     FUNCTION = "create_collage"
     CATEGORY = "Isulion/Image"
 
-    def create_collage(self, images, seed=None):
+    def create_collage(self, images=None, seed=None, image_stream=None):
         """
         Create a collage from input images with optional seed for randomization.
         
-        :param images: List of input image tensors
+        :param images: List of input image tensors (float32, float16 or uint8), used without a stream
         :param seed: Random seed for image placement
+        :param image_stream: Optional ImageStream; replaces images and is read chunk by chunk
         :return: Tuple containing the collage tensor
         """
-        # Set random seed if provided
-        if seed is not None:
-            torch.manual_seed(seed)
-            random.seed(seed)
-            numpy.random.seed(seed)
-        
-        # Shuffle images if seed is set
-        shuffled_images = list(images)
-        if seed is not None:
-            random.shuffle(shuffled_images)
+        if image_stream is not None:
+            # Plan the layout from image headers, then pull one chunk at a time
+            shapes = image_stream.shapes()
+            source = (image for chunk in image_stream for image in chunk)
+        else:
+            # Ensure all images are in the correct format (H, W, C)
+            source = [img.squeeze(0) if len(img.shape) == 4 else img for img in (images if images is not None else [])]
+            shapes = [(img.shape[0], img.shape[1]) for img in source]
         
         # Handle edge cases
-        if not shuffled_images:
+        if not shapes:
             raise ValueError("No images provided")
-        if len(shuffled_images) == 1:
+        if len(shapes) == 1:
             # Ensure the single image is in the correct 4D format
-            single_image = shuffled_images[0]
+            single_image = self._to_float(next(iter(source)))
             if len(single_image.shape) == 3:
                 single_image = single_image.unsqueeze(0)
             return (single_image,)
 
-        # Ensure all images are in the correct format (H, W, C)
-        processed_images = []
-        for img in shuffled_images:
-            # Convert 4D tensor to 3D if needed
-            if len(img.shape) == 4:
-                img = img.squeeze(0)
-            processed_images.append(img)
+        # Shuffle image order if seed is set (without touching the global RNGs)
+        order = list(range(len(shapes)))
+        if seed is not None:
+            order = CounterRNG(seed, "collage").shuffled(order)
         
-        # Distribute images into rows
-        rows = self._distribute_images(processed_images)
+        # Distribute images into rows and size every placement
+        rows = self._distribute_images(shapes, order)
+        placements = self._plan_rows(rows, shapes)
         
-        # Normalize rows
-        normalized_rows = self._normalize_rows(rows, 300)
+        # Paint each image into its row as it arrives
+        row_tensors = self._render_rows(rows, placements, source)
         
         # Stack rows to create final collage
-        collage_tensor = self._stack_rows(normalized_rows)
+        collage_tensor = self._stack_rows(row_tensors)
         
         # Ensure output is a 4D tensor (B, H, W, C)
         if len(collage_tensor.shape) == 3:
@@ -76,133 +79,120 @@ class IsuCollageNode:
         # Return as a single-element tuple for ComfyUI
         return (collage_tensor,)
 
-    def _distribute_images(self, images):
+    def _distribute_images(self, shapes, order):
         """
         Distribute images across rows to maximize canvas utilization.
         
-        :param images: List of image tensors
-        :return: List of rows with distributed images
+        :param shapes: (height, width) of every image
+        :param order: Image indices in (shuffled) input order
+        :return: List of rows, each a list of image indices
         """
         # Sort images by aspect ratio in descending order
-        aspect_ratios = [
-            img.shape[1] / img.shape[0]  # Width / Height 
-            for img in images
-        ]
         sorted_indices = sorted(
-            range(len(aspect_ratios)), 
-            key=lambda k: aspect_ratios[k], 
+            order,
+            key=lambda k: shapes[k][1] / shapes[k][0],  # Width / Height
             reverse=True
         )
         
         # Compute optimal row configuration
-        num_images = len(images)
-        num_rows = max(1, math.ceil(math.sqrt(num_images)))
+        num_rows = max(1, math.ceil(math.sqrt(len(shapes))))
         
         # Initialize rows
         rows = [[] for _ in range(num_rows)]
+        row_widths = [0] * num_rows
         
         # Distribute images across rows
         for idx in sorted_indices:
             # Find row with least total width
-            target_row = min(range(num_rows), key=lambda r: sum(
-                img.shape[1] for img in rows[r]
-            ))
-            rows[target_row].append(images[idx])
+            target_row = min(range(num_rows), key=lambda r: row_widths[r])
+            rows[target_row].append(idx)
+            row_widths[target_row] += shapes[idx][1]
         
-        return rows
+        # Skip empty rows
+        return [row for row in rows if row]
 
-    def _normalize_rows(self, rows, target_height):
+    def _plan_rows(self, rows, shapes):
         """
-        Normalize rows to completely fill the canvas with no empty spaces.
+        Compute the sizes every image is resized through to fill the canvas.
+        
+        Each image is first brought to the smallest height of its row, then
+        the whole row is scaled so every row reaches the widest row's width.
         
-        :param rows: List of image rows
-        :param target_height: Desired row height
-        :return: Normalized rows of images
+        :param rows: List of rows of image indices
+        :param shapes: (height, width) of every image
+        :return: Dict of image index to (consistent size, final size)
         """
         # Find the maximum total width across all rows
-        max_total_width = max(
-            sum(img.shape[1] for img in row) 
-            for row in rows
-        )
+        max_total_width = max(sum(shapes[idx][1] for idx in row) for row in rows)
         
-        normalized_rows = []
+        placements = {}
         for row in rows:
-            # Skip empty rows
-            if not row:
-                continue
-            
             # Compute consistent height for the row
-            row_heights = [img.shape[0] for img in row]
-            consistent_height = min(row_heights)
+            consistent_height = min(shapes[idx][0] for idx in row)
             
-            # Resize images to consistent height and calculate total width
-            resized_row = []
-            for img in row:
-                # Ensure tensor has 3 dimensions (H, W, C)
-                if len(img.shape) == 4:
-                    img = img.squeeze(0)
-                
-                # Calculate new width maintaining aspect ratio
-                aspect_ratio = img.shape[1] / img.shape[0]
-                new_width = int(consistent_height * aspect_ratio)
-                
-                # Resize image
-                resized_img = self._resize_to_exact(
-                    img, 
-                    (consistent_height, new_width)
-                )
-                resized_row.append(resized_img)
+            # Calculate new widths maintaining aspect ratio
+            consistent = {}
+            for idx in row:
+                height, width = shapes[idx]
+                consistent[idx] = (consistent_height, int(consistent_height * width / height))
             
-            # Normalize row width precisely
-            normalized_row = self._normalize_row_width(resized_row, max_total_width)
-            normalized_rows.append(normalized_row)
+            # Scale all images in the row proportionally to the target width
+            scale_factor = max_total_width / sum(size[1] for size in consistent.values())
+            for idx, (height, width) in consistent.items():
+                placements[idx] = (
+                    (height, width),
+                    (int(height * scale_factor), int(width * scale_factor)),
+                )
         
-        return normalized_rows
+        return placements
 
-    def _normalize_row_width(self, row, target_width):
+    def _render_rows(self, rows, placements, source):
         """
-        Normalize a single row to match the target width while preserving aspect ratios.
+        Resize images in arrival order and paint them into preallocated rows.
         
-        :param row: List of image tensors in a row
-        :param target_width: Desired total width for the row
-        :return: Normalized row with images scaled to match target width
+        Only the row canvases and the image being processed are held, so a
+        streamed source never has more than one chunk of inputs in memory.
+        
+        :param rows: List of rows of image indices
+        :param placements: Sizes from _plan_rows
+        :param source: Iterable of image tensors in index order
+        :return: List of row tensors (H, W, C)
         """
-        # Calculate total width and get scaling factor
-        current_width = sum(img.shape[1] for img in row)
-        scale_factor = target_width / current_width
+        offsets = {}
+        canvases = []
+        for row_number, row in enumerate(rows):
+            x = 0
+            for idx in row:
+                offsets[idx] = (row_number, x)
+                x += placements[idx][1][1]
+            canvases.append(None)
         
-        # Scale all images in the row proportionally
-        normalized_row = []
-        for img in row:
-            # Calculate new dimensions while preserving aspect ratio
-            new_height = int(img.shape[0] * scale_factor)
-            new_width = int(img.shape[1] * scale_factor)
+        for idx, img in enumerate(source):
+            if len(img.shape) == 4:
+                img = img.squeeze(0)
+            consistent_size, final_size = placements[idx]
+            resized = self._resize_to_exact(self._resize_to_exact(img, consistent_size), final_size)
             
-            # Resize image
-            resized_img = self._resize_to_exact(
-                img, 
-                (new_height, new_width)
-            )
-            normalized_row.append(resized_img)
+            row_number, x = offsets[idx]
+            if canvases[row_number] is None:
+                row_width = sum(placements[i][1][1] for i in rows[row_number])
+                canvases[row_number] = torch.zeros(
+                    (final_size[0], row_width, resized.shape[2]), dtype=resized.dtype
+                )
+            canvases[row_number][:, x:x + final_size[1]] = resized
         
-        return normalized_row
+        return canvases
 
     def _stack_rows(self, rows):
         """
         Stack rows vertically to create the final collage.
         
-        :param rows: List of rows, each row is a list of image tensors
+        :param rows: List of row tensors (H, W, C)
         :return: Final collage tensor
         """
-        # First concatenate each row horizontally
-        row_tensors = []
-        max_width = 0
-        
-        # First pass: concatenate rows and find max width
-        for row in rows:
-            row_tensor = torch.cat(row, dim=1)
-            row_tensors.append(row_tensor)
-            max_width = max(max_width, row_tensor.shape[1])
+        # Rows arrive already concatenated horizontally, find max width
+        row_tensors = list(rows)
+        max_width = max(row_tensor.shape[1] for row_tensor in row_tensors)
         
         # Second pass: ensure all rows have the same width
         normalized_rows = []
@@ -231,6 +221,22 @@ class IsuCollageNode:
             widths = [row.shape[1] for row in normalized_rows]
             raise RuntimeError(f"Failed to stack rows. Row widths: {widths}") from e
 
+    def _to_float(self, tensor):
+        """
+        Convert a compact image tensor to float32 in the 0-1 range.
+        
+        Images stay in their loaded precision until they are resized, so only
+        the image currently being processed is expanded to float32.
+        
+        :param tensor: Image tensor in float32, float16 or uint8
+        :return: float32 tensor
+        """
+        if tensor.dtype == torch.uint8:
+            return tensor.float().div_(255.0)
+        if tensor.dtype != torch.float32:
+            return tensor.float()
+        return tensor
+
     def _resize_to_exact(self, tensor, target_size):
         """
         Resize image tensor to exact size.
@@ -244,8 +250,8 @@ class IsuCollageNode:
         if len(tensor.shape) == 4:
             tensor = tensor.squeeze(0)
         
-        # Add batch dimension for interpolate
-        tensor_4d = tensor.unsqueeze(0).permute(0, 3, 1, 2)
+        # Add batch dimension for interpolate, which requires float input
+        tensor_4d = self._to_float(tensor).unsqueeze(0).permute(0, 3, 1, 2)
         
         resized_tensor = torch.nn.functional.interpolate(
             tensor_4d,
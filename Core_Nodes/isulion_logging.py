@@ -0,0 +1,46 @@
+"""
+Package-scoped logging for the Isulion nodes.
+
+Every module logs through a child of the ``isulion`` logger, so the package
+never touches the root logger or the level of other libraries running in
+ComfyUI. Records propagate to whatever handlers ComfyUI configured. The level
+is read once from ``ISULION_LOG_LEVEL`` (``DEBUG``, ``INFO``, ``WARNING``, ...;
+default ``INFO``).
+
+Use lazy ``%``-style arguments (``logger.debug("page %d", page)``) so messages
+below the level are never formatted, and guard expensive payload dumps with
+``logger.isEnabledFor(logging.DEBUG)``.
+"""
+
+import logging
+import os
+
+ROOT_LOGGER_NAME = "isulion"
+LOG_LEVEL_ENV = "ISULION_LOG_LEVEL"
+DEFAULT_LEVEL = logging.INFO
+
+_configured = False
+
+
+def _configure():
+    global _configured
+    if _configured:
+        return
+    level = logging.getLevelName(os.getenv(LOG_LEVEL_ENV, "").strip().upper() or DEFAULT_LEVEL)
+    if not isinstance(level, int):
+        level = DEFAULT_LEVEL
+    logging.getLogger(ROOT_LOGGER_NAME).setLevel(level)
+    _configured = True
+
+
+def get_logger(name: str) -> logging.Logger:
+    """
+    Return the package logger for a module.
+
+    :param name: The module's ``__name__``; the part up to ``Core_Nodes`` is
+        dropped, e.g. ``isulion.civitai_nodes.civitai_trending``
+    :return: Logger under the ``isulion`` namespace
+    """
+    _configure()
+    name = name.rsplit("Core_Nodes.", 1)[-1]
+    return logging.getLogger(f"{ROOT_LOGGER_NAME}.{name}")
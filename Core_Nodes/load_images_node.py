@@ -1,12 +1,194 @@
 import os
+from itertools import islice
 import torch
 import numpy as np
 from PIL import Image, ImageOps
 import folder_paths
 
+from .directory_index import directory_fingerprint, iter_image_entries
+from .isulion_logging import get_logger
+from .thumbnail_cache import ThumbnailCache, get_thumbnail_cache
+
+logger = get_logger(__name__)
+
+
+def _resolve_directory(directory):
+    """Resolve the node's directory argument to a full path."""
+    try:
+        return folder_paths.get_input_directory(directory)
+    except:
+        return os.path.abspath(os.path.expanduser(directory))
+
+
+def _select_images(full_directory, recursive=False, pattern="*", start_index=0, limit=0):
+    """
+    Lazily select the requested page of images from a directory.
+
+    :param full_directory: Resolved directory path
+    :param recursive: Also search sub-directories
+    :param pattern: Glob pattern applied to file names / relative paths
+    :param start_index: Number of matching images to skip
+    :param limit: Maximum number of images to return, 0 for no limit
+    :return: Iterator of ImageEntry
+    """
+    entries = iter_image_entries(full_directory, recursive=recursive, pattern=pattern)
+    stop = start_index + limit if limit > 0 else None
+    return islice(entries, start_index, stop)
+
+
+# EXIF orientations that rotate the image by 90 degrees
+_TRANSPOSED_ORIENTATIONS = (5, 6, 7, 8)
+
+
+def _resized_shape(size, target_row_height):
+    """
+    Return the (height, width) an image of the given size is resized to.
+
+    :param size: (width, height) of the upright image
+    :param target_row_height: Target height for image rows
+    :return: (height, width) tuple
+    """
+    original_width, original_height = size
+    aspect_ratio = original_width / original_height
+    return target_row_height, int(target_row_height * aspect_ratio)
+
+
+def _read_resized_shape(image_entry, target_row_height):
+    """
+    Compute the resized shape of an image from its header, without decoding pixels.
+
+    :param image_entry: ImageEntry of the image file from the directory index
+    :param target_row_height: Target height for image rows
+    :return: (height, width) tuple
+    """
+    with Image.open(image_entry.path) as img:
+        width, height = img.size
+        if img.getexif().get(0x0112) in _TRANSPOSED_ORIENTATIONS:
+            width, height = height, width
+    return _resized_shape((width, height), target_row_height)
+
+
+def _load_resized_array(image_entry, target_row_height, thumbnail_cache=None):
+    """
+    Decode and resize a single image to the target row height.
+
+    :param image_entry: ImageEntry of the image file from the directory index
+    :param target_row_height: Target height for image rows
+    :param thumbnail_cache: Optional ThumbnailCache used to skip decoding
+    :return: uint8 array of shape (H, W, 3), memory-mapped on cache hits
+    """
+    cache_key = None
+    if thumbnail_cache is not None:
+        cache_key = ThumbnailCache.make_key(
+            image_entry.path, image_entry.size, image_entry.mtime_ns, target_row_height
+        )
+        cached = thumbnail_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
+    # Open image
+    img = Image.open(image_entry.path)
+
+    # Correct orientation
+    img = ImageOps.exif_transpose(img)
+
+    # Convert to RGB
+    img = img.convert('RGB')
+
+    # Intelligent scaling to target row height, maintaining aspect ratio
+    new_height, new_width = _resized_shape(img.size, target_row_height)
+    resized_img = img.resize((new_width, new_height), Image.LANCZOS)
+    img_array = np.asarray(resized_img, dtype=np.uint8)
+
+    if thumbnail_cache is not None:
+        thumbnail_cache.put(cache_key, img_array)
+
+    return img_array
+
+
+# Precisions of the image stream. Compact formats never leave on the IMAGE
+# socket; IsuCollageNode converts them to float32 only when it needs to.
+PRECISIONS = ["float32", "float16", "uint8"]
+
+
+def _to_tensor(img_array, precision="float32"):
+    """
+    Convert a uint8 image array to a tensor in the requested precision.
+
+    :param img_array: uint8 array of shape (H, W, 3), possibly memory-mapped
+    :param precision: "float32" / "float16" (normalized to 0-1) or "uint8" (raw 0-255)
+    :return: Image tensor
+    """
+    if precision == "float32":
+        return torch.from_numpy(img_array.astype(np.float32) / 255.0)
+
+    # Own a writable copy, the array may be a read-only memory map
+    tensor = torch.from_numpy(np.array(img_array, dtype=np.uint8))
+    if precision == "uint8":
+        return tensor
+    if precision == "float16":
+        return tensor.to(torch.float16).div_(255.0)
+    raise ValueError(f"Unsupported precision: {precision}")
+
+
+class ImageStream:
+    """
+    Lazy, re-iterable sequence of image chunks from a directory.
+
+    Iterating yields lists of at most ``chunk_size`` image tensors, so a
+    consumer only ever holds one chunk in memory. Nothing is decoded until
+    iteration starts.
+    """
+
+    def __init__(self, full_directory, target_row_height=300, recursive=False, pattern="*",
+                 start_index=0, limit=0, chunk_size=16, use_cache=True, precision="float32"):
+        self.full_directory = full_directory
+        self.target_row_height = target_row_height
+        self.recursive = recursive
+        self.pattern = pattern
+        self.start_index = start_index
+        self.limit = limit
+        self.chunk_size = max(1, chunk_size)
+        self.use_cache = use_cache
+        self.precision = precision
+
+    def entries(self):
+        """Iterate over the selected ImageEntry records without decoding."""
+        return _select_images(
+            self.full_directory, self.recursive, self.pattern, self.start_index, self.limit
+        )
+
+    def __len__(self):
+        return sum(1 for _ in self.entries())
+
+    def shapes(self):
+        """
+        Return the (height, width) of every selected image after resizing.
+
+        Only image headers are read, so consumers can plan a layout before
+        pulling any chunk.
+        """
+        return [_read_resized_shape(entry, self.target_row_height) for entry in self.entries()]
+
+    def __iter__(self):
+        thumbnail_cache = get_thumbnail_cache() if self.use_cache else None
+        entries = self.entries()
+        while True:
+            chunk_entries = list(islice(entries, self.chunk_size))
+            if not chunk_entries:
+                return
+            yield [
+                _to_tensor(
+                    _load_resized_array(entry, self.target_row_height, thumbnail_cache),
+                    self.precision,
+                )
+                for entry in chunk_entries
+            ]
+
+
 class IsulionLoadImagesNode:
     """
-    A flexible image loading node that preserves image characteristics 
+    A flexible image loading node that preserves image characteristics
     and prepares images for dynamic collage generation.
     """
 
@@ -16,130 +198,126 @@ class IsulionLoadImagesNode:
             "required": {
                 "directory": ("STRING", {"default": "./input"}),
                 "target_row_height": ("INT", {"default": 300, "min": 100, "max": 1024, "step": 50}),
+            },
+            "optional": {
+                "recursive": (["disable", "enable"], {"default": "disable"}),
+                "pattern": ("STRING", {"default": "*"}),
+                "start_index": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "limit": ("INT", {"default": 0, "min": 0, "max": 0xffffffff}),
+                "streaming": (["disable", "enable"], {
+                    "default": "disable",
+                    "tooltip": "When enabled, images only carries the first chunk as a preview. "
+                               "Connect image_stream to IsuCollage to process every image chunk by chunk."
+                }),
+                "chunk_size": ("INT", {"default": 16, "min": 1, "max": 4096}),
+                "precision": (PRECISIONS, {
+                    "default": "float32",
+                    "tooltip": "Tensor precision of image_stream chunks. float16/uint8 are only understood "
+                               "by IsuCollage; the images output is always float32."
+                }),
+                "cache": (["enable", "disable"], {"default": "enable"}),
             }
         }
 
-    RETURN_TYPES = ("IMAGE",)
-    RETURN_NAMES = ("images",)
+    RETURN_TYPES = ("IMAGE", "ISULION_IMAGE_STREAM")
+    RETURN_NAMES = ("images", "image_stream")
     FUNCTION = "load_images"
     CATEGORY = "Isulion/Image"
 
-    def load_images(self, directory, target_row_height=300):
+    def load_images(self, directory, target_row_height=300, recursive="disable", pattern="*",
+                    start_index=0, limit=0, streaming="disable", chunk_size=16, precision="float32",
+                    cache="enable"):
         """
         Load images from a directory with intelligent processing.
-        
+
         :param directory: Path to directory containing images
         :param target_row_height: Target height for image rows
-        :return: Tensor of processed images
+        :param recursive: Also load images from sub-directories
+        :param pattern: Glob pattern selecting which images to load
+        :param start_index: Index of the first matching image to load
+        :param limit: Maximum number of images to load, 0 for all
+        :param streaming: Only decode the first chunk on images and defer the rest to the image stream
+        :param chunk_size: Number of images per chunk yielded by the image stream
+        :param precision: Tensor dtype of the image stream (float32, float16 or uint8)
+        :param cache: Reuse resized images from the on-disk thumbnail cache
+        :return: List of processed image tensors and a lazy image stream
         """
         # Resolve the full path
-        try:
-            full_directory = folder_paths.get_input_directory(directory)
-        except:
-            full_directory = os.path.abspath(os.path.expanduser(directory))
-        
+        full_directory = _resolve_directory(directory)
+
         # Validate directory exists
         if not os.path.isdir(full_directory):
             raise ValueError(f"Directory does not exist: {full_directory}")
-        
-        # Supported image extensions
-        image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp']
-        
-        # Get all image files in the directory
-        image_files = [
-            os.path.join(full_directory, f) for f in os.listdir(full_directory)
-            if os.path.isfile(os.path.join(full_directory, f)) and 
-               os.path.splitext(f)[1].lower() in image_extensions
-        ]
-        
-        # Sort files for consistent order
-        image_files.sort()
-        
+
+        stream_options = dict(
+            target_row_height=target_row_height,
+            recursive=recursive == "enable",
+            pattern=pattern,
+            start_index=start_index,
+            limit=limit,
+            chunk_size=chunk_size,
+            use_cache=cache == "enable",
+        )
+        # Compact precisions only travel on the stream socket; IMAGE stays float32
+        image_stream = ImageStream(full_directory, precision=precision, **stream_options)
+        float_stream = ImageStream(full_directory, precision="float32", **stream_options)
+
+        if streaming == "enable":
+            # Only materialize the first chunk as a preview, IsuCollage pulls the rest
+            processed_images = next(iter(float_stream), [])
+            total = len(image_stream)
+            if total > len(processed_images):
+                logger.info("Streaming enabled, images holds the first %d of %d images; "
+                            "use image_stream for all of them", len(processed_images), total)
+        else:
+            processed_images = [image for chunk in float_stream for image in chunk]
+
         # Check if any images were found
-        if not image_files:
+        if not processed_images:
             raise ValueError(f"No images found in directory: {full_directory}")
-        
-        # Process images
-        processed_images = []
-        
-        for image_path in image_files:
-            # Open image
-            img = Image.open(image_path)
-            
-            # Correct orientation
-            img = ImageOps.exif_transpose(img)
-            
-            # Convert to RGB
-            img = img.convert('RGB')
-            
-            # Calculate original aspect ratio
-            original_width, original_height = img.size
-            aspect_ratio = original_width / original_height
-            
-            # Intelligent scaling to target row height
-            new_height = target_row_height
-            new_width = int(new_height * aspect_ratio)
-            
-            # Resize maintaining aspect ratio
-            resized_img = img.resize((new_width, new_height), Image.LANCZOS)
-            
-            # Convert to numpy array and normalize
-            img_array = np.array(resized_img).astype(np.float32) / 255.0
-            
-            # Convert to tensor
-            img_tensor = torch.from_numpy(img_array)
-            
-            processed_images.append(img_tensor)
-        
+
         # Convert to tensor without forcing same size
         images_tensor = processed_images
-        
-        return (images_tensor,)
+
+        return (images_tensor, image_stream)
 
     @classmethod
-    def IS_CHANGED(cls, directory, **kwargs):
+    def IS_CHANGED(cls, directory, recursive="disable", pattern="*", **kwargs):
         """
-        Check if the directory contents have changed.
+        Fingerprint the directory contents so the node only re-runs when an
+        image is added, removed, renamed or modified.
         """
-        image_files = [
-            f for f in os.listdir(directory) 
-            if os.path.isfile(os.path.join(directory, f)) and 
-               os.path.splitext(f)[1].lower() in ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp']
-        ]
-        return hash(tuple(sorted(image_files)))
+        full_directory = _resolve_directory(directory)
+        if not os.path.isdir(full_directory):
+            return float("nan")
+        return directory_fingerprint(full_directory, recursive=recursive == "enable", pattern=pattern)
 
     @classmethod
-    def VALIDATE_INPUTS(cls, directory, **kwargs):
+    def VALIDATE_INPUTS(cls, directory, recursive="disable", pattern="*", **kwargs):
         """
         Validate the input directory.
-        
+
         :param directory: Directory to validate
+        :param recursive: Whether sub-directories are searched for images
+        :param pattern: Glob pattern selecting which images to load
         :return: True if valid, error message if not
         """
         try:
             # Resolve the full path
-            try:
-                full_directory = folder_paths.get_input_directory(directory)
-            except:
-                full_directory = os.path.abspath(os.path.expanduser(directory))
-            
+            full_directory = _resolve_directory(directory)
+
             # Check if directory exists
             if not os.path.isdir(full_directory):
                 return f"Directory '{directory}' cannot be found."
-            
-            # Supported image extensions
-            image_extensions = ['.png', '.jpg', '.jpeg', '.bmp', '.gif', '.webp']
-            
-            # Check if directory has any image files
-            image_files = [
-                f for f in os.listdir(full_directory)
-                if os.path.isfile(os.path.join(full_directory, f)) and 
-                   os.path.splitext(f)[1].lower() in image_extensions
-            ]
-            
-            if not image_files:
+
+            # Check if directory has any image files, stopping at the first one
+            first_image = next(iter_image_entries(
+                full_directory, recursive=recursive == "enable", pattern=pattern
+            ), None)
+
+            if first_image is None:
                 return f"No image files in directory '{directory}'."
-            
+
             return True
         except Exception as e:
             return f"Error validating directory: {str(e)}"
@@ -4,10 +4,16 @@ from typing import Dict, List, Tuple, Optional
 
 # Config imports
 from .configs.config_manager import ConfigManager
+from .isulion_logging import get_logger
+from .prompt_compaction import compact_components
+from .prompt_tokens import fit_to_budget
 
 # Import all theme handlers
 from .theme_handlers import *
 
+logger = get_logger(__name__)
+
+
 class ThemeRegistry:
     """Registry for managing theme handlers and their mappings."""
 
@@ -241,6 +247,8 @@ class IsulionMegaPromptV3:
                 "include_environment": (["yes", "no"], {"default": "yes"}),
                 "include_style": (["yes", "no"], {"default": "yes"}),
                 "include_effects": (["yes", "no"], {"default": "yes"}),
+                "max_tokens": ("INT", {"default": 0, "min": 0, "max": 1000}),
+                "compact_prompt": ("BOOLEAN", {"default": False}),
             }
         }
 
@@ -252,8 +260,17 @@ class IsulionMegaPromptV3:
     def generate(self, theme: str, complexity: str = "detailed", randomize: str = "enable",
                 seed: int = 0, custom_subject: str = "", custom_location: str = "",
                 include_environment: str = "yes", include_style: str = "yes",
-                include_effects: str = "yes", debug_mode: str = "off") -> Tuple[str, str, str, str, str, int]:
-        """Generate a prompt based on the given parameters."""
+                include_effects: str = "yes", debug_mode: str = "off",
+                max_tokens: int = 0, compact_prompt: bool = False) -> Tuple[str, str, str, str, str, int]:
+        """Generate a prompt based on the given parameters.
+
+        With compact_prompt, tags repeated across components are removed and
+        nested emphasis is rewritten as explicit weights before trimming.
+
+        With max_tokens > 0, the prompt is trimmed to that many CLIP tokens:
+        generic quality tags are dropped first, then the last fragments of
+        effects, style and environment, in that order.
+        """
         try:
             # Set seed if randomization is disabled
             if randomize == "disable":
@@ -280,20 +297,9 @@ class IsulionMegaPromptV3:
                 include_effects=include_effects
             )
             
-            if not isinstance(components, dict):
-                raise ValueError(f"Handler {internal_theme} returned invalid components: {components}")
-            
-            # Check for required components
-            if "subject" not in components:
-                raise ValueError(f"Handler {internal_theme} did not generate a subject")
-            
-            # Build final prompt
-            prompt = ", ".join(filter(None, [
-                components.get("subject", ""),
-                components.get("environment", "") if include_environment == "yes" else "",
-                components.get("style", "") if include_style == "yes" else "",
-                components.get("effects", "") if include_effects == "yes" else ""
-            ]))
+            prompt = self._assemble_prompt(internal_theme, components, include_environment,
+                                           include_style, include_effects, compact_prompt,
+                                           max_tokens, debug_mode == "on")
             
             return (
                 prompt,
@@ -315,3 +321,67 @@ class IsulionMegaPromptV3:
                 "Error in effect generation",
                 seed
             )
+
+    def generate_batch(self, theme: str, count: int, seed: int = 0,
+                       custom_subject: str = "", custom_location: str = "",
+                       include_environment: str = "yes", include_style: str = "yes",
+                       include_effects: str = "yes", max_tokens: int = 0,
+                       compact_prompt: bool = False) -> List[str]:
+        """Generate ``count`` prompts of one theme from a single seed.
+
+        Handlers with a ``generate_batch`` sampler draw the whole batch at
+        once; the others are called once per prompt. Each prompt is assembled
+        as in :meth:`generate`.
+        """
+        self.config_manager.set_seed(seed)
+        internal_theme = self.theme_registry.get_internal_theme(theme)
+        if internal_theme == "random":
+            internal_theme = self.theme_registry.get_random_theme()
+        
+        handler = self.theme_registry.get_handler(internal_theme)
+        if not handler:
+            raise ValueError(f"No handler found for theme {internal_theme}")
+        
+        options = dict(custom_subject=custom_subject, custom_location=custom_location,
+                       include_environment=include_environment, include_style=include_style,
+                       include_effects=include_effects)
+        if hasattr(handler, "generate_batch"):
+            batch = handler.generate_batch(count, **options)
+        else:
+            batch = [handler.generate(**options) for _ in range(count)]
+        
+        return [
+            self._assemble_prompt(internal_theme, components, include_environment, include_style,
+                                  include_effects, compact_prompt, max_tokens)
+            for components in batch
+        ]
+
+    @staticmethod
+    def _assemble_prompt(internal_theme: str, components: Dict[str, str],
+                         include_environment: str, include_style: str, include_effects: str,
+                         compact_prompt: bool, max_tokens: int, debug: bool = False) -> str:
+        """Join handler components into the final prompt, compacted and trimmed if asked."""
+        if not isinstance(components, dict):
+            raise ValueError(f"Handler {internal_theme} returned invalid components: {components}")
+        
+        # Check for required components
+        if "subject" not in components:
+            raise ValueError(f"Handler {internal_theme} did not generate a subject")
+        
+        # Build final prompt
+        parts = [
+            components.get("subject", ""),
+            components.get("environment", "") if include_environment == "yes" else "",
+            components.get("style", "") if include_style == "yes" else "",
+            components.get("effects", "") if include_effects == "yes" else ""
+        ]
+        if compact_prompt:
+            # compact_components logs the tokens it saved
+            parts, _ = compact_components(parts)
+        if max_tokens > 0:
+            prompt, token_count = fit_to_budget(parts, max_tokens)
+            if debug:
+                logger.debug("Prompt trimmed to %d tokens (budget %d)", token_count, max_tokens)
+        else:
+            prompt = ", ".join(filter(None, parts))
+        return prompt
@@ -1,5 +1,10 @@
 from typing import Dict, List, Tuple, Optional
+from .isulion_logging import get_logger
 from .mega_prompt_V3 import IsulionMegaPromptV3
+from .prompt_dedup import dedup_prompts
+
+logger = get_logger(__name__)
+
 
 class IsulionMultiplePromptGenerator:
     """Node that generates prompts for all available themes using a custom subject and location. """
@@ -194,6 +199,10 @@ class IsulionMultiplePromptGenerator:
             },
             "optional": {
                 **theme_checkboxes,
+                "prompts_per_theme": ("INT", {"default": 1, "min": 1, "max": 64,
+                                              "tooltip": "Prompts generated for each selected theme"}),
+                "compact_prompt": ("BOOLEAN", {"default": False}),
+                "dedup_threshold": ("FLOAT", {"default": 0.0, "min": 0.0, "max": 1.0, "step": 0.05}),
                 "theme_names": (all_themes, {"default": all_themes[0], "hidden": True})  # Hidden list of all themes with headers
             }
         }
@@ -215,6 +224,9 @@ class IsulionMultiplePromptGenerator:
                 custom_location: str,
                 seed: int,
                 theme_names: List[str],
+                prompts_per_theme: int = 1,
+                compact_prompt: bool = False,
+                dedup_threshold: float = 0.0,
                 **kwargs) -> Tuple[List[str], List[str]]:
         """Generate prompts based on selected themes."""
         
@@ -271,6 +283,20 @@ class IsulionMultiplePromptGenerator:
             try:
                 theme_seed = (seed + i) % 0xffffffffffffffff
                 
+                if prompts_per_theme > 1:
+                    # Draw all prompts of the theme in one batched call
+                    batch = self.mega_prompt.generate_batch(
+                        theme=theme,
+                        count=prompts_per_theme,
+                        seed=theme_seed,
+                        custom_subject=custom_subject,
+                        custom_location=custom_location,
+                        compact_prompt=compact_prompt
+                    )
+                    positives.extend(batch)
+                    names.extend(f"{theme} #{n + 1}" for n in range(len(batch)))
+                    continue
+                
                 prompt, subject, env, style, effects, _ = self.mega_prompt.generate(
                     theme=theme,
                     complexity="very detailed",
@@ -280,7 +306,8 @@ class IsulionMultiplePromptGenerator:
                     include_environment="yes",
                     include_style="yes",
                     include_effects="yes",
-                    randomize="disable"
+                    randomize="disable",
+                    compact_prompt=compact_prompt
                 )
                 
                 if not prompt.startswith("Error:"):
@@ -291,6 +318,14 @@ class IsulionMultiplePromptGenerator:
                 print(f"Error generating prompt for theme {theme}: {str(e)}")
                 continue
         
+        # Skip near-duplicate prompts (0 disables)
+        if dedup_threshold > 0 and positives:
+            kept = dedup_prompts(positives, dedup_threshold)
+            if len(kept) < len(positives):
+                logger.info("Skipped %d near-duplicate prompts", len(positives) - len(kept))
+            positives = [positives[i] for i in kept]
+            names = [names[i] for i in kept]
+        
         return positives, names
 
 class IsulionCategorySelector:
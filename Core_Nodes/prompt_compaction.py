@@ -0,0 +1,141 @@
+"""
+Post-assembly compaction of generated prompts.
+
+Theme handlers often repeat the same tags across components (a
+``((professional quality))`` in both subject and style) and write emphasis as
+nested parentheses. Compaction:
+
+- parses every top-level comma fragment into ``(text, weight)``, where each
+  wrapping ``(...)`` multiplies the weight by 1.1 as in ComfyUI;
+- drops repeated tags across all components, keeping the first position and
+  the strongest weight;
+- writes the weight back in its shortest form: nested parentheses for
+  small powers of 1.1 (``((tag))``), an explicit weight otherwise, so
+  ``((((tag))))`` becomes ``(tag:1.46)`` and ``(tag:1.1)`` becomes ``(tag)``.
+
+Fragment parsing is memoized per component string. Weighting syntax does not
+reach the text encoder, so the saved tokens come from the removed duplicates.
+"""
+
+from functools import lru_cache
+from typing import List, NamedTuple, Sequence, Tuple
+
+from .isulion_logging import get_logger
+from .prompt_tokens import count_tokens, normalize_text, split_fragments
+
+logger = get_logger(__name__)
+
+EMPHASIS_STEP = 1.1
+
+
+class Fragment(NamedTuple):
+    """One comma-separated prompt fragment."""
+    key: str
+    text: str
+    weight: float
+
+
+def _unwrap(text: str) -> Tuple[str, int]:
+    """Strip parentheses wrapping the whole fragment, returning (inner text, depth)."""
+    depth = 0
+    while len(text) >= 2 and text[0] == "(" and text[-1] == ")":
+        level = 0
+        for i, char in enumerate(text):
+            if char == "(" and (i == 0 or text[i - 1] != "\\"):
+                level += 1
+            elif char == ")" and text[i - 1] != "\\":
+                level -= 1
+                if level == 0 and i != len(text) - 1:
+                    return text, depth
+        if level != 0:
+            break
+        text = text[1:-1].strip()
+        depth += 1
+    return text, depth
+
+
+def parse_fragment(fragment: str) -> Fragment:
+    """
+    Parse a fragment into its text and effective weight.
+
+    :param fragment: Fragment such as ``((tag))``, ``(tag:1.3)`` or ``tag``
+    :return: Fragment with a normalized dedup key
+    """
+    text, depth = _unwrap(fragment.strip())
+    weight = 1.0
+    if depth:
+        head, sep, tail = text.rpartition(":")
+        try:
+            explicit = float(tail) if sep else None
+        except ValueError:
+            explicit = None
+        if explicit is not None:
+            text = head.strip()
+            weight = explicit * EMPHASIS_STEP ** (depth - 1)
+        else:
+            weight = EMPHASIS_STEP ** depth
+    return Fragment(normalize_text(text), text, round(weight, 2))
+
+
+def format_fragment(text: str, weight: float) -> str:
+    """Write a fragment with the shortest equivalent weight syntax."""
+    if weight == 1.0:
+        return text
+    explicit = f"({text}:{weight:g})"
+    depth = 1
+    while 2 * depth < len(explicit) - len(text):
+        if round(EMPHASIS_STEP ** depth, 2) == weight:
+            return "(" * depth + text + ")" * depth
+        depth += 1
+    return explicit
+
+
+@lru_cache(maxsize=4096)
+def parse_component(component: str) -> Tuple[Fragment, ...]:
+    """Parse a prompt component into fragments (memoized per component string)."""
+    return tuple(parse_fragment(fragment) for fragment in split_fragments(component))
+
+
+def compact_components(components: Sequence[str]) -> Tuple[List[str], int]:
+    """
+    Deduplicate tags across components and normalize their emphasis.
+
+    :param components: Prompt components in prompt order
+    :return: Tuple of (compacted components, tokens saved)
+    """
+    parsed = [parse_component(component or "") for component in components]
+
+    # First position and strongest weight of every tag
+    positions = {}
+    weights = {}
+    for c, fragments in enumerate(parsed):
+        for f, fragment in enumerate(fragments):
+            if fragment.key not in positions:
+                positions[fragment.key] = (c, f)
+                weights[fragment.key] = fragment.weight
+            elif fragment.weight > weights[fragment.key]:
+                weights[fragment.key] = fragment.weight
+
+    compacted = [
+        ", ".join(
+            format_fragment(fragment.text, weights[fragment.key])
+            for f, fragment in enumerate(fragments)
+            if positions[fragment.key] == (c, f)
+        )
+        for c, fragments in enumerate(parsed)
+    ]
+
+    saved = count_tokens(", ".join(filter(None, components))) - count_tokens(", ".join(filter(None, compacted)))
+    logger.debug("Prompt compaction saved %d tokens", saved)
+    return compacted, saved
+
+
+def compact_prompt(prompt: str) -> Tuple[str, int]:
+    """
+    Compact a single assembled prompt.
+
+    :param prompt: Comma-separated prompt
+    :return: Tuple of (compacted prompt, tokens saved)
+    """
+    compacted, saved = compact_components([prompt])
+    return compacted[0], saved
@@ -0,0 +1,192 @@
+"""
+Near-duplicate detection for prompt batches.
+
+Each prompt is reduced to its set of tags (top-level comma fragments,
+ignoring emphasis and case). Similarity is the Jaccard index of two tag
+sets. Comparing every pair is quadratic, so prompts get a MinHash signature
+and are bucketed with locality-sensitive hashing (LSH). Only prompts that
+share a bucket are compared exactly, which keeps large batches roughly
+linear.
+
+Prompts are processed in order and the first of a group of near-duplicates
+is the one kept.
+"""
+
+import hashlib
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Optional, Sequence, Tuple
+
+from .counter_rng import CounterRNG
+from .isulion_logging import get_logger
+from .prompt_compaction import parse_component
+
+logger = get_logger(__name__)
+
+NUM_PERMUTATIONS = 64
+MERSENNE_PRIME = (1 << 61) - 1
+MAX_HASH = (1 << 32) - 1
+
+# Probability that a pair exactly at the threshold shares an LSH bucket
+MIN_RECALL = 0.95
+
+
+def _permutations(count: int) -> Tuple[Tuple[int, int], ...]:
+    """Fixed (a, b) pairs of the universal hashes ``(a * x + b) mod p``."""
+    rng = CounterRNG(1, "minhash")
+    return tuple(
+        (rng.randint(1, MERSENNE_PRIME - 1, 2 * i), rng.randint(0, MERSENNE_PRIME - 1, 2 * i + 1))
+        for i in range(count)
+    )
+
+
+PERMUTATIONS = _permutations(NUM_PERMUTATIONS)
+
+
+@lru_cache(maxsize=16384)
+def tag_hash(tag: str) -> int:
+    """Stable 32-bit hash of a tag."""
+    return int.from_bytes(hashlib.blake2b(tag.encode("utf-8"), digest_size=4).digest(), "little")
+
+
+def tag_set(prompt: str) -> FrozenSet[str]:
+    """Return the normalized tags of a prompt."""
+    return frozenset(fragment.key for fragment in parse_component(prompt))
+
+
+def minhash(tags: FrozenSet[str]) -> Tuple[int, ...]:
+    """
+    Compute the MinHash signature of a tag set.
+
+    :param tags: Normalized tags
+    :return: ``NUM_PERMUTATIONS`` minimum hash values
+    """
+    hashes = [tag_hash(tag) for tag in tags]
+    if not hashes:
+        return (MAX_HASH,) * NUM_PERMUTATIONS
+    return tuple(
+        min(((a * h + b) % MERSENNE_PRIME) & MAX_HASH for h in hashes)
+        for a, b in PERMUTATIONS
+    )
+
+
+def jaccard(first: FrozenSet[str], second: FrozenSet[str]) -> float:
+    """Jaccard index of two tag sets (1.0 for two empty sets)."""
+    if not first and not second:
+        return 1.0
+    return len(first & second) / len(first | second)
+
+
+@lru_cache(maxsize=128)
+def choose_bands(threshold: float, num_perm: int = NUM_PERMUTATIONS) -> Tuple[int, int]:
+    """
+    Pick the LSH layout for a similarity threshold.
+
+    A pair with similarity ``s`` shares a bucket with probability
+    ``1 - (1 - s**rows)**bands``. This picks the largest number of rows per
+    band (the fewest spurious candidates) that still catches a pair at the
+    threshold with probability ``MIN_RECALL``; exact comparison removes the
+    spurious candidates.
+
+    :param threshold: Jaccard similarity threshold in (0, 1]
+    :param num_perm: Signature length
+    :return: Tuple of (bands, rows)
+    """
+    best = (num_perm, 1)
+    for rows in range(1, num_perm + 1):
+        if num_perm % rows:
+            continue
+        bands = num_perm // rows
+        if 1.0 - (1.0 - threshold ** rows) ** bands >= MIN_RECALL:
+            best = (bands, rows)
+    return best
+
+
+def find_near_duplicates(prompts: Sequence[str], threshold: float = 0.8) -> List[Optional[int]]:
+    """
+    Find prompts that are near-duplicates of an earlier prompt.
+
+    :param prompts: Prompts in batch order
+    :param threshold: Minimum tag Jaccard similarity of a near-duplicate
+    :return: For each prompt, the index of the earlier kept prompt it
+        duplicates, or None if it is kept
+    """
+    bands, rows = choose_bands(threshold)
+    buckets: Dict[Tuple[int, Tuple[int, ...]], List[int]] = {}
+    tag_sets = [tag_set(prompt) for prompt in prompts]
+    result: List[Optional[int]] = []
+
+    for i, tags in enumerate(tag_sets):
+        signature = minhash(tags)
+        keys = [(band, signature[band * rows:(band + 1) * rows]) for band in range(bands)]
+
+        duplicate_of = None
+        checked = set()
+        for key in keys:
+            for j in buckets.get(key, ()):
+                if j not in checked:
+                    checked.add(j)
+                    if jaccard(tags, tag_sets[j]) >= threshold:
+                        duplicate_of = j
+                        break
+            if duplicate_of is not None:
+                break
+
+        result.append(duplicate_of)
+        # Only kept prompts are indexed, so duplicates never chain
+        if duplicate_of is None:
+            for key in keys:
+                buckets.setdefault(key, []).append(i)
+
+    logger.debug("Found %d near-duplicates in %d prompts", sum(d is not None for d in result), len(prompts))
+    return result
+
+
+def dedup_prompts(prompts: Sequence[str], threshold: float = 0.8) -> List[int]:
+    """
+    Return the indices of the prompts to keep.
+
+    :param prompts: Prompts in batch order
+    :param threshold: Minimum tag Jaccard similarity of a near-duplicate
+    :return: Indices of prompts that are not near-duplicates of an earlier one
+    """
+    return [i for i, duplicate_of in enumerate(find_near_duplicates(prompts, threshold)) if duplicate_of is None]
+
+
+class IsulionPromptDedup:
+    """Drops or flags near-duplicate prompts in a prompt list before rendering."""
+
+    @classmethod
+    def INPUT_TYPES(cls):
+        return {
+            "required": {
+                "prompts": ("STRING", {"forceInput": True}),
+                "threshold": ("FLOAT", {"default": 0.8, "min": 0.05, "max": 1.0, "step": 0.05}),
+                "mode": (["drop", "flag"], {"default": "drop"}),
+            },
+            "optional": {
+                "names": ("STRING", {"forceInput": True}),
+            }
+        }
+
+    RETURN_TYPES = ("STRING", "STRING", "BOOLEAN", "INT")
+    RETURN_NAMES = ("prompts", "names", "is_duplicate", "duplicates")
+    FUNCTION = "dedup"
+    CATEGORY = "Isulion/Prompt Tools"
+    INPUT_IS_LIST = True
+    OUTPUT_IS_LIST = (True, True, True, False)
+
+    def dedup(self, prompts: List[str], threshold: List[float], mode: List[str],
+              names: Optional[List[str]] = None) -> Tuple[List[str], List[str], List[bool], int]:
+        """Remove (or mark) prompts too similar to an earlier prompt of the list."""
+        threshold = threshold[0]
+        mode = mode[0]
+        names = list(names or []) + [str(i) for i in range(len(names or []), len(prompts))]
+
+        flags = [d is not None for d in find_near_duplicates(prompts, threshold)]
+        duplicates = sum(flags)
+        logger.info("Prompt dedup: %d of %d prompts are near-duplicates", duplicates, len(prompts))
+
+        if mode == "flag":
+            return prompts, names, flags, duplicates
+        kept = [i for i, flag in enumerate(flags) if not flag]
+        return [prompts[i] for i in kept], [names[i] for i in kept], [False] * len(kept), duplicates
@@ -0,0 +1,269 @@
+"""
+CLIP token counting and token-budget trimming for generated prompts.
+
+Counts use the CLIP byte-level BPE (the tokenizer of the SD1/SDXL text
+encoders). The merge table is read offline from the tokenizer ComfyUI ships
+in ``comfy/sd1_tokenizer``, or from ``ISULION_CLIP_TOKENIZER_DIR`` (a folder
+holding ``merges.txt`` or ``bpe_simple_vocab_16e6.txt.gz``). When no merge
+table is found, counts fall back to a word-length heuristic that slightly
+overestimates.
+
+Prompt weighting syntax (``((tag))``, ``(tag:1.2)``) is stripped before
+counting, as ComfyUI does before tokenizing. Per-word BPE results and
+per-fragment counts are kept in LRU caches, since theme handlers repeat the
+same fragments across prompts.
+"""
+
+import gzip
+import html
+import importlib.util
+import math
+import os
+import re
+import threading
+from functools import lru_cache
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from .isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+# 77-token window minus the start and end tokens
+CLIP_CHUNK_TOKENS = 75
+
+TOKENIZER_DIR_ENV = "ISULION_CLIP_TOKENIZER_DIR"
+
+# CLIP's pre-tokenizer, with \p{L} / \p{N} expressed for the re module
+_WORD_PATTERN = re.compile(
+    r"""'s|'t|'re|'ve|'m|'ll|'d|[^\W\d_]+|\d|(?:[^\s\w]|_)+""",
+    re.IGNORECASE,
+)
+_WEIGHT_PATTERN = re.compile(r":\s*-?\d+(?:\.\d+)?\s*\)")
+_EMPHASIS_PATTERN = re.compile(r"(?<!\\)[()\[\]]")
+_SPACE_PATTERN = re.compile(r"\s+")
+
+# Generic quality tags that add little once a prompt is over budget
+LOW_VALUE_TAGS = frozenset([
+    "masterpiece", "best quality", "high quality", "highest quality", "top quality",
+    "professional quality", "high detail", "high details", "highly detailed",
+    "ultra detailed", "extremely detailed", "fine details", "intricate details",
+    "perfect composition", "perfect rendering", "perfect lighting", "perfect details",
+    "sharp focus", "4k", "8k", "uhd", "hdr", "award winning", "trending on artstation",
+    "professional", "detailed", "beautiful", "stunning", "amazing",
+])
+
+
+def strip_emphasis(text: str) -> str:
+    """Remove ComfyUI weighting syntax, keeping the weighted text."""
+    text = _WEIGHT_PATTERN.sub(")", text)
+    text = _EMPHASIS_PATTERN.sub("", text)
+    return text.replace("\\(", "(").replace("\\)", ")")
+
+
+def normalize_text(text: str) -> str:
+    """Apply CLIP's text cleanup (HTML unescape, whitespace, lowercase)."""
+    return _SPACE_PATTERN.sub(" ", html.unescape(html.unescape(text))).strip().lower()
+
+
+def _bytes_to_unicode() -> Dict[int, str]:
+    """CLIP's reversible byte to printable-character map."""
+    bs = list(range(ord("!"), ord("~") + 1)) + list(range(ord("¡"), ord("¬") + 1)) \
+        + list(range(ord("®"), ord("ÿ") + 1))
+    cs = bs[:]
+    n = 0
+    for b in range(256):
+        if b not in bs:
+            bs.append(b)
+            cs.append(256 + n)
+            n += 1
+    return dict(zip(bs, (chr(c) for c in cs)))
+
+
+class ClipBPE:
+    """Pure-Python CLIP BPE, only as much as needed to count tokens."""
+
+    def __init__(self, merges: Sequence[Tuple[str, str]]):
+        self.ranks = {pair: rank for rank, pair in enumerate(merges)}
+        self.byte_encoder = _bytes_to_unicode()
+        self._bpe = lru_cache(maxsize=65536)(self._bpe_uncached)
+
+    @classmethod
+    def from_file(cls, path: str) -> "ClipBPE":
+        """Load ``merges.txt`` (Hugging Face) or ``bpe_simple_vocab_16e6.txt.gz`` (OpenAI)."""
+        if path.endswith(".gz"):
+            with gzip.open(path, "rt", encoding="utf-8") as f:
+                # Same slice as OpenAI's simple_tokenizer
+                lines = f.read().split("\n")[1:49152 - 256 - 2 + 1]
+        else:
+            with open(path, "r", encoding="utf-8") as f:
+                lines = [line for line in f.read().split("\n") if line and not line.startswith("#version")]
+        merges = [tuple(line.split()) for line in lines if len(line.split()) == 2]
+        return cls(merges)
+
+    def _bpe_uncached(self, token: str) -> int:
+        word = list(token[:-1]) + [token[-1] + "</w>"]
+        ranks = self.ranks
+        while len(word) > 1:
+            best = None
+            best_rank = None
+            for pair in zip(word, word[1:]):
+                rank = ranks.get(pair)
+                if rank is not None and (best_rank is None or rank < best_rank):
+                    best, best_rank = pair, rank
+            if best is None:
+                break
+            first, second = best
+            merged = []
+            i = 0
+            while i < len(word):
+                if i < len(word) - 1 and word[i] == first and word[i + 1] == second:
+                    merged.append(first + second)
+                    i += 2
+                else:
+                    merged.append(word[i])
+                    i += 1
+            word = merged
+        return len(word)
+
+    def count(self, text: str) -> int:
+        """Return the number of BPE tokens of already-cleaned text."""
+        total = 0
+        for piece in _WORD_PATTERN.findall(text):
+            encoded = "".join(self.byte_encoder[b] for b in piece.encode("utf-8"))
+            total += self._bpe(encoded)
+        return total
+
+
+def heuristic_count(text: str) -> int:
+    """Estimate CLIP tokens without the merge table."""
+    total = 0
+    for piece in _WORD_PATTERN.findall(text):
+        if piece[0].isalpha():
+            total += max(1, math.ceil(len(piece) / 6))
+        else:
+            total += len(piece) if not piece[0].isdigit() else 1
+    return total
+
+
+def find_tokenizer_file() -> Optional[str]:
+    """Locate an offline CLIP merge table, or None."""
+    candidates = []
+    env_dir = os.getenv(TOKENIZER_DIR_ENV)
+    if env_dir:
+        candidates.append(env_dir)
+    try:
+        spec = importlib.util.find_spec("comfy")
+    except (ImportError, ValueError):
+        spec = None
+    if spec is not None and spec.submodule_search_locations:
+        for location in spec.submodule_search_locations:
+            candidates.append(os.path.join(location, "sd1_tokenizer"))
+
+    for directory in candidates:
+        for name in ("merges.txt", "bpe_simple_vocab_16e6.txt.gz"):
+            path = os.path.join(directory, name)
+            if os.path.isfile(path):
+                return path
+    return None
+
+
+_tokenizer = None
+_tokenizer_loaded = False
+_tokenizer_lock = threading.Lock()
+
+
+def get_tokenizer() -> Optional[ClipBPE]:
+    """Return the process-wide CLIP BPE, or None when no merge table is available."""
+    global _tokenizer, _tokenizer_loaded
+    if not _tokenizer_loaded:
+        with _tokenizer_lock:
+            if not _tokenizer_loaded:
+                path = find_tokenizer_file()
+                if path:
+                    try:
+                        _tokenizer = ClipBPE.from_file(path)
+                        logger.debug("Loaded CLIP merges from %s", path)
+                    except (OSError, UnicodeDecodeError) as e:
+                        logger.warning("Could not load CLIP merges from %s: %s", path, e)
+                else:
+                    logger.info("No CLIP tokenizer found, using estimated token counts")
+                _tokenizer_loaded = True
+    return _tokenizer
+
+
+@lru_cache(maxsize=8192)
+def count_tokens(text: str) -> int:
+    """
+    Count the CLIP tokens of a prompt or fragment (without start/end tokens).
+
+    :param text: Prompt text, weighting syntax allowed
+    :return: Token count (estimated when no tokenizer is available)
+    """
+    cleaned = normalize_text(strip_emphasis(text))
+    if not cleaned:
+        return 0
+    tokenizer = get_tokenizer()
+    return tokenizer.count(cleaned) if tokenizer else heuristic_count(cleaned)
+
+
+def split_fragments(text: str) -> List[str]:
+    """Split a prompt on top-level commas, keeping parenthesized groups whole."""
+    fragments = []
+    depth = 0
+    start = 0
+    for i, char in enumerate(text):
+        if char in "([" and (i == 0 or text[i - 1] != "\\"):
+            depth += 1
+        elif char in ")]" and depth and text[i - 1] != "\\":
+            depth -= 1
+        elif char == "," and depth == 0:
+            fragments.append(text[start:i].strip())
+            start = i + 1
+    fragments.append(text[start:].strip())
+    return [fragment for fragment in fragments if fragment]
+
+
+def is_low_value(fragment: str) -> bool:
+    """Whether a fragment is a generic quality tag."""
+    return normalize_text(strip_emphasis(fragment)) in LOW_VALUE_TAGS
+
+
+def fit_to_budget(components: Sequence[str], max_tokens: int) -> Tuple[str, int]:
+    """
+    Join prompt components, dropping fragments until the prompt fits.
+
+    Components are given from most to least important (e.g. subject,
+    environment, style, effects). Generic quality tags go first, then the
+    remaining fragments from the least important component backwards. The
+    first fragment of the first component is always kept, and the surviving
+    fragments stay in their original order.
+
+    :param components: Prompt components, most important first
+    :param max_tokens: Token budget, 0 or less for no limit
+    :return: Tuple of (prompt, token count)
+    """
+    fragments = []
+    for rank, component in enumerate(components):
+        for position, fragment in enumerate(split_fragments(component or "")):
+            fragments.append((rank, position, fragment))
+
+    # Each ", " separator costs one token
+    costs = [count_tokens(fragment) + 1 for _, _, fragment in fragments]
+    total = sum(costs) - 1 if fragments else 0
+    if max_tokens <= 0 or total <= max_tokens:
+        return ", ".join(fragment for _, _, fragment in fragments), total
+
+    drop_order = sorted(
+        range(1, len(fragments)),
+        key=lambda i: (not is_low_value(fragments[i][2]), -fragments[i][0], -fragments[i][1]),
+    )
+    dropped = set()
+    for i in drop_order:
+        if total <= max_tokens:
+            break
+        dropped.add(i)
+        total -= costs[i]
+
+    kept = [fragment for i, (_, _, fragment) in enumerate(fragments) if i not in dropped]
+    logger.debug("Dropped %d of %d fragments to fit %d tokens", len(dropped), len(fragments), max_tokens)
+    return ", ".join(kept), total
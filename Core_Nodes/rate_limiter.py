@@ -0,0 +1,170 @@
+"""
+Process-wide rate limiting for API requests.
+
+Requests are throttled with one token bucket per (host, API token) pair, so
+every node talking to the same account shares a budget. Callers that exceed
+the budget are queued in arrival order instead of failing, and a 429 with
+``Retry-After`` pauses the whole bucket. The bucket restarts empty when the
+pause ends, so queued callers resume at the sustained rate instead of all at
+once. Rates can be tuned through:
+
+- ``ISULION_API_RATE`` (sustained requests per second, default 5)
+- ``ISULION_API_BURST`` (bucket capacity, default 10)
+"""
+
+import hashlib
+import threading
+import time
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlparse
+
+from .env_utils import env_float
+from .isulion_logging import get_logger
+
+logger = get_logger(__name__)
+
+
+DEFAULT_RATE = env_float("ISULION_API_RATE", 5.0)
+DEFAULT_BURST = env_float("ISULION_API_BURST", 10.0)
+
+
+class TokenBucket:
+    """
+    Token bucket that reserves a slot for every caller.
+
+    ``acquire`` may take the token count negative: each caller is assigned the
+    time its token becomes available and sleeps outside the lock, so waiters
+    are served in arrival order without busy polling. Callers still asleep
+    when the bucket is paused reserve again, behind the pause.
+    """
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: float = DEFAULT_BURST):
+        self.rate = max(rate, 1e-6)
+        self.capacity = max(capacity, 1.0)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._pauses = 0
+        self._lock = threading.Lock()
+
+        # Metrics
+        self.requests = 0
+        self.delayed = 0
+        self.throttled = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _reserve(self) -> Tuple[float, int]:
+        """Take a token and return how long the caller must wait for it, with the pause count."""
+        with self._lock:
+            now = time.monotonic()
+            # Tokens do not refill during a pause, which leaves _updated in the future
+            start = max(now, self._updated)
+            self._tokens = min(self.capacity, self._tokens + (start - self._updated) * self.rate)
+            self._updated = start
+            self._tokens -= 1
+            wait = start - now
+            if self._tokens < 0:
+                wait += -self._tokens / self.rate
+            return wait, self._pauses
+
+    def acquire(self) -> float:
+        """Block until a request may be sent, returning the time waited."""
+        waited = 0.0
+        while True:
+            wait, pauses = self._reserve()
+            if wait <= 0:
+                break
+            time.sleep(wait)
+            waited += wait
+            with self._lock:
+                if self._pauses == pauses:
+                    break
+            # The bucket was paused while sleeping: queue again behind the pause
+
+        with self._lock:
+            self.requests += 1
+            if waited > 0:
+                self.delayed += 1
+                self.total_wait += waited
+                self.max_wait = max(self.max_wait, waited)
+        return waited
+
+    def pause(self, delay: float):
+        """Hold back every caller for ``delay`` seconds, e.g. after a 429."""
+        with self._lock:
+            self.throttled += 1
+            until = time.monotonic() + delay
+            if until > self._updated:
+                # Restart with a single token at the end of the pause so the
+                # queued callers are released one refill interval apart
+                self._updated = until
+                self._tokens = 1.0
+                self._pauses += 1
+
+    def stats(self) -> Dict[str, float]:
+        with self._lock:
+            return {
+                "requests": self.requests,
+                "delayed": self.delayed,
+                "throttled": self.throttled,
+                "total_wait": self.total_wait,
+                "max_wait": self.max_wait,
+                "mean_wait": self.total_wait / self.requests if self.requests else 0.0,
+            }
+
+
+class RateLimiter:
+    """Registry of token buckets keyed by API host and token."""
+
+    def __init__(self, rate: float = DEFAULT_RATE, capacity: float = DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = capacity
+        self._buckets: Dict[Tuple[str, str], TokenBucket] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(url: str, api_key: Optional[str] = None) -> Tuple[str, str]:
+        token_hash = hashlib.sha256(api_key.encode("utf-8")).hexdigest()[:16] if api_key else ""
+        return urlparse(url).netloc.lower(), token_hash
+
+    def bucket(self, url: str, api_key: Optional[str] = None) -> TokenBucket:
+        key = self.make_key(url, api_key)
+        with self._lock:
+            bucket = self._buckets.get(key)
+            if bucket is None:
+                bucket = self._buckets[key] = TokenBucket(self.rate, self.capacity)
+            return bucket
+
+    def acquire(self, url: str, api_key: Optional[str] = None) -> float:
+        """Block until a request to ``url`` may be sent, returning the time waited."""
+        wait = self.bucket(url, api_key).acquire()
+        if wait > 0:
+            logger.debug("Rate limited %s for %.2fs", urlparse(url).netloc, wait)
+        return wait
+
+    def pause(self, url: str, api_key: Optional[str], delay: float):
+        """Pause all requests sharing the bucket of ``url`` for ``delay`` seconds."""
+        self.bucket(url, api_key).pause(delay)
+
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return the wait metrics of every bucket, keyed by host."""
+        with self._lock:
+            buckets = list(self._buckets.items())
+        return {
+            f"{host}#{token_hash}" if token_hash else host: bucket.stats()
+            for (host, token_hash), bucket in buckets
+        }
+
+
+_default_limiter = None
+_default_limiter_lock = threading.Lock()
+
+
+def get_rate_limiter() -> RateLimiter:
+    """Return the process-wide rate limiter."""
+    global _default_limiter
+    if _default_limiter is None:
+        with _default_limiter_lock:
+            if _default_limiter is None:
+                _default_limiter = RateLimiter()
+    return _default_limiter
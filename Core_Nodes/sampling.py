@@ -0,0 +1,48 @@
+"""
+Seeded list sampling shared by the generator nodes.
+
+Draws come from :class:`counter_rng.CounterRNG`, so output ``i`` of a batch
+depends only on ``(seed, family, i)``: the first ``n`` values do not change
+when ``count`` grows and a given index can be reproduced on its own. Sampling
+without replacement is a partial Fisher-Yates shuffle driven by the same
+per-index draws; once every item has been used, a new round starts.
+"""
+
+from typing import List, Sequence
+
+from .counter_rng import CounterRNG
+
+SAMPLING_MODES = ["with replacement", "without replacement"]
+MAX_COUNT = 1024
+
+
+def sample_items(items: Sequence[str], count: int, seed: int,
+                 mode: str = "with replacement", family: str = "") -> List[str]:
+    """
+    Draw ``count`` items in one call.
+
+    :param items: Vocabulary to draw from
+    :param count: Number of items to return
+    :param seed: Node seed
+    :param mode: One of ``SAMPLING_MODES``
+    :param family: Name that separates the streams of nodes sharing a seed
+    :return: List of ``count`` items (empty if ``items`` is empty)
+    """
+    if not items or count <= 0:
+        return []
+
+    rng = CounterRNG(seed, family)
+    if mode != "without replacement":
+        return [rng.choice(items, i) for i in range(count)]
+
+    size = len(items)
+    result = []
+    pool = []
+    for i in range(count):
+        position = i % size
+        if position == 0:
+            pool = list(items)
+        swap = position + rng.randbelow(size - position, i)
+        pool[position], pool[swap] = pool[swap], pool[position]
+        result.append(pool[position])
+    return result
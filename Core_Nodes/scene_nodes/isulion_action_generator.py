@@ -1,14 +1,15 @@
-import random
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionActionGenerator:
+    actions = get_vocabulary("node_actions")
+
     @classmethod
     def INPUT_TYPES(s):
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "action": (["running", "jumping", "fighting", "casting spell", "dancing",
-                          "flying", "swimming", "climbing", "meditating", "reading",
-                          "wielding weapon", "performing ritual", "crafting"],),
+                "action": (list(s.actions),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
@@ -22,12 +23,9 @@ class IsulionActionGenerator:
 
     def generate(self, randomize, action, seed=0):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "action")
             
-            action = random.choice(self.INPUT_TYPES()["required"]["action"][0])
+            action = rng.choice(self.actions, 0)
         
         return (action, seed) 
\ No newline at end of file
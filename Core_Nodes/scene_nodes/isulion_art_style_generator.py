@@ -1,17 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_ArtStyleGenerator:
-    styles = [
-        'Realistic', 'Watercolor', 'Oil Painting', 'Sketch', 'Digital Art',
-        'Impressionism', 'Expressionism', 'Surrealism', 'Pop Art', 'Abstract',
-        'Minimalist', 'Comic Book', 'Manga', 'Anime', 'Pixel Art',
-        'Vector Art', 'Low Poly', '3D Rendering', 'Concept Art', 'Fantasy Art',
-        'Gothic', 'Baroque', 'Renaissance', 'Art Nouveau', 'Art Deco',
-        'Cubism', 'Pointillism', 'Photorealism', 'Hyperrealism', 'Naive Art',
-        'Folk Art', 'Street Art', 'Graffiti', 'Retro', 'Vintage',
-        'Steampunk', 'Cyberpunk', 'Vaporwave', 'Ukiyo-e', 'Chinese Painting'
-    ]
+    styles = get_vocabulary("node_art_styles")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -19,7 +11,7 @@ class Isulion_ArtStyleGenerator:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "style": (cls.styles,)
+                "style": (list(cls.styles),)
             }
         }
 
@@ -30,13 +22,10 @@ class Isulion_ArtStyleGenerator:
 
     def generate_style(self, randomize, seed, style):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "art_style")
 
-            style = random.choice(self.styles)
+            style = rng.choice(self.styles, 0)
 
         return (f"{style}", seed)
 
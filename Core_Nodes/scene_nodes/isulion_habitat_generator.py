@@ -1,16 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_HabitatGenerator:
-    habitats = [
-        'Jungle', 'Rainforest', 'Savanna', 'Desert', 'Arctic Tundra', 'Ocean', 'Coral Reef',
-        'Mountain Range', 'Alpine Forest', 'Grassland', 'Wetland', 'Mangrove Swamp',
-        'Deciduous Forest', 'Coniferous Forest', 'Rocky Shore', 'Sandy Beach', 'Cave System',
-        'River Valley', 'Lake Shore', 'Bamboo Forest', 'Salt Marsh', 'Kelp Forest',
-        'Volcanic Region', 'Coastal Cliff', 'Prairie', 'Steppe', 'Taiga', 'Deep Ocean',
-        'Shallow Reef', 'Underground Cave', 'Hot Spring', 'Oasis', 'Canyon', 'Delta',
-        'Estuary', 'Fjord', 'Glacier', 'Ice Sheet', 'Island', 'Peninsula'
-    ]
+    habitats = get_vocabulary("node_habitats")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -18,7 +11,7 @@ class Isulion_HabitatGenerator:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "habitat": (cls.habitats,)
+                "habitat": (list(cls.habitats),)
             }
         }
 
@@ -29,13 +22,10 @@ class Isulion_HabitatGenerator:
 
     def generate_habitat(self, randomize, seed, habitat):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "habitat")
 
-            habitat = random.choice(self.habitats)
+            habitat = rng.choice(self.habitats, 0)
 
         return (f"{habitat}", seed)
 
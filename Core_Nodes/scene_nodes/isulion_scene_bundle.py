@@ -0,0 +1,59 @@
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
+from ..enhancement_nodes.isulion_emotion_generator import Isulion_EmotionGenerator
+
+
+class IsulionSceneBundle:
+    """Samples several scene attribute families in a single node execution.
+
+    Replaces a chain of single-attribute generator nodes: every enabled family
+    is drawn from the same seed and returned on its own output, plus a joined
+    prompt fragment. Each family has its own counter-based stream keyed by the
+    seed, so enabling or disabling one family never changes the others.
+    """
+
+    # (family, vocabulary, prompt fragment template), in output order
+    families = (
+        ("animal", get_vocabulary("node_animals"), "{}"),
+        ("behavior", get_vocabulary("node_animal_behaviors"), "{}"),
+        ("habitat", get_vocabulary("node_habitats"), "in a {}"),
+        ("weather", get_vocabulary("node_weather"), "{} weather"),
+        ("time_of_day", get_vocabulary("node_times"), "at {}"),
+        ("action", get_vocabulary("node_actions"), "{}"),
+        ("composition", get_vocabulary("node_compositions"), "{}"),
+        ("emotion", tuple(Isulion_EmotionGenerator.emotions), "feeling {}"),
+        ("art_style", get_vocabulary("node_art_styles"), "{} style"),
+    )
+
+    @classmethod
+    def INPUT_TYPES(s):
+        return {
+            "required": {
+                "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
+                **{f"include_{family}": (["enable", "disable"],) for family, _, _ in s.families},
+            },
+            "optional": {
+                "separator": ("STRING", {"default": ", "}),
+            }
+        }
+
+    RETURN_TYPES = ("STRING",) * 10 + ("INT",)
+    RETURN_NAMES = ("prompt", "animal", "behavior", "habitat", "weather", "time_of_day",
+                    "action", "composition", "emotion", "art_style", "seed",)
+    FUNCTION = "generate"
+    CATEGORY = "Isulion/Scene"
+
+    def generate(self, seed=0, separator=", ", **includes):
+        seed = resolve_seed(seed)
+
+        values = []
+        fragments = []
+        for family, vocabulary, template in self.families:
+            if includes.get(f"include_{family}", "enable") != "enable":
+                values.append("")
+                continue
+            value = CounterRNG(seed, family).choice(vocabulary, 0)
+            values.append(value)
+            fragments.append(template.format(value.lower() if family == "emotion" else value))
+
+        return (separator.join(fragments), *values, seed)
@@ -1,14 +1,15 @@
-import random
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionSceneComposition:
+    compositions = get_vocabulary("node_compositions")
+
     @classmethod
     def INPUT_TYPES(s):
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "composition": (["close-up shot", "wide angle", "birds eye view", "low angle",
-                               "dutch angle", "panoramic view", "portrait shot", "action shot",
-                               "dramatic angle", "symmetrical composition"],),
+                "composition": (list(s.compositions),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
@@ -22,12 +23,9 @@ class IsulionSceneComposition:
 
     def generate(self, randomize, composition, seed=0):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "composition")
             
-            composition = random.choice(self.INPUT_TYPES()["required"]["composition"][0])
+            composition = rng.choice(self.compositions, 0)
         
         return (composition, seed) 
\ No newline at end of file
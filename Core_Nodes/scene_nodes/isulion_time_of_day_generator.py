@@ -1,15 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_TimeOfDayGenerator:
-    times = [
-        'Dawn', 'Sunrise', 'Early Morning', 'Morning', 'Late Morning', 'Noon',
-        'Early Afternoon', 'Afternoon', 'Late Afternoon', 'Golden Hour',
-        'Sunset', 'Dusk', 'Twilight', 'Evening', 'Night', 'Midnight',
-        'Blue Hour', 'First Light', 'Magic Hour', 'Civil Twilight',
-        'Astronomical Twilight', 'Nautical Twilight', 'Witching Hour',
-        'Pre-dawn', 'Post-sunset'
-    ]
+    times = get_vocabulary("node_times")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -17,7 +11,7 @@ class Isulion_TimeOfDayGenerator:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "time": (cls.times,)
+                "time": (list(cls.times),)
             }
         }
 
@@ -28,13 +22,10 @@ class Isulion_TimeOfDayGenerator:
 
     def generate_time(self, randomize, seed, time):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "time_of_day")
 
-            time = random.choice(self.times)
+            time = rng.choice(self.times, 0)
 
         return (f"{time}", seed)
 
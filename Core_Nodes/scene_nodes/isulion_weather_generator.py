@@ -1,15 +1,9 @@
-import random
 from nodes import NODE_CLASS_MAPPINGS
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class Isulion_WeatherGenerator:
-    weather_conditions = [
-        'Sunny', 'Cloudy', 'Partly Cloudy', 'Overcast', 'Rainy', 'Heavy Rain',
-        'Thunderstorm', 'Lightning Storm', 'Snowy', 'Blizzard', 'Foggy', 'Misty',
-        'Clear Sky', 'Stormy', 'Windy', 'Breezy', 'Hazy', 'Dusty', 'Sandstorm',
-        'Drizzle', 'Sleet', 'Hail', 'Rainbow', 'Double Rainbow', 'Aurora Borealis',
-        'Heat Wave', 'Humid', 'Dry', 'Frost', 'Ice Storm', 'Tornado', 'Hurricane',
-        'Tropical Storm', 'Monsoon', 'Clear Night', 'Starry Night'
-    ]
+    weather_conditions = get_vocabulary("node_weather")
   
     @classmethod
     def INPUT_TYPES(cls):
@@ -17,7 +11,7 @@ class Isulion_WeatherGenerator:
             "required": {
                 "randomize": (["enable", "disable"],),
                 "seed": ("INT", {"default": 0, "min": 0, "max": 999999999}),
-                "weather": (cls.weather_conditions,)
+                "weather": (list(cls.weather_conditions),)
             }
         }
 
@@ -28,13 +22,10 @@ class Isulion_WeatherGenerator:
 
     def generate_weather(self, randomize, seed, weather):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 999999999)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "weather")
 
-            weather = random.choice(self.weather_conditions)
+            weather = rng.choice(self.weather_conditions, 0)
 
         return (f"{weather}", seed)
 
@@ -1,42 +1,21 @@
-import random
+from ..config.vocabulary import get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionAlienWorldGenerator:
-    atmospheres = [
-        "toxic", "breathable", "dense", "thin", "crystalline", "plasma",
-        "gaseous", "corrosive", "radioactive", "electromagnetic", "quantum",
-        "temporal", "bio-organic", "multi-phasic", "energy-based"
-    ]
-    
-    terrains = [
-        "crystalline desert", "floating islands", "metallic plains", "bio-luminescent jungle",
-        "liquid methane ocean", "plasma storms", "geometric mountains", "silicon forests",
-        "magnetic fields", "quantum crystals", "living metal", "energy vortexes",
-        "gravity wells", "temporal rifts", "phase-shifted landscapes", "void chasms",
-        "antimatter lakes", "fractal canyons", "morphic plains", "sentient coral"
-    ]
-    
-    colors = [
-        "purple", "emerald", "crimson", "azure", "golden", "silver",
-        "iridescent", "prismatic", "void-black", "plasma-blue", "quantum-white",
-        "temporal-green", "nebula-pink", "star-gold", "cosmic-violet"
-    ]
-    
-    features = [
-        "multiple moons", "binary suns", "ring system", "quantum anomalies", "temporal rifts",
-        "space elevator", "orbital habitats", "ancient megastructures", "artificial moons",
-        "plasma rivers", "crystal spires", "gravity anomalies", "bio-mechanical forests",
-        "energy storms", "dimensional portals", "living cities", "floating continents"
-    ]
+    atmospheres = get_vocabulary("node_alien_world.atmospheres")
+    terrains = get_vocabulary("node_alien_world.terrains")
+    colors = get_vocabulary("node_alien_world.colors")
+    features = get_vocabulary("node_alien_world.features")
 
     @classmethod
     def INPUT_TYPES(s):
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "atmosphere": (s.atmospheres,),
-                "terrain": (s.terrains,),
-                "color": (s.colors,),
-                "feature": (s.features,),
+                "atmosphere": (list(s.atmospheres),),
+                "terrain": (list(s.terrains),),
+                "color": (list(s.colors),),
+                "feature": (list(s.features),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
@@ -50,16 +29,13 @@ class IsulionAlienWorldGenerator:
 
     def generate(self, randomize, atmosphere, terrain, color, feature, seed=0):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "alien_world")
             
-            atmosphere = random.choice(self.atmospheres)
-            terrain = random.choice(self.terrains)
-            color = random.choice(self.colors)
-            feature = random.choice(self.features)
+            atmosphere = rng.choice(self.atmospheres, 0)
+            terrain = rng.choice(self.terrains, 1)
+            color = rng.choice(self.colors, 2)
+            feature = rng.choice(self.features, 3)
         
         world_desc = f"{color} world with {atmosphere} atmosphere, featuring {terrain} and {feature}"
         return (world_desc, seed) 
\ No newline at end of file
@@ -1,54 +1,19 @@
-import random
+from ..config.vocabulary import get_flat_vocabulary, get_vocabulary
+from ..counter_rng import CounterRNG, resolve_seed
 
 class IsulionSpacecraftGenerator:
-    ships = {
-        "military": [
-            "battlecruiser", "stealth frigate", "carrier", "destroyer",
-            "dreadnought", "assault ship", "combat vessel", "strike craft",
-            "war barge", "missile frigate", "plasma cruiser", "void hunter",
-            "quantum warship", "battle station", "star fortress"
-        ],
-        "civilian": [
-            "passenger liner", "cargo hauler", "mining vessel", "colony ship",
-            "space yacht", "trading vessel", "transport ship", "cruise liner",
-            "construction ship", "medical frigate", "research vessel", "supply ship",
-            "merchant vessel", "repair ship", "salvage craft"
-        ],
-        "exploration": [
-            "scout ship", "research vessel", "survey craft", "deep space probe",
-            "pathfinder ship", "expedition craft", "discovery vessel", "stellar explorer",
-            "cartographer ship", "science vessel", "observatory ship", "mapping drone",
-            "reconnaissance craft", "sensor platform", "probe carrier"
-        ],
-        "special": [
-            "dimensional ship", "time vessel", "living ship", "quantum craft",
-            "phase shifter", "void walker", "reality bender", "star seed",
-            "consciousness vessel", "dream ship", "infinity craft", "cosmic weaver",
-            "paradox jumper", "eternity vessel", "dimension breaker"
-        ]
-    }
+    ships = get_vocabulary("node_spacecraft")
 
-    prefixes = [
-        "advanced", "experimental", "prototype", "modified", "enhanced",
-        "next-gen", "cutting-edge", "state-of-the-art", "revolutionary",
-        "bleeding-edge", "innovative", "custom", "specialized", "elite", "premium"
-    ]
+    prefixes = get_vocabulary("node_spacecraft_prefixes")
 
-    features = [
-        "with energy shields", "with quantum drive", "with cloaking device",
-        "with AI core", "with plasma weapons", "with temporal stabilizers",
-        "with dimensional anchor", "with neural interface", "with antimatter core",
-        "with gravity manipulators", "with phase shifters", "with void engines",
-        "with reality distortion field", "with consciousness matrix", "with quantum computers"
-    ]
+    features = get_vocabulary("node_spacecraft_features")
 
     @classmethod
     def INPUT_TYPES(s):
-        all_ships = [ship for sublist in s.ships.values() for ship in sublist]
         return {
             "required": {
                 "randomize": (["enable", "disable"],),
-                "ship": (all_ships,),
+                "ship": (list(get_flat_vocabulary("node_spacecraft")),),
             },
             "optional": {
                 "seed": ("INT", {"default": 0, "min": 0, "max": 0xffffffffffffffff}),
@@ -63,18 +28,14 @@ class IsulionSpacecraftGenerator:
 
     def generate(self, randomize, ship, seed=0, ship_class="any"):
         if randomize == "enable":
-            if seed is not None and seed > 0:
-                random.seed(seed)
-            else:
-                seed = random.randint(0, 0xffffffffffffffff)
-                random.seed(seed)
+            seed = resolve_seed(seed)
+            rng = CounterRNG(seed, "spacecraft")
             
             if ship_class != "any" and ship_class in self.ships:
-                base_ship = random.choice(self.ships[ship_class])
+                base_ship = rng.choice(self.ships[ship_class], 0)
             else:
-                all_ships = [ship for sublist in self.ships.values() for ship in sublist]
-                base_ship = random.choice(all_ships)
+                base_ship = rng.choice(get_flat_vocabulary("node_spacecraft"), 0)
             
-            ship = f"{random.choice(self.prefixes)} {base_ship} {random.choice(self.features)}"
+            ship = f"{rng.choice(self.prefixes, 1)} {base_ship} {rng.choice(self.features, 2)}"
         
         return (ship, seed) 
\ No newline at end of file
@@ -49,7 +49,8 @@ class BaseThemeHandler(ABC):
                 self.debug_print(f"Selected {config_key}: {result} (from 0 options, using default)")
                 return result
             
-            result = random.choice(choices)
+            table = self.config.get_alias_table(config_key)
+            result = table.sample(random) if table else random.choice(choices)
             self.debug_print(f"Selected {config_key}: {result} (from {len(choices)} options)")
             return result
         except Exception as e:
@@ -60,7 +61,7 @@ class BaseThemeHandler(ABC):
         """Get a random choice from configuration list with a default value."""
         try:
             choices = self.config.get_config(config_key)
-            result = self.config.random.choice(choices) if choices else default_value
+            result = self.config.get_weighted_choice(config_key) if choices else default_value
             self.debug_print(f"Selected {config_key}: {result} (from {len(choices)} options)")
             return result
         except Exception as e:
@@ -1,18 +1,36 @@
-from typing import Dict
+from typing import Dict, Optional
 from .base_handler import BaseThemeHandler
+from ..configs.constraints import ConstraintSet, compatible_pairs
 import random
 
 class ChimeraAnimalsThemeHandler(BaseThemeHandler):
-    def _get_random_animal_from_category(self, category: str) -> str:
-        """Get a random animal from a specific category."""
-        animals = self.config.get_config(f"chimera_animals.categories.{category}")
-        return random.choice(animals) if animals else "lion"
+    def __init__(self, config_manager):
+        super().__init__(config_manager)
+        self.constraints = self._build_constraints()
 
-    def _get_different_category(self, exclude_category: str) -> str:
-        """Get a random category different from the given one."""
-        categories = list(self.config.get_config("chimera_animals.categories").keys())
-        available_categories = [cat for cat in categories if cat != exclude_category]
-        return random.choice(available_categories) if available_categories else "big_cats"
+    def _build_constraints(self) -> Optional[ConstraintSet]:
+        """Compile the head/body slots and the config's constraint rules into bitsets."""
+        try:
+            categories = self.config.get_config("chimera_animals.categories")
+        except KeyError:
+            return None
+        if not categories:
+            return None
+        try:
+            rules = self.config.get_config("chimera_animals.constraints")
+        except KeyError:
+            rules = []
+
+        animals = [animal for members in categories.values() for animal in members]
+        return ConstraintSet(
+            {"head_category": list(categories), "body_category": list(categories),
+             "head": animals, "body": animals},
+            [
+                {"slots": ["head_category", "head"], "compatible": compatible_pairs(categories)},
+                {"slots": ["body_category", "body"], "compatible": compatible_pairs(categories)},
+                *rules,
+            ]
+        )
 
     def generate(self, custom_subject: str = "",
                 custom_location: str = "",
@@ -22,31 +40,21 @@ class ChimeraAnimalsThemeHandler(BaseThemeHandler):
         """Generate chimera animals-themed components."""
         components = {}
         
-        # Initialize variables for head and body selection
-        head = None
-        body = None
-
-        if custom_subject:
-            # Use custom subject as the head
-            head = custom_subject
-            # For custom subjects, randomly select a category for the body
-            # that's different from mythical
-            body_category = self._get_different_category("mythical")
-            body = self._get_random_animal_from_category(body_category)
+        if self.constraints is None:
+            # Fallback if categories are not found
+            head = custom_subject or "lion"
+            body = "eagle"
         else:
-            # Select two different random categories
-            all_categories = list(self.config.get_config("chimera_animals.categories").keys())
-            if not all_categories:
-                # Fallback if categories are not found
-                head = "lion"
-                body = "eagle"
-            else:
-                head_category = random.choice(all_categories)
-                body_category = self._get_different_category(head_category)
-                
-                # Get random animals from each category
-                head = self._get_random_animal_from_category(head_category)
-                body = self._get_random_animal_from_category(body_category)
+            # Custom subjects are drawn as mythical heads, so the body comes
+            # from another category
+            assigned = {"head_category": "mythical", "head": custom_subject} if custom_subject else {}
+            animals = self.constraints.sample(
+                ["body_category", "body"] if custom_subject
+                else ["head_category", "body_category", "head", "body"],
+                assigned, random
+            )
+            head = animals["head"]
+            body = animals["body"]
 
         # Create the chimera description
         components["subject"] = (
@@ -23,11 +23,11 @@ class LogoThemeHandler(BaseThemeHandler):
         """Generate logo-themed components."""
         components = {}
         
-        # Determine logo style approach with adjusted weights
-        style_approach = random.choices(
-            ["classic", "3D", "character", "artistic"],
-            weights=[0.6, 0.2, 0.05, 0.15]
-        )[0]
+        # Determine logo style approach, weighted in logo_config.json
+        try:
+            style_approach = self.config.get_weighted_choice("logo.style_approaches", random)
+        except KeyError:
+            style_approach = "classic"
         
         # Use custom subject if provided
         logo_text = custom_subject.strip() if custom_subject else "ISULION"
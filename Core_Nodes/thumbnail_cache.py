@@ -0,0 +1,83 @@
+import hashlib
+import os
+import threading
+from typing import Optional
+
+import numpy as np
+
+from .cache_utils import get_cache_dir, get_cache_limit_bytes, prune_directory, touch
+
+
+class ThumbnailCache:
+    """
+    On-disk cache of resized images stored as uint8 ``.npy`` arrays.
+
+    Entries are keyed on the source path, file size, modification time and the
+    target row height, so any edit to the source file produces a new key. Hits
+    are returned as read-only memory-mapped arrays; the cache is bounded by
+    ``ISULION_THUMBNAIL_CACHE_MB`` (default 1024) with least recently used
+    eviction.
+    """
+
+    SUFFIX = ".npy"
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or get_cache_dir("thumbnails")
+        self.max_bytes = max_bytes or get_cache_limit_bytes("ISULION_THUMBNAIL_CACHE_MB", 1024)
+        self._size = None
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(path: str, size: int, mtime_ns: int, target_row_height: int) -> str:
+        raw = f"{os.path.abspath(path)}|{size}|{mtime_ns}|{target_row_height}"
+        return hashlib.sha1(raw.encode("utf-8")).hexdigest()
+
+    def _entry_path(self, key: str) -> str:
+        # Two-level fan-out keeps directory listings short for large caches
+        return os.path.join(self.cache_dir, key[:2], key + self.SUFFIX)
+
+    def get(self, key: str) -> Optional[np.ndarray]:
+        """Return the cached array memory-mapped, or None on a miss."""
+        entry_path = self._entry_path(key)
+        try:
+            array = np.load(entry_path, mmap_mode="r")
+        except (OSError, ValueError):
+            return None
+        touch(entry_path)
+        return array
+
+    def put(self, key: str, array: np.ndarray):
+        """Store a uint8 array and evict old entries if the cache is over budget."""
+        entry_path = self._entry_path(key)
+        os.makedirs(os.path.dirname(entry_path), exist_ok=True)
+
+        # Write to a temporary file first so readers never see partial arrays
+        tmp_path = f"{entry_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                np.save(f, np.ascontiguousarray(array, dtype=np.uint8))
+            os.replace(tmp_path, entry_path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = prune_directory(self.cache_dir, self.max_bytes, self.SUFFIX)
+            else:
+                self._size += os.path.getsize(entry_path)
+            if self._size > self.max_bytes:
+                # Prune below the limit so eviction is not triggered on every put
+                self._size = prune_directory(self.cache_dir, int(self.max_bytes * 0.9), self.SUFFIX)
+
+
+_default_cache = None
+
+
+def get_thumbnail_cache() -> ThumbnailCache:
+    """Return the process-wide thumbnail cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = ThumbnailCache()
+    return _default_cache
@@ -0,0 +1,170 @@
+import hashlib
+import os
+import threading
+from typing import Optional, Tuple
+
+import numpy as np
+
+from . import http_client
+from .cache_utils import get_cache_dir, get_cache_limit_bytes, prune_directory, touch
+
+# Values of the ``cache_mode`` input of the URL image nodes
+CACHE_MODES = ["enable", "disable", "offline"]
+
+
+class OfflineCacheMiss(Exception):
+    """Raised in offline mode when a URL is not in the cache."""
+
+
+class UrlImageCache:
+    """
+    Content-addressed on-disk cache of downloaded images.
+
+    A small index file maps each URL to the SHA-256 of its content, and the
+    content itself is stored once per hash, so URLs serving the same file share
+    one blob. Resized variants are stored next to the blob as uint8 ``.npy``
+    arrays per target size. The cache is bounded by
+    ``ISULION_URL_IMAGE_CACHE_MB`` (default 2048) with least recently used
+    eviction.
+    """
+
+    def __init__(self, cache_dir: Optional[str] = None, max_bytes: Optional[int] = None):
+        self.cache_dir = cache_dir or get_cache_dir("url_images")
+        self.max_bytes = max_bytes or get_cache_limit_bytes("ISULION_URL_IMAGE_CACHE_MB", 2048)
+        self._size = None
+        self._lock = threading.Lock()
+
+    def _path(self, kind: str, name: str, suffix: str) -> str:
+        # Two-level fan-out keeps directory listings short for large caches
+        return os.path.join(self.cache_dir, kind, name[:2], name + suffix)
+
+    def _index_path(self, url: str) -> str:
+        return self._path("urls", hashlib.sha1(url.encode("utf-8")).hexdigest(), ".txt")
+
+    def _blob_path(self, content_hash: str) -> str:
+        return self._path("blobs", content_hash, ".bin")
+
+    def _variant_path(self, content_hash: str, target_size: int) -> str:
+        return self._path("variants", f"{content_hash}_{target_size}", ".npy")
+
+    def lookup(self, url: str) -> Optional[Tuple[str, str]]:
+        """Return the content hash and content type recorded for a URL."""
+        index_path = self._index_path(url)
+        try:
+            with open(index_path, "r", encoding="utf-8") as f:
+                content_hash, content_type = f.read().split("\n", 1)
+        except (OSError, ValueError):
+            return None
+        touch(index_path)
+        return content_hash, content_type
+
+    def get_bytes(self, url: str) -> Optional[Tuple[bytes, str]]:
+        """Return the cached content and content type of a URL, or None on a miss."""
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        content_hash, content_type = entry
+        blob_path = self._blob_path(content_hash)
+        try:
+            with open(blob_path, "rb") as f:
+                content = f.read()
+        except OSError:
+            return None
+        touch(blob_path)
+        return content, content_type
+
+    def put_bytes(self, url: str, content: bytes, content_type: str) -> str:
+        """Store downloaded content for a URL and return its content hash."""
+        content_hash = hashlib.sha256(content).hexdigest()
+        blob_path = self._blob_path(content_hash)
+        if os.path.exists(blob_path):
+            touch(blob_path)
+        else:
+            self._write(blob_path, content)
+        self._write(self._index_path(url), f"{content_hash}\n{content_type}".encode("utf-8"))
+        return content_hash
+
+    def get_variant(self, url: str, target_size: int) -> Optional[np.ndarray]:
+        """Return the cached resized variant of a URL's image, or None on a miss."""
+        entry = self.lookup(url)
+        if entry is None:
+            return None
+        variant_path = self._variant_path(entry[0], target_size)
+        try:
+            array = np.load(variant_path)
+        except (OSError, ValueError):
+            return None
+        touch(variant_path)
+        return array
+
+    def put_variant(self, url: str, target_size: int, array: np.ndarray):
+        """Store a resized variant of an image already cached for ``url``."""
+        entry = self.lookup(url)
+        if entry is None:
+            return
+        variant_path = self._variant_path(entry[0], target_size)
+        buffer = np.ascontiguousarray(array, dtype=np.uint8)
+        self._write(variant_path, lambda f: np.save(f, buffer))
+
+    def _write(self, path: str, content):
+        """Atomically write bytes (or call a writer function) and enforce the size budget."""
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Write to a temporary file first so readers never see partial files
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp_path, "wb") as f:
+                if callable(content):
+                    content(f)
+                else:
+                    f.write(content)
+            os.replace(tmp_path, path)
+        except OSError:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = prune_directory(self.cache_dir, self.max_bytes)
+            else:
+                self._size += os.path.getsize(path)
+            if self._size > self.max_bytes:
+                # Prune below the limit so eviction is not triggered on every write
+                self._size = prune_directory(self.cache_dir, int(self.max_bytes * 0.9))
+
+
+_default_cache = None
+
+
+def get_url_image_cache() -> UrlImageCache:
+    """Return the process-wide URL image cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = UrlImageCache()
+    return _default_cache
+
+
+def load_url_bytes(url: str, cache_mode: str = "enable") -> Tuple[bytes, str]:
+    """
+    Return the content and content type of an image URL.
+
+    :param url: Image URL
+    :param cache_mode: "enable" to read and fill the cache, "disable" to always
+        download, "offline" to serve only from the cache
+    :return: Tuple of (content bytes, lower-cased content type)
+    :raises OfflineCacheMiss: In offline mode when the URL is not cached
+    :raises http_client.ContentRejected: For non-image or oversized content
+    :raises requests.RequestException: When the download fails
+    """
+    cache = get_url_image_cache() if cache_mode != "disable" else None
+    if cache is not None:
+        cached = cache.get_bytes(url)
+        if cached is not None:
+            return cached
+        if cache_mode == "offline":
+            raise OfflineCacheMiss(f"Image not in cache: {url}")
+
+    content, content_type = http_client.download_image_bytes(url)
+    if cache is not None and content:
+        cache.put_bytes(url, content, content_type)
+    return content, content_type
@@ -10,6 +10,7 @@ __description__ = "Advanced prompt generation nodes for ComfyUI with multiple th
 # Import all node classes
 from .Core_Nodes.mega_prompt_V3 import IsulionMegaPromptV3
 from .Core_Nodes.mega_prompt_all_themes import IsulionMultiplePromptGenerator
+from .Core_Nodes.prompt_dedup import IsulionPromptDedup
 from .Core_Nodes.isucollage_node import IsuCollageNode
 from .Core_Nodes.load_images_node import IsulionLoadImagesNode
 from .Core_Nodes.shutdown_node import NODE_CLASS_MAPPINGS as SHUTDOWN_NODES
@@ -27,6 +28,7 @@ from .Core_Nodes.scene_nodes.isulion_time_of_day_generator import Isulion_TimeOf
 from .Core_Nodes.scene_nodes.isulion_art_style_generator import Isulion_ArtStyleGenerator
 from .Core_Nodes.scene_nodes.isulion_action_generator import IsulionActionGenerator
 from .Core_Nodes.scene_nodes.isulion_scene_composition import IsulionSceneComposition
+from .Core_Nodes.scene_nodes.isulion_scene_bundle import IsulionSceneBundle
 
 from .Core_Nodes.character_nodes.isulion_profession_generator import IsulionProfessionGenerator
 from .Core_Nodes.character_nodes.isulion_fantasy_race_generator import IsulionFantasyRaceGenerator
@@ -64,6 +66,7 @@ NODE_CLASS_MAPPINGS = {
     "IsulionArtStyleGenerator": Isulion_ArtStyleGenerator,
     "IsulionActionGenerator": IsulionActionGenerator,
     "IsulionSceneComposition": IsulionSceneComposition,
+    "IsulionSceneBundle": IsulionSceneBundle,
     "IsulionProfessionGenerator": IsulionProfessionGenerator,
     "IsulionFantasyRaceGenerator": IsulionFantasyRaceGenerator,
     "IsulionClothingGenerator": IsulionClothingGenerator,
@@ -82,6 +85,7 @@ NODE_CLASS_MAPPINGS = {
     "IsulionCivitaiImageDisplay": IsulionCivitaiImageDisplay,
     "IsulionMegaPromptV3": IsulionMegaPromptV3,
     "IsulionMultiplePromptGenerator": IsulionMultiplePromptGenerator,
+    "IsulionPromptDedup": IsulionPromptDedup,
     "IsuCollage_Node": IsuCollageNode,
     "IsulionLoadImagesNode": IsulionLoadImagesNode,
     "IsulionEpochGenerator": IsulionEpochGenerator,
@@ -96,6 +100,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "IsulionPromptGenerator": "🎨 Isulion Prompt Generator",
     "MegaPromptV3": "🚀 Isulion Mega Prompt V3",
     "IsulionMultiplePromptGenerator": "🔄 Isulion Multiple Prompt Generator",
+    "IsulionPromptDedup": "🧹 Isulion Prompt Dedup",
     "IsulionAnimalRandom": "🦁 Isulion Animal Selector",
     "IsulionCuteAnimalRandom": "🐰 Isulion Cute Animal Selector",
     "IsulionAnimalBehaviorGenerator": "🦊 Isulion Animal Behavior Generator",
@@ -105,6 +110,7 @@ NODE_DISPLAY_NAME_MAPPINGS = {
     "IsulionArtStyleGenerator": "🖼️ Isulion Art Style Generator",
     "IsulionActionGenerator": "⚡ Isulion Action Generator",
     "IsulionSceneComposition": "🎬 Isulion Scene Composition",
+    "IsulionSceneBundle": "🧩 Isulion Scene Bundle",
     "IsulionProfessionGenerator": "👨‍💼 Isulion Profession Generator",
     "IsulionFantasyRaceGenerator": "🧝‍♂️ Isulion Fantasy Race Generator",
     "IsulionClothingGenerator": "👔 Isulion Clothing Generator",
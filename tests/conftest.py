@@ -0,0 +1,58 @@
+"""Shared test helpers.
+
+Core_Nodes is imported as a standalone package (``isulion_core``) so its
+``__init__``, which registers every node and needs ComfyUI, is never run.
+"""
+
+import importlib
+import importlib.util
+import os
+import sys
+import types
+
+import pytest
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+CORE_NODES = os.path.join(REPO_ROOT, "Core_Nodes")
+STUB_SERVER = os.path.join(CORE_NODES, "civitai_nodes", "stub", "server.py")
+
+
+def import_core(name: str) -> types.ModuleType:
+    """Import ``Core_Nodes.<name>`` without running the package ``__init__``."""
+    if "isulion_core" not in sys.modules:
+        package = types.ModuleType("isulion_core")
+        package.__path__ = [CORE_NODES]
+        sys.modules["isulion_core"] = package
+    return importlib.import_module(f"isulion_core.{name}")
+
+
+def load_stub_server() -> types.ModuleType:
+    """Load the stdlib-only Civitai stub server module."""
+    module = sys.modules.get("civitai_stub_server")
+    if module is None:
+        spec = importlib.util.spec_from_file_location("civitai_stub_server", STUB_SERVER)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules["civitai_stub_server"] = module
+        spec.loader.exec_module(module)
+    return module
+
+
+@pytest.fixture
+def stub_server(monkeypatch):
+    """A running Civitai stub the nodes are pointed at."""
+    with load_stub_server().StubServer() as server:
+        monkeypatch.setenv("CIVITAI_API_BASE", server.api_base)
+        yield server
+
+
+@pytest.fixture
+def response_cache(tmp_path, monkeypatch):
+    """A fresh Civitai response cache in a temporary directory."""
+    pytest.importorskip("requests")
+    civitai_cache = import_core("civitai_nodes.civitai_cache")
+    cache = civitai_cache.CivitaiResponseCache(str(tmp_path / "responses.sqlite3"))
+    monkeypatch.setattr(civitai_cache, "_default_cache", cache)
+    yield cache
+    # Let background refreshes finish before the next test swaps the cache
+    for future in list(civitai_cache._in_flight.values()):
+        future.result()
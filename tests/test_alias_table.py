@@ -0,0 +1,106 @@
+"""Vose alias tables and weighted config lists."""
+
+import random
+from collections import Counter
+
+import pytest
+
+from conftest import import_core
+
+alias_table = import_core("configs.alias_table")
+AliasTable = alias_table.AliasTable
+
+DRAWS = 200_000
+
+
+def frequencies(samples):
+    counts = Counter(samples)
+    return {value: count / len(samples) for value, count in counts.items()}
+
+
+def test_skewed_weights_within_tolerance():
+    table = AliasTable(["common", "rare", "very rare", "usual"], [70, 2, 0.5, 27.5])
+    rng = random.Random(1)
+
+    observed = frequencies([table.sample(rng) for _ in range(DRAWS)])
+
+    expected = {"common": 0.70, "rare": 0.02, "very rare": 0.005, "usual": 0.275}
+    for value, probability in expected.items():
+        assert observed[value] == pytest.approx(probability, abs=0.005)
+
+
+def test_batch_sampling_matches_weights():
+    table = AliasTable(["classic", "3D", "character", "artistic"], [0.6, 0.2, 0.05, 0.15])
+
+    observed = frequencies(table.sample_batch(DRAWS, seed=7))
+
+    assert observed["classic"] == pytest.approx(0.6, abs=0.005)
+    assert observed["3D"] == pytest.approx(0.2, abs=0.005)
+    assert observed["character"] == pytest.approx(0.05, abs=0.005)
+    assert observed["artistic"] == pytest.approx(0.15, abs=0.005)
+    assert table.sample_batch(100, seed=3) == table.sample_batch(100, seed=3)
+
+
+def test_zero_weight_is_never_drawn():
+    table = AliasTable(["a", "never", "b"], [1, 0, 3])
+    rng = random.Random(2)
+
+    assert "never" not in {table.sample(rng) for _ in range(20_000)}
+    assert "never" not in set(table.sample_batch(20_000, seed=2))
+
+
+def test_single_entry_is_always_drawn():
+    table = AliasTable(["only"], [0.3])
+
+    assert len(table) == 1
+    assert {table.sample(random.Random(i)) for i in range(100)} == {"only"}
+    assert table.index(0.0) == 0
+    assert table.index(0.999999) == 0
+
+
+def test_equal_weights_need_no_aliases():
+    table = AliasTable(list("abcd"), [2, 2, 2, 2])
+
+    assert table.probabilities == (1.0, 1.0, 1.0, 1.0)
+    assert [table.index(u) for u in (0.0, 0.3, 0.6, 0.9)] == [0, 1, 2, 3]
+
+
+@pytest.mark.parametrize("values, weights", [
+    (["a", "b"], [0, 0]),
+    (["a", "b"], [1, -1]),
+    (["a", "b"], [1]),
+    ([], []),
+])
+def test_invalid_weights(values, weights):
+    with pytest.raises(ValueError):
+        AliasTable(values, weights)
+
+
+def test_compile_weighted_lists_replaces_values_in_place():
+    config = {
+        "logo": {
+            "style_approaches": [{"value": "classic", "weight": 3}, "3D"],
+            "styles": ["flat", "minimal"],
+        }
+    }
+
+    tables = alias_table.compile_weighted_lists(config)
+
+    assert config["logo"]["style_approaches"] == ["classic", "3D"]
+    assert config["logo"]["styles"] == ["flat", "minimal"]
+    assert list(tables) == ["logo.style_approaches"]
+    assert tables["logo.style_approaches"].values == ("classic", "3D")
+    assert tables["logo.style_approaches"].probabilities == (1.0, 0.5)
+
+
+def test_config_manager_draws_logo_styles_with_config_weights():
+    config = import_core("configs.config_manager").ConfigManager()
+    rng = random.Random(5)
+
+    observed = frequencies([config.get_weighted_choice("logo.style_approaches", rng) for _ in range(50_000)])
+
+    assert config.get_config("logo.style_approaches") == ["classic", "3D", "character", "artistic"]
+    assert observed["classic"] == pytest.approx(0.6, abs=0.01)
+    assert observed["character"] == pytest.approx(0.05, abs=0.01)
+    with pytest.raises(KeyError):
+        config.get_weighted_choice("logo.missing", rng)
@@ -0,0 +1,62 @@
+"""Era consistency of the character designer, single and batched."""
+
+import random
+import re
+
+import pytest
+
+from conftest import import_core
+
+designer = import_core("theme_handlers.character_designer_handler")
+
+WEARING = re.compile(r"\(\(wearing (.+?) style (.+?)\)\), \(\(detailed (.+?)\)\)")
+PALETTE = re.compile(r"\(\(beautiful (.+?) color palette\)\)")
+
+
+@pytest.fixture
+def handler():
+    config = import_core("configs.config_manager").ConfigManager()
+    return designer.CharacterDesignerThemeHandler(config)
+
+
+def assert_era_consistent(components):
+    era, outfit, accessory = WEARING.search(components["subject"]).groups()
+    profile = designer.get_era_profile(era)
+    assert outfit in profile.outfits
+    assert accessory in profile.accessories
+    assert any(f"((detailed {setting}))" in components["environment"] for setting in profile.settings)
+    assert PALETTE.search(components["style"]).group(1) in profile.color_palettes
+
+
+def test_generate_is_era_consistent(handler):
+    random.seed(4)
+    for _ in range(200):
+        assert_era_consistent(handler.generate())
+
+
+def test_batch_is_era_consistent(handler):
+    random.seed(4)
+    batch = handler.generate_batch(500)
+
+    assert len(batch) == 500
+    for components in batch:
+        assert_era_consistent(components)
+    # The batch spreads over the eras
+    assert len({WEARING.search(c["subject"]).group(1) for c in batch}) > len(designer.HISTORICAL_PERIODS) // 2
+
+
+def test_batch_is_seeded_by_the_random_module(handler):
+    random.seed(9)
+    first = handler.generate_batch(20)
+    random.seed(9)
+    assert handler.generate_batch(20) == first
+
+
+def test_batch_options(handler):
+    batch = handler.generate_batch(5, custom_subject="a tailor", custom_location="the old market",
+                                   include_style="no", include_effects="no")
+
+    assert all(c["subject"].startswith("((masterful portrait)) of a tailor as a") for c in batch)
+    assert all("((detailed the old market))" in c["environment"] for c in batch)
+    assert all(set(c) == {"subject", "environment", "negative"} for c in batch)
+    assert handler.generate_batch(0) == []
@@ -0,0 +1,134 @@
+"""Civitai response cache tests against the local stub server."""
+
+import time
+
+import pytest
+
+from conftest import import_core
+
+pytest.importorskip("requests")
+
+PARAMS = {"limit": 5, "sort": "Most Downloaded", "types": None}
+
+
+@pytest.fixture
+def civitai_cache(response_cache):
+    return import_core("civitai_nodes.civitai_cache")
+
+
+def models_url(server):
+    return f"{server.api_base}/models"
+
+
+def wait_for_background(civitai_cache):
+    for future in list(civitai_cache._in_flight.values()):
+        future.result()
+
+
+def age_entry(cache, civitai_cache, url, seconds, api_key=None):
+    key = civitai_cache.make_key(url, civitai_cache.normalize_params(PARAMS), api_key)
+    with cache._lock:
+        cache._conn.execute("UPDATE responses SET fetched_at = fetched_at - ? WHERE key = ?", (seconds, key))
+    return key
+
+
+def test_cold_then_warm_hit(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+
+    cold = civitai_cache.fetch_json(url, params=PARAMS)
+    warm = civitai_cache.fetch_json(url, params=dict(PARAMS))
+
+    assert len(cold["items"]) == 5
+    assert warm == cold
+    assert stub_server.stats()["models"] == 1
+
+
+def test_cache_key_depends_on_params_and_token(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+
+    civitai_cache.fetch_json(url, params=PARAMS, api_key="first")
+    civitai_cache.fetch_json(url, params=PARAMS, api_key="second")
+    civitai_cache.fetch_json(url, params=dict(PARAMS, limit=6), api_key="first")
+    civitai_cache.fetch_json(url, params=PARAMS, api_key="first")
+
+    assert stub_server.stats()["models"] == 3
+
+
+def test_expired_entry_is_revalidated_with_etag(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+    first = civitai_cache.fetch_json(url, params=PARAMS)
+    key = age_entry(response_cache, civitai_cache, url, 3600)
+    before = response_cache.get(key).fetched_at
+
+    second = civitai_cache.fetch_json(url, params=PARAMS, stale_while_revalidate=False)
+
+    assert second == first
+    assert stub_server.stats()["models"] == 2
+    assert stub_server.stats()["not_modified"] == 1
+    # The 304 made the entry fresh again
+    assert response_cache.get(key).fetched_at > before + 3000
+    civitai_cache.fetch_json(url, params=PARAMS)
+    assert stub_server.stats()["models"] == 2
+
+
+def test_stale_entry_is_served_then_refreshed(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+    first = civitai_cache.fetch_json(url, params=PARAMS)
+    key = age_entry(response_cache, civitai_cache, url, 3600)
+    stub_server.config.latency = 0.2
+
+    start = time.monotonic()
+    stale = civitai_cache.fetch_json(url, params=PARAMS)
+    elapsed = time.monotonic() - start
+    wait_for_background(civitai_cache)
+
+    assert stale == first
+    assert elapsed < 0.2, "the stale entry should not wait for the API"
+    assert stub_server.stats()["not_modified"] == 1
+    assert time.time() - response_cache.get(key).fetched_at < 60
+
+
+def test_entry_past_stale_window_is_fetched_synchronously(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+    civitai_cache.fetch_json(url, params=PARAMS)
+    age_entry(response_cache, civitai_cache, url, civitai_cache.STALE_WINDOW + 7200)
+    stub_server.reset_stats()
+
+    civitai_cache.fetch_json(url, params=PARAMS)
+
+    assert stub_server.stats() == {"api": 1, "models": 1, "not_modified": 1}
+    assert civitai_cache._in_flight == {}
+
+
+def test_changed_response_replaces_entry(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+    first = civitai_cache.fetch_json(url, params=PARAMS)
+    key = age_entry(response_cache, civitai_cache, url, 3600)
+    removed = first["items"][0]["id"]
+    stub_server.config.models = [item for item in stub_server.config.models if item["id"] != removed]
+
+    updated = civitai_cache.fetch_json(url, params=PARAMS, stale_while_revalidate=False)
+
+    assert stub_server.stats().get("not_modified", 0) == 0
+    assert removed not in [item["id"] for item in updated["items"]]
+    assert response_cache.get(key).data == updated
+
+
+def test_prefetch_warms_the_cache(stub_server, response_cache, civitai_cache):
+    url = models_url(stub_server)
+
+    civitai_cache.prefetch(url, params=PARAMS).result()
+    civitai_cache.fetch_json(url, params=PARAMS)
+
+    assert stub_server.stats()["models"] == 1
+    assert civitai_cache.prefetch(url, params=PARAMS) is None
+
+
+def test_lru_eviction_keeps_recent_entries(tmp_path, civitai_cache):
+    cache = civitai_cache.CivitaiResponseCache(str(tmp_path / "small.sqlite3"), max_bytes=1000)
+    for i in range(10):
+        cache.put(f"key{i}", "models", {"payload": "x" * 200})
+        time.sleep(0.001)
+
+    assert cache.get("key0") is None
+    assert cache.get("key9") is not None
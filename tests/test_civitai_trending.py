@@ -0,0 +1,50 @@
+"""Trending pagination against the local Civitai stub."""
+
+import pytest
+
+from conftest import import_core, load_stub_server
+
+pytest.importorskip("requests")
+
+
+def fetch_trending(number_of_images, prefetch="disable"):
+    civitai_trending = import_core("civitai_nodes.civitai_trending")
+    node = civitai_trending.IsulionCivitaiTrending()
+    return node.get_trending("Hide NSFW", "Most Reactions", "Day", number_of_images,
+                             api_key="test-token", model="All", prefetch=prefetch)
+
+
+def expected_limits(server, calls, number_of_images):
+    """Limits sized to the images still missing before each page."""
+    sort = load_stub_server().IMAGE_SORTS["Most Reactions"]
+    items = sorted(server.config.images, key=sort)
+    collected = 0
+    limits = []
+    for _, query in calls:
+        limits.append(min(number_of_images - collected, 200))
+        offset = int(query.get("cursor", 0))
+        page = items[offset:offset + int(query["limit"])]
+        collected += sum(item["type"] != "video" for item in page)
+    return limits
+
+
+@pytest.mark.parametrize("prefetch", ["disable", "enable"])
+def test_follow_up_pages_ask_for_missing_images(stub_server, response_cache, prefetch):
+    image_infos, records = fetch_trending(12, prefetch)
+
+    calls = stub_server.api_calls("/api/v1/images")
+    limits = [int(query["limit"]) for _, query in calls]
+    assert len(records) == 12
+    assert len(image_infos) == 12
+    assert len(calls) > 1, "the fixture's videos should force a follow-up page"
+    assert limits[0] == 12
+    assert all(limit < 12 for limit in limits[1:])
+    assert limits == expected_limits(stub_server, calls, 12)
+
+
+def test_prefetch_shares_the_follow_up_request(stub_server, response_cache):
+    fetch_trending(12, "enable")
+    # Every prefetch used the params of the fetch that followed it, so each page
+    # reached the server once
+    calls = stub_server.api_calls("/api/v1/images")
+    assert len(calls) == len({tuple(sorted(query.items())) for _, query in calls})
@@ -0,0 +1,118 @@
+"""Bitset slot constraints and their use by the chimera handler."""
+
+import random
+import re
+
+import pytest
+
+from conftest import import_core
+
+constraints = import_core("configs.constraints")
+ConstraintSet = constraints.ConstraintSet
+
+SLOTS = {
+    "climate": ["arctic", "desert", "jungle"],
+    "animal": ["polar bear", "camel", "jaguar", "fox"],
+    "color": ["white", "sand", "spotted", "red"],
+}
+
+
+@pytest.fixture
+def rules():
+    return ConstraintSet(SLOTS, [
+        {"slots": ["climate", "animal"],
+         "compatible": [["arctic", "polar bear"], ["desert", "camel"], ["jungle", "jaguar"],
+                        ["arctic", "fox"], ["desert", "fox"]]},
+        {"slots": ["animal", "color"], "incompatible": [["polar bear", "sand"], ["camel", "white"]]},
+    ])
+
+
+def test_compatible_pairs_restrict_both_directions(rules):
+    assert rules.candidates("animal", {"climate": "arctic"}) == ("polar bear", "fox")
+    assert rules.candidates("animal", {"climate": "jungle"}) == ("jaguar",)
+    assert rules.candidates("climate", {"animal": "fox"}) == ("arctic", "desert")
+
+
+def test_incompatible_pairs_are_excluded(rules):
+    assert rules.candidates("color", {"animal": "polar bear"}) == ("white", "spotted", "red")
+    assert rules.candidates("animal", {"color": "white"}) == ("polar bear", "jaguar", "fox")
+
+
+def test_masks_combine_assigned_slots(rules):
+    assert rules.candidates("animal", {"climate": "desert", "color": "white"}) == ("fox",)
+
+
+def test_unknown_assigned_values_add_no_constraint(rules):
+    assert rules.candidates("animal", {"climate": "custom tundra"}) == tuple(SLOTS["animal"])
+
+
+def test_distinct_slots():
+    pair = ConstraintSet({"head": ["lion", "eagle", "wolf"], "body": ["eagle", "lion", "bear"]},
+                         [{"slots": ["head", "body"], "distinct": True}])
+
+    assert pair.candidates("body", {"head": "lion"}) == ("eagle", "bear")
+    assert pair.candidates("head", {"body": "bear"}) == ("lion", "eagle", "wolf")
+
+
+def test_unsatisfiable_slot_falls_back_to_domain():
+    pair = ConstraintSet({"a": ["x"], "b": ["x"]}, [{"slots": ["a", "b"], "distinct": True}])
+
+    assert pair.candidates("b", {"a": "x"}) == ("x",)
+
+
+def test_sample_respects_every_rule(rules):
+    rng = random.Random(3)
+    for _ in range(500):
+        drawn = rules.sample(["climate", "animal", "color"], rng=rng)
+        assert drawn["animal"] in rules.candidates("animal", {"climate": drawn["climate"]})
+        assert (drawn["animal"], drawn["color"]) not in {("polar bear", "sand"), ("camel", "white")}
+
+
+def test_sample_keeps_fixed_values(rules):
+    drawn = rules.sample(["animal"], {"climate": "jungle"}, random.Random(1))
+
+    assert drawn == {"climate": "jungle", "animal": "jaguar"}
+
+
+@pytest.mark.parametrize("rule", [
+    {"slots": ["climate"], "distinct": True},
+    {"slots": ["climate", "mood"], "distinct": True},
+    {"slots": ["climate", "animal"], "compatible": [["arctic", "penguin"]]},
+    {"slots": ["climate", "animal"], "incompatible": [["tundra", "fox"]]},
+])
+def test_malformed_rules_raise(rule):
+    with pytest.raises(constraints.ConstraintError):
+        ConstraintSet(SLOTS, [rule])
+
+
+def test_chimera_heads_and_bodies_come_from_distinct_categories():
+    config = import_core("configs.config_manager").ConfigManager()
+    chimera = import_core("theme_handlers.chimera_animals_handler").ChimeraAnimalsThemeHandler(config)
+    categories = config.get_config("chimera_animals.categories")
+    category_of = {}
+    for category, members in categories.items():
+        for animal in members:
+            category_of.setdefault(animal, set()).add(category)
+
+    rng = random.Random(8)
+    for _ in range(1000):
+        drawn = chimera.constraints.sample(["head_category", "body_category", "head", "body"], rng=rng)
+        assert drawn["head_category"] != drawn["body_category"]
+        assert drawn["head"] != drawn["body"]
+        assert drawn["head_category"] in category_of[drawn["head"]]
+        assert drawn["body_category"] in category_of[drawn["body"]]
+
+
+def test_chimera_prompt_never_repeats_the_animal():
+    config = import_core("configs.config_manager").ConfigManager()
+    chimera = import_core("theme_handlers.chimera_animals_handler").ChimeraAnimalsThemeHandler(config)
+    pattern = re.compile(r"\(\(the head of an? (.+?)\)\) and \(\(the body of an? (.+?)\)\)")
+
+    random.seed(12)
+    for _ in range(300):
+        head, body = pattern.search(chimera.generate()["subject"]).groups()
+        assert head != body
+
+    head, body = pattern.search(chimera.generate(custom_subject="griffin")["subject"]).groups()
+    assert head == "griffin"
+    assert body != "griffin"
@@ -0,0 +1,118 @@
+"""Determinism of the counter-based RNG and of the batch sampling built on it."""
+
+import random
+
+import pytest
+
+from conftest import import_core
+
+counter_rng = import_core("counter_rng")
+sampling = import_core("sampling")
+
+COLORS = ["red", "green", "blue", "yellow", "purple"]
+
+
+def test_splitmix64_reference_values():
+    # Published SplitMix64 outputs for states 0 and 1234567
+    assert counter_rng.splitmix64(0) == 0xE220A8397B1DCDAF
+    assert counter_rng.splitmix64(1234567) == 6457827717110365317
+    assert counter_rng.splitmix64(1234567 + counter_rng.GOLDEN_GAMMA) == 3203168211198807973
+
+
+def test_pinned_draws():
+    rng = counter_rng.CounterRNG(42, "animal")
+
+    assert [rng.bits(i) for i in range(3)] == [
+        13180738013840777310, 17799279056171410040, 12919600649389519784,
+    ]
+    assert [rng.randbelow(100, i) for i in range(5)] == [71, 96, 70, 84, 96]
+    assert counter_rng.CounterRNG(7, "collage").shuffled(list(range(8))) == [1, 6, 4, 0, 5, 2, 3, 7]
+
+
+def test_pinned_batches():
+    assert sampling.sample_items(COLORS, 7, 42, family="color") == [
+        "blue", "blue", "purple", "green", "green", "blue", "blue",
+    ]
+    assert sampling.sample_items(COLORS, 7, 42, "without replacement", "color") == [
+        "blue", "red", "purple", "yellow", "green", "blue", "red",
+    ]
+
+
+def test_draws_do_not_depend_on_order_or_instance():
+    forward = counter_rng.CounterRNG(123, "weather")
+    values = [forward.random(i) for i in range(50)]
+
+    backward = counter_rng.CounterRNG(123, "weather")
+    assert [backward.random(i) for i in reversed(range(50))] == values[::-1]
+    assert all(0.0 <= value < 1.0 for value in values)
+
+
+def test_seed_and_family_separate_streams():
+    draws = lambda seed, family: [counter_rng.CounterRNG(seed, family).bits(i) for i in range(8)]
+
+    assert draws(1, "epoch") != draws(2, "epoch")
+    assert draws(1, "epoch") != draws(1, "clothing")
+    assert draws(1, "epoch") == draws(1, "epoch")
+
+
+def test_global_random_state_is_untouched():
+    state = random.getstate()
+    sampling.sample_items(COLORS, 20, 5, "without replacement", "color")
+    counter_rng.CounterRNG(5).shuffled(COLORS)
+    assert random.getstate() == state
+
+
+@pytest.mark.parametrize("mode", sampling.SAMPLING_MODES)
+def test_batch_prefix_is_stable(mode):
+    full = sampling.sample_items(COLORS, 12, 99, mode, "color")
+
+    for count in range(1, 12):
+        assert sampling.sample_items(COLORS, count, 99, mode, "color") == full[:count]
+
+
+def test_batch_draws_equal_single_draws():
+    rng = counter_rng.CounterRNG(99, "color")
+    batch = sampling.sample_items(COLORS, 20, 99, family="color")
+
+    assert batch == [rng.choice(COLORS, i) for i in range(20)]
+
+
+def test_without_replacement_uses_every_item_per_round():
+    batch = sampling.sample_items(COLORS, 15, 3, "without replacement", "color")
+
+    for start in range(0, 15, len(COLORS)):
+        assert sorted(batch[start:start + len(COLORS)]) == sorted(COLORS)
+
+
+def test_sample_is_distinct_and_bounded():
+    rng = counter_rng.CounterRNG(11)
+
+    assert len(set(rng.sample(range(10), 10))) == 10
+    assert rng.sample(COLORS, 3, index=4) == counter_rng.CounterRNG(11).sample(COLORS, 3, index=4)
+    with pytest.raises(ValueError):
+        rng.sample(COLORS, 6)
+
+
+def test_empty_requests():
+    assert sampling.sample_items([], 3, 1) == []
+    assert sampling.sample_items(COLORS, 0, 1) == []
+
+
+def test_generator_node_is_deterministic():
+    epoch_node = import_core("character_nodes.isulion_epoch_generator").IsulionEpochGenerator()
+
+    first, seed = epoch_node.generate("enable", "", seed=1234, count=6)
+    again, _ = epoch_node.generate("enable", "", seed=1234, count=3)
+
+    assert seed == 1234
+    assert again == first[:3]
+    assert first == sampling.sample_items(epoch_node.epochs, 6, 1234, family="epoch")
+
+
+def test_resolve_seed_keeps_set_seeds_and_draws_in_one_range():
+    assert counter_rng.resolve_seed(42) == 42
+
+    random.seed(0)
+    fresh = [counter_rng.resolve_seed(seed) for seed in (0, None) * 100]
+    assert all(1 <= seed <= counter_rng.RANDOM_SEED_MAX for seed in fresh)
+
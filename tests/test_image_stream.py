@@ -0,0 +1,94 @@
+"""Image stream and collage tests (need torch, numpy and Pillow, as in ComfyUI)."""
+
+import importlib
+import os
+import sys
+import types
+
+import pytest
+
+torch = pytest.importorskip("torch")
+np = pytest.importorskip("numpy")
+Image = pytest.importorskip("PIL.Image")
+
+CORE_NODES = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "Core_Nodes")
+
+
+@pytest.fixture(scope="module")
+def modules():
+    # Load Core_Nodes modules without its __init__ (which pulls in the network nodes),
+    # outside ComfyUI where folder_paths is not importable
+    sys.modules.setdefault("folder_paths", types.ModuleType("folder_paths"))
+    package = types.ModuleType("isulion_core")
+    package.__path__ = [CORE_NODES]
+    sys.modules.setdefault("isulion_core", package)
+    return (
+        importlib.import_module("isulion_core.load_images_node"),
+        importlib.import_module("isulion_core.isucollage_node"),
+    )
+
+
+@pytest.fixture
+def image_dir(tmp_path):
+    sizes = [(64, 48), (32, 64), (80, 40), (50, 50), (40, 70)]
+    for i, (width, height) in enumerate(sizes):
+        color = (i * 40, 255 - i * 40, 128)
+        Image.new("RGB", (width, height), color).save(tmp_path / f"img_{i}.png")
+    return str(tmp_path)
+
+
+def make_stream(load_images_node, directory, **kwargs):
+    options = dict(target_row_height=100, chunk_size=2, use_cache=False)
+    options.update(kwargs)
+    return load_images_node.ImageStream(directory, **options)
+
+
+def test_stream_yields_every_chunk(modules, image_dir):
+    load_images_node, _ = modules
+    stream = make_stream(load_images_node, image_dir)
+
+    chunks = list(stream)
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+    assert len(stream) == 5
+    images = [image for chunk in chunks for image in chunk]
+    assert [tuple(image.shape[:2]) for image in images] == stream.shapes()
+
+
+def test_stream_precision_only_affects_stream(modules, image_dir):
+    load_images_node, _ = modules
+    node = load_images_node.IsulionLoadImagesNode()
+
+    images, stream = node.load_images(image_dir, target_row_height=100, chunk_size=2,
+                                      precision="uint8", cache="disable")
+
+    assert len(images) == 5
+    assert all(image.dtype == torch.float32 for image in images)
+    assert all(image.dtype == torch.uint8 for chunk in stream for image in chunk)
+
+
+def test_streaming_preview_holds_first_chunk(modules, image_dir):
+    load_images_node, _ = modules
+    node = load_images_node.IsulionLoadImagesNode()
+
+    images, stream = node.load_images(image_dir, target_row_height=100, streaming="enable",
+                                      chunk_size=2, cache="disable")
+
+    assert len(images) == 2
+    assert len(stream) == 5
+
+
+@pytest.mark.parametrize("precision", ["float32", "float16", "uint8"])
+def test_collage_from_stream_matches_image_list(modules, image_dir, precision):
+    load_images_node, isucollage_node = modules
+    collage = isucollage_node.IsuCollageNode()
+    images = [image for chunk in make_stream(load_images_node, image_dir) for image in chunk]
+
+    (expected,) = collage.create_collage(images, seed=7)
+    (streamed,) = collage.create_collage(
+        seed=7, image_stream=make_stream(load_images_node, image_dir, precision=precision)
+    )
+
+    assert streamed.shape == expected.shape
+    assert streamed.dtype == torch.float32
+    assert torch.allclose(streamed, expected, atol=1e-2)
@@ -0,0 +1,74 @@
+"""Emphasis parsing and cross-component tag deduplication."""
+
+import pytest
+
+from conftest import import_core
+
+prompt_compaction = import_core("prompt_compaction")
+
+
+@pytest.mark.parametrize("fragment, key, weight", [
+    ("tag", "tag", 1.0),
+    ("(tag)", "tag", 1.1),
+    ("((tag))", "tag", 1.21),
+    ("((((tag))))", "tag", 1.46),
+    ("(tag:1.3)", "tag", 1.3),
+    ("((tag:1.2))", "tag", 1.32),
+    ("  (( Golden  Hour )) ", "golden hour", 1.21),
+    ("(a) and (b)", "(a) and (b)", 1.0),
+    ("\\(x\\)", "\\(x\\)", 1.0),
+])
+def test_parse_fragment(fragment, key, weight):
+    parsed = prompt_compaction.parse_fragment(fragment)
+
+    assert parsed.key == key
+    assert parsed.weight == weight
+
+
+@pytest.mark.parametrize("fragment, compact", [
+    ("((((tag))))", "(tag:1.46)"),
+    ("(tag:1.1)", "(tag)"),
+    ("(tag:1.21)", "((tag))"),
+    ("((tag))", "((tag))"),
+    ("(tag:1.3)", "(tag:1.3)"),
+    ("(tag:1.0)", "tag"),
+    ("tag", "tag"),
+])
+def test_format_fragment_writes_shortest_form(fragment, compact):
+    parsed = prompt_compaction.parse_fragment(fragment)
+
+    assert prompt_compaction.format_fragment(parsed.text, parsed.weight) == compact
+    # The compact form parses back to the same weight
+    assert prompt_compaction.parse_fragment(compact).weight == parsed.weight
+
+
+def test_duplicates_across_components_keep_first_position_and_strongest_weight():
+    compacted, saved = prompt_compaction.compact_components([
+        "a cat, ((professional quality))",
+        "forest, professional quality, (a cat:1.3)",
+        "",
+    ])
+
+    assert compacted == ["(a cat:1.3), ((professional quality))", "forest", ""]
+    assert saved > 0
+
+
+def test_duplicates_within_a_component():
+    compacted, _ = prompt_compaction.compact_components(["Sunset, sunset, ((sunset)), sky"])
+
+    assert compacted == ["((Sunset)), sky"]
+
+
+def test_nothing_to_compact():
+    components = ["a cat", "in a forest", "oil painting"]
+
+    assert prompt_compaction.compact_components(components) == (components, 0)
+
+
+def test_compact_prompt_reports_saved_tokens():
+    prompt = "((((tag)))), other, (tag)"
+    compacted, saved = prompt_compaction.compact_prompt(prompt)
+
+    assert compacted == "(tag:1.46), other"
+    assert saved == prompt_compaction.count_tokens(prompt) - prompt_compaction.count_tokens(compacted)
+    assert saved > 0
@@ -0,0 +1,88 @@
+"""MinHash/LSH near-duplicate detection for prompt batches."""
+
+import pytest
+
+from conftest import import_core
+
+prompt_dedup = import_core("prompt_dedup")
+
+SUBJECTS = ["cat", "dragon", "robot", "castle", "ship", "forest", "knight", "city", "owl", "tower"]
+
+
+def base_prompt(i):
+    return ", ".join(f"{SUBJECTS[i % 10]} detail {i}-{j}" for j in range(10))
+
+
+def test_tag_set_ignores_emphasis_case_and_order():
+    assert prompt_dedup.tag_set("((A Cat)), forest, (sunset:1.3)") == \
+        prompt_dedup.tag_set("sunset, a cat, Forest")
+
+
+def test_jaccard():
+    first = frozenset("abcd")
+
+    assert prompt_dedup.jaccard(first, frozenset("abce")) == pytest.approx(3 / 5)
+    assert prompt_dedup.jaccard(frozenset(), frozenset()) == 1.0
+    assert prompt_dedup.jaccard(first, frozenset()) == 0.0
+
+
+def test_minhash_estimates_similarity():
+    tags = frozenset(f"tag {i}" for i in range(40))
+    similar = frozenset(list(tags)[:36]) | {f"other {i}" for i in range(4)}
+
+    first = prompt_dedup.minhash(tags)
+    second = prompt_dedup.minhash(similar)
+    estimate = sum(a == b for a, b in zip(first, second)) / prompt_dedup.NUM_PERMUTATIONS
+
+    assert first == prompt_dedup.minhash(frozenset(tags))
+    assert estimate == pytest.approx(prompt_dedup.jaccard(tags, similar), abs=0.2)
+
+
+@pytest.mark.parametrize("threshold", [0.5, 0.8, 0.95])
+def test_choose_bands_meets_recall(threshold):
+    bands, rows = prompt_dedup.choose_bands(threshold)
+
+    assert bands * rows == prompt_dedup.NUM_PERMUTATIONS
+    assert 1 - (1 - threshold ** rows) ** bands >= prompt_dedup.MIN_RECALL
+
+
+def test_near_duplicates_point_to_first_kept_prompt():
+    prompts = [
+        "a cat, forest, sunset, oil painting, ((masterpiece))",
+        "a dragon, mountains, night sky, watercolor",
+        "Forest, (a cat), oil painting, masterpiece, SUNSET",
+        "a cat, forest, sunset, oil painting, masterpiece, soft light",
+    ]
+
+    assert prompt_dedup.find_near_duplicates(prompts, 0.8) == [None, None, 0, 0]
+    assert prompt_dedup.dedup_prompts(prompts, 0.8) == [0, 1]
+    # Stricter threshold: only the exact tag set is a duplicate
+    assert prompt_dedup.dedup_prompts(prompts, 1.0) == [0, 1, 3]
+
+
+def test_large_batch_catches_every_near_duplicate():
+    originals = [base_prompt(i) for i in range(300)]
+    # One tag of ten replaced: Jaccard 9/11, above a 0.8 threshold
+    variants = [prompt.rsplit(", ", 1)[0] + ", variant tag" for prompt in originals]
+
+    result = prompt_dedup.find_near_duplicates(originals + variants, 0.8)
+
+    assert result[:300] == [None] * 300
+    assert result[300:] == list(range(300))
+
+
+def test_dedup_node_drop_and_flag():
+    node = prompt_dedup.IsulionPromptDedup()
+    prompts = ["a cat, forest", "forest, (a cat)", "a dragon, sky"]
+
+    kept, names, flags, duplicates = node.dedup(prompts, [0.8], ["drop"], ["one", "two"])
+    assert kept == ["a cat, forest", "a dragon, sky"]
+    assert names == ["one", "2"]
+    assert flags == [False, False]
+    assert duplicates == 1
+
+    kept, names, flags, duplicates = node.dedup(prompts, [0.8], ["flag"])
+    assert kept == prompts
+    assert names == ["0", "1", "2"]
+    assert flags == [False, True, False]
+    assert duplicates == 1
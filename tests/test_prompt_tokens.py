@@ -0,0 +1,87 @@
+"""CLIP token counting, its offline fallback and token-budget trimming."""
+
+import pytest
+
+from conftest import import_core
+
+prompt_tokens = import_core("prompt_tokens")
+
+
+@pytest.fixture
+def fresh_tokenizer(monkeypatch, tmp_path):
+    """Forget the loaded tokenizer and look for merges only in ``tmp_path``."""
+    monkeypatch.setattr(prompt_tokens, "_tokenizer", None)
+    monkeypatch.setattr(prompt_tokens, "_tokenizer_loaded", False)
+    monkeypatch.setenv(prompt_tokens.TOKENIZER_DIR_ENV, str(tmp_path))
+    # No ComfyUI install to find comfy/sd1_tokenizer in
+    monkeypatch.setattr(prompt_tokens.importlib.util, "find_spec", lambda name: None)
+    prompt_tokens.count_tokens.cache_clear()
+    yield tmp_path
+    prompt_tokens.count_tokens.cache_clear()
+
+
+def test_missing_merges_fall_back_to_heuristic(fresh_tokenizer):
+    assert prompt_tokens.find_tokenizer_file() is None
+    assert prompt_tokens.get_tokenizer() is None
+
+    text = "a majestic lighthouse, 8k"
+    assert prompt_tokens.count_tokens(text) == prompt_tokens.heuristic_count(text)
+    # Long words count as several tokens, digits and punctuation one each
+    assert prompt_tokens.heuristic_count("cat") == 1
+    assert prompt_tokens.heuristic_count("extraordinarily") == 3
+    assert prompt_tokens.heuristic_count("8k, x") == 4
+
+
+def test_merges_file_is_used_when_present(fresh_tokenizer):
+    (fresh_tokenizer / "merges.txt").write_text("#version: 0.2\nc a\nca t</w>\n", encoding="utf-8")
+
+    assert prompt_tokens.find_tokenizer_file() == str(fresh_tokenizer / "merges.txt")
+    assert prompt_tokens.count_tokens("cat") == 1
+    # "dog" has no merges and stays one token per character
+    assert prompt_tokens.count_tokens("cat dog") == 4
+
+
+def test_bpe_applies_merges_by_rank():
+    bpe = prompt_tokens.ClipBPE([("l", "o"), ("lo", "w</w>"), ("o", "w</w>")])
+
+    assert bpe.count("low") == 1
+    assert bpe.count("ow") == 1
+    assert bpe.count("low low, ow") == 4
+
+
+def test_weighting_syntax_is_not_counted(fresh_tokenizer):
+    assert prompt_tokens.count_tokens("((tag))") == prompt_tokens.count_tokens("tag")
+    assert prompt_tokens.count_tokens("(tag:1.3)") == prompt_tokens.count_tokens("tag")
+    assert prompt_tokens.count_tokens("") == 0
+
+
+def test_split_fragments_keeps_groups_whole():
+    assert prompt_tokens.split_fragments("a, (b, c), [d, e],, f \\, g") == [
+        "a", "(b, c)", "[d, e]", "f \\", "g",
+    ]
+
+
+def test_fit_to_budget_drops_quality_tags_then_least_important(fresh_tokenizer):
+    components = ["a cat, masterpiece", "in a dark forest, sunlight", "oil painting, 8k"]
+
+    full, full_count = prompt_tokens.fit_to_budget(components, 0)
+    assert full == "a cat, masterpiece, in a dark forest, sunlight, oil painting, 8k"
+
+    # The quality tag of the least important component goes first
+    trimmed, count = prompt_tokens.fit_to_budget(components, full_count - 1)
+    assert trimmed == "a cat, masterpiece, in a dark forest, sunlight, oil painting"
+
+    trimmed, count = prompt_tokens.fit_to_budget(components, full_count - 6)
+    assert trimmed == "a cat, in a dark forest, sunlight, oil painting"
+    assert count == full_count - 6
+
+    trimmed, count = prompt_tokens.fit_to_budget(components, 8)
+    assert trimmed == "a cat, in a dark forest"
+    assert count <= 8
+
+
+def test_fit_to_budget_keeps_first_fragment(fresh_tokenizer):
+    prompt, count = prompt_tokens.fit_to_budget(["a very long subject description", "forest"], 1)
+
+    assert prompt == "a very long subject description"
+    assert count > 1
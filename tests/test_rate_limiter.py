@@ -0,0 +1,130 @@
+"""Token bucket and Retry-After pause tests on a fake clock."""
+
+import pytest
+
+from conftest import import_core
+
+rate_limiter = import_core("rate_limiter")
+
+
+class FakeClock:
+    """Stands in for the time module: time only moves through ``advance``.
+
+    ``sleep`` records the requested waits without moving the clock, so
+    consecutive ``acquire`` calls behave like callers arriving together.
+    """
+
+    def __init__(self):
+        self.now = 100.0
+        self.sleeps = []
+        self.on_sleep = None
+
+    def monotonic(self):
+        return self.now
+
+    def sleep(self, seconds):
+        self.sleeps.append(seconds)
+        if self.on_sleep is not None:
+            hook, self.on_sleep = self.on_sleep, None
+            hook()
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = FakeClock()
+    monkeypatch.setattr(rate_limiter, "time", clock)
+    return clock
+
+
+def test_burst_then_sustained_rate(clock):
+    bucket = rate_limiter.TokenBucket(rate=4, capacity=3)
+
+    waits = [bucket.acquire() for _ in range(6)]
+
+    assert waits == pytest.approx([0, 0, 0, 0.25, 0.5, 0.75])
+
+
+def test_tokens_refill_up_to_capacity(clock):
+    bucket = rate_limiter.TokenBucket(rate=2, capacity=2)
+    for _ in range(2):
+        bucket.acquire()
+
+    clock.advance(10)
+
+    assert [bucket.acquire() for _ in range(3)] == pytest.approx([0, 0, 0.5])
+
+
+def test_pause_releases_waiters_at_refill_rate(clock):
+    bucket = rate_limiter.TokenBucket(rate=5, capacity=10)
+    bucket.pause(2.0)
+
+    waits = [bucket.acquire() for _ in range(4)]
+
+    # One token at the end of the pause, then one every 1/rate seconds
+    assert waits == pytest.approx([2.0, 2.2, 2.4, 2.6])
+
+
+def test_pause_does_not_refill_the_bucket(clock):
+    bucket = rate_limiter.TokenBucket(rate=5, capacity=10)
+    bucket.pause(2.0)
+    clock.advance(1.0)
+
+    assert [bucket.acquire() for _ in range(2)] == pytest.approx([1.0, 1.2])
+
+
+def test_shorter_pause_keeps_the_longer_one(clock):
+    bucket = rate_limiter.TokenBucket(rate=5, capacity=10)
+    bucket.pause(3.0)
+    bucket.pause(1.0)
+
+    assert bucket.acquire() == pytest.approx(3.0)
+    assert bucket.stats()["throttled"] == 2
+
+
+def test_sleeping_waiter_queues_again_behind_pause(clock):
+    bucket = rate_limiter.TokenBucket(rate=1, capacity=1)
+    bucket.acquire()
+    # A 429 arrives while the next caller sleeps on its reservation
+    clock.on_sleep = lambda: bucket.pause(5.0)
+
+    waited = bucket.acquire()
+
+    assert clock.sleeps == pytest.approx([1.0, 5.0])
+    assert waited == pytest.approx(6.0)
+
+
+def test_stats_count_each_request_once(clock):
+    bucket = rate_limiter.TokenBucket(rate=1, capacity=1)
+    bucket.acquire()
+    clock.on_sleep = lambda: bucket.pause(5.0)
+    bucket.acquire()
+
+    stats = bucket.stats()
+    assert stats["requests"] == 2
+    assert stats["delayed"] == 1
+    assert stats["max_wait"] == pytest.approx(6.0)
+    assert stats["mean_wait"] == pytest.approx(3.0)
+
+
+def test_buckets_are_shared_per_host_and_token(clock):
+    limiter = rate_limiter.RateLimiter(rate=1, capacity=1)
+
+    same = limiter.bucket("https://civitai.com/api/v1/models", "token")
+    assert limiter.bucket("https://CIVITAI.com/api/v1/images", "token") is same
+    assert limiter.bucket("https://civitai.com/api/v1/models", "other") is not same
+    assert limiter.bucket("https://example.com/", "token") is not same
+
+
+def test_pause_only_affects_its_bucket(clock):
+    limiter = rate_limiter.RateLimiter(rate=1, capacity=1)
+    limiter.pause("https://civitai.com/api/v1/images", "token", 30.0)
+
+    assert limiter.acquire("https://civitai.com/api/v1/images", "other") == 0
+    assert limiter.acquire("https://civitai.com/api/v1/images", "token") == pytest.approx(30.0)
+    assert set(limiter.stats()) == {
+        "civitai.com#" + limiter.make_key("", "token")[1],
+        "civitai.com#" + limiter.make_key("", "other")[1],
+    }